@@ -0,0 +1,358 @@
+"""
+Microbenchmarks for every TODO list operation across list sizes.
+
+Each of `add_item`, `remove_item`, `edit_item`, `checkoff_item` and `render_todo_list` is run
+against TODO lists of each size. Because the TODO list is persistent, every sample is applied to
+the same starting list, so each one measures a single operation on a list of exactly that size.
+The commands are driven through their normal prompts, with `input()` answering with the ID of a
+randomly chosen item (and with nothing when asked for a priority or a due date), and anything they
+print goes to `os.devnull`.
+
+For every operation and size this reports the throughput, the 50th, 90th and 99th percentile
+latencies and the peak memory allocated by a single call (measured in a separate run under
+`tracemalloc`, so that tracing doesn't slow down the timed runs).
+
+The results can be saved as a JSON baseline and later runs compared against it:
+
+    python -m benchmarks.bench_operations --save benchmarks/baseline.json
+    python -m benchmarks.bench_operations --compare benchmarks/baseline.json
+
+When comparing, the exit code is 1 if any operation's median latency got slower than the baseline
+by more than the tolerance.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from contextlib import redirect_stdout
+
+from json import dump
+from json import load
+
+from os import devnull
+
+from platform import python_version
+
+from random import Random
+
+from statistics import quantiles
+
+from sys import argv
+from sys import exit as close_program
+
+from time import perf_counter_ns
+
+from tracemalloc import get_traced_memory
+from tracemalloc import start as start_tracing
+from tracemalloc import stop as stop_tracing
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+from types import NoneType
+
+from unittest.mock import patch
+
+# Local Imports
+from src.item import Item
+from src.main import add_item
+from src.main import checkoff_item
+from src.main import edit_item
+from src.main import remove_item
+from src.main import render_todo_list
+from src.pvector import PVector
+
+
+SIZES: Tuple[int, ...] = (10, 10 ** 3, 10 ** 5, 10 ** 6)
+
+# Rendering prints every item, so it gets fewer samples on big lists to keep the run bounded.
+RENDER_ITEM_BUDGET: int = 2 * 10 ** 5
+
+# The commands being measured. Each is called with the TODO list and nothing else.
+OPERATIONS: Dict[str, Callable] = {
+    "add_item": add_item,
+    "remove_item": remove_item,
+    "edit_item": edit_item,
+    "checkoff_item": checkoff_item,
+    "render_todo_list": render_todo_list,
+}
+
+
+class Result(NamedTuple):
+    """
+    The measurements for one operation on one size of TODO list. Latencies are in nanoseconds.
+    """
+
+    operation: str
+    size: int
+    samples: int
+    throughput: float
+    p50: float
+    p90: float
+    p99: float
+    peak_bytes: int
+
+
+def build_list(size: int) -> PVector[Item]:
+    """
+    Build a TODO list of `size` items with IDs 0 to `size - 1`.
+    """
+    return PVector(map(
+        lambda number: Item(f"Title {number}", f"Description {number}", number % 2 == 0, number),
+        range(size)
+    ))
+
+
+def _timings(
+            operation: Callable,
+            todo_list: PVector[Item],
+            answers: List[str]
+        ) -> List[int]:
+    """
+    Time one call of the operation per answer, answering every prompt in that call with it, except
+    for the priority and due date prompts, which are answered with nothing.
+
+    `input()` is patched once around all the calls, so the patching isn't part of the timings.
+    """
+
+    answer: List[str] = [""]
+
+    def timed(this_answer: str) -> int:
+        answer[0] = this_answer
+        started: int = perf_counter_ns()
+        operation(todo_list)
+        return perf_counter_ns() - started
+
+    # Priorities and due dates are left empty: an item ID isn't a valid date to answer them with.
+    with patch(
+        target="builtins.input",
+        new=lambda text="": "" if "priority" in text or "due date" in text else answer[0]
+    ):
+        return list(map(timed, answers))
+
+
+def _peak_bytes(operation: Callable, todo_list: PVector[Item], answer: str) -> int:
+    start_tracing()
+
+    try:
+        _timings(operation, todo_list, [answer])
+        return get_traced_memory()[1]
+    finally:
+        stop_tracing()
+
+
+def measure(name: str, todo_list: PVector[Item], samples: int, seed: int = 0) -> Result:
+    """
+    Measure one operation on a TODO list built by `build_list()`.
+
+    :param name: The name of the operation, one of `OPERATIONS`.
+    :type name: str
+
+    :param todo_list: The TODO list to run the operation on.
+    :type todo_list: PVector[Item]
+
+    :param samples: How many times to run the operation.
+    :type samples: int
+
+    :param seed: The seed for picking which items are operated on.
+    :type seed: int = 0
+
+    :returns: The measurements.
+    :rtype: Result
+    """
+
+    size: int = len(todo_list)
+    picker: Random = Random(seed)
+    runs: int = max(1, min(samples, RENDER_ITEM_BUDGET // max(size, 1))) if (
+        name == "render_todo_list"
+    ) else samples
+    answers: List[str] = [str(picker.randrange(max(size, 1))) for _ in range(runs)]
+
+    with open(devnull, "w", encoding="utf-8") as sink, redirect_stdout(sink):
+        timings: List[int] = _timings(OPERATIONS[name], todo_list, answers)
+        peak: int = _peak_bytes(OPERATIONS[name], todo_list, answers[0])
+
+    cuts: List[float] = quantiles(timings, n=100, method="inclusive") if runs > 1 else timings * 99
+
+    return Result(
+        operation=name,
+        size=size,
+        samples=runs,
+        throughput=runs / (sum(timings) / 1e9),
+        p50=cuts[49],
+        p90=cuts[89],
+        p99=cuts[98],
+        peak_bytes=peak
+    )
+
+
+def run(
+            sizes: Tuple[int, ...] = SIZES,
+            samples: int = 200,
+            operations: Tuple[str, ...] = tuple(OPERATIONS)
+        ) -> List[Result]:
+    """
+    Measure every operation on every size of TODO list.
+
+    :param sizes: The sizes of TODO list to measure.
+    :type sizes: Tuple[int, ...] = SIZES
+
+    :param samples: How many times to run each operation on each size.
+    :type samples: int = 200
+
+    :param operations: The names of the operations to measure.
+    :type operations: Tuple[str, ...] = tuple(OPERATIONS)
+
+    :returns: The measurements, by size and then by operation.
+    :rtype: List[Result]
+    """
+    return [
+        measure(name=name, todo_list=todo_list, samples=samples)
+        for todo_list in map(build_list, sizes)
+        for name in operations
+    ]
+
+
+def regressions(
+            results: List[Result],
+            baseline: List[Result],
+            tolerance: float
+        ) -> List[Tuple[Result, Result]]:
+    """
+    Find the results whose median latency is more than `tolerance` slower than the baseline.
+
+    :param results: The new measurements.
+    :type results: List[Result]
+
+    :param baseline: The measurements to compare against.
+    :type baseline: List[Result]
+
+    :param tolerance: How much slower is allowed, as a fraction, for example 0.25 for 25%.
+    :type tolerance: float
+
+    :returns: Each regressed result alongside its baseline.
+    :rtype: List[Tuple[Result, Result]]
+    """
+
+    by_key: Dict[Tuple[str, int], Result] = {
+        (result.operation, result.size): result for result in baseline
+    }
+
+    return [
+        (result, by_key[(result.operation, result.size)])
+        for result in results
+        if (result.operation, result.size) in by_key
+        and result.p50 > by_key[(result.operation, result.size)].p50 * (1 + tolerance)
+    ]
+
+
+def save(results: List[Result], path: str) -> NoneType:
+    """
+    Save results as a JSON baseline.
+    """
+    with open(path, "w", encoding="utf-8") as baseline:
+        dump({
+            "python": python_version(),
+            "results": [result._asdict() for result in results]
+        }, baseline, indent=4)
+
+
+def load_baseline(path: str) -> List[Result]:
+    """
+    Load results saved by `save()`.
+    """
+    with open(path, encoding="utf-8") as baseline:
+        return [Result(**result) for result in load(baseline)["results"]]
+
+
+def report(results: List[Result]) -> NoneType:
+    """
+    Print results as a table.
+    """
+
+    print(f"{'operation':<18}{'size':>9}{'ops/s':>13}{'p50 us':>11}{'p90 us':>11}{'p99 us':>11}"
+        + f"{'peak KiB':>11}")
+
+    any(map(
+        lambda result: print(
+            f"{result.operation:<18}{result.size:>9}{result.throughput:>13.1f}"
+            + f"{result.p50 / 1e3:>11.1f}{result.p90 / 1e3:>11.1f}{result.p99 / 1e3:>11.1f}"
+            + f"{result.peak_bytes / 1024:>11.1f}"
+        ),
+        results
+    ))
+
+
+def _parse_arguments(arguments: List[str]) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(
+        prog="bench_operations", description="Benchmark the TODO list operations."
+    )
+
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--operations", nargs="+", choices=tuple(OPERATIONS), default=None)
+    parser.add_argument("--save", metavar="PATH", help="Save the results as a JSON baseline.")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a JSON baseline.")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25,
+        help="How much slower the median may get before it counts as a regression."
+    )
+
+    return parser.parse_args(arguments)
+
+
+def main(arguments: List[str]) -> int:
+    """
+    Run the benchmarks from the command line.
+
+    :param arguments: The command line arguments, not including the program name.
+    :type arguments: List[str]
+
+    :returns: 1 if a regression was found against the baseline, otherwise 0.
+    :rtype: int
+    """
+
+    options: Namespace = _parse_arguments(arguments=arguments)
+    results: List[Result] = run(
+        sizes=tuple(options.sizes),
+        samples=options.samples,
+        operations=tuple(options.operations or OPERATIONS)
+    )
+
+    report(results=results)
+
+    if options.save is not None:
+        save(results=results, path=options.save)
+
+    slower: List[Tuple[Result, Result]] = (
+        [] if options.compare is None
+        else regressions(results, load_baseline(options.compare), options.tolerance)
+    )
+
+    any(map(
+        lambda pair: print(
+            f"REGRESSION {pair[0].operation} at {pair[0].size} items: p50"
+            + f" {pair[1].p50 / 1e3:.1f}us -> {pair[0].p50 / 1e3:.1f}us"
+        ),
+        slower
+    ))
+
+    return 1 if slower else 0
+
+
+if __name__ == "__main__": # pragma: no cover
+    close_program(main(arguments=argv[1:]))
@@ -0,0 +1,308 @@
+"""
+End-to-end throughput of the interactive menu, replaying recorded or made-up sessions.
+
+A trace is one JSON line per pass of the menu holding the answers typed into it (see
+`src/trace.py`). Record one from a real session with `--record-trace`, or make one up from a mix
+of commands, such as 80% `add_item` and 20% `checkoff_item`, picking items at random:
+
+    python -m src.main --record-trace session.jsonl
+    python -m benchmarks.bench_replay --trace session.jsonl --size 1000000
+    python -m benchmarks.bench_replay --mix add_item=80 checkoff_item=20 --passes 10000
+
+Each pass is fed through `_main_step()`, exactly as the menu runs it - viewport, command dispatch,
+undo history, search index and all - with `input()` answering from the trace and the output going
+to `os.devnull`, so no terminal is needed. The TODO list starts with `--size` items built by
+`build_list()` in `benchmarks/bench_operations.py`.
+
+For each command this reports how many passes ran it, passes per second and the 50th, 90th and
+99th percentile and worst latencies of a whole pass, followed by the same for every pass together.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from contextlib import redirect_stdout
+
+from json import dumps
+
+from os import devnull
+
+from random import Random
+
+from statistics import quantiles
+
+from sys import argv
+from sys import exit as close_program
+
+from time import perf_counter_ns
+
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+from types import NoneType
+
+from unittest.mock import patch
+
+# Local Imports
+from benchmarks.bench_operations import build_list
+from src.history import History
+from src.main import _DISPATCH_TABLE
+from src.main import _main_step
+from src.schedule import ScheduleIndex
+from src.search import SearchIndex
+from src.trace import read_trace
+
+
+# What each command can be made up with: the answers to its prompts, given a random number
+# generator and one more than the highest ID that might be in the TODO list.
+ANSWERS: Dict[str, Callable[[Random, int], List[str]]] = {
+    "add_item": lambda picker, ids: [
+        f"Title {ids}", f"Description {ids}", str(picker.randint(1, 5)), ""
+    ],
+    "checkoff_item": lambda picker, ids: [str(picker.randrange(ids))],
+    "uncheck_item": lambda picker, ids: [str(picker.randrange(ids))],
+    "edit_item": lambda picker, ids: [str(picker.randrange(ids)), "Edited", "Edited description"],
+    "remove_item": lambda picker, ids: [str(picker.randrange(ids))],
+    "schedule_item": lambda picker, ids: [
+        str(picker.randrange(ids)), str(picker.randint(1, 5)), f"2026-{picker.randint(1, 12):02}-01"
+    ],
+    "next_up": lambda picker, ids: [],
+    "overdue_items": lambda picker, ids: [],
+    "search_items": lambda picker, ids: [f"Title {picker.randrange(ids)}"],
+    "undo": lambda picker, ids: [],
+    "redo": lambda picker, ids: [],
+}
+
+
+class Result(NamedTuple):
+    """
+    The measurements for the passes that ran one command. Latencies are in nanoseconds.
+    """
+
+    command: str
+    passes: int
+    throughput: float
+    p50: float
+    p90: float
+    p99: float
+    worst: float
+
+
+def parse_mix(weights: Iterable[str]) -> Dict[str, float]:
+    """
+    Read a mix of commands written as `COMMAND=WEIGHT`, for example `add_item=80`.
+
+    :raises: ValueError when a command can't be made up or a weight isn't a number.
+    """
+
+    mix: Dict[str, float] = dict(map(
+        lambda weight: (weight.partition("=")[0], float(weight.partition("=")[2])), weights
+    ))
+    unknown: List[str] = [command for command in mix if command not in ANSWERS]
+
+    if unknown:
+        raise ValueError(f"Can't make up {unknown[0]}, only {', '.join(ANSWERS)}.")
+
+    return mix
+
+
+def synthetic(
+            mix: Dict[str, float],
+            passes: int,
+            size: int,
+            seed: int = 0
+        ) -> Iterator[List[str]]:
+    """
+    Make up a trace of `passes` passes, choosing each command at random by its weight in `mix`.
+
+    Items are picked by ID at random from the ones the TODO list could hold, which is the `size`
+    it started with plus one for every item added so far.
+
+    :param mix: The weight of each command, by name.
+    :type mix: Dict[str, float]
+
+    :param passes: How many passes to make up.
+    :type passes: int
+
+    :param size: How many items the TODO list starts with, with IDs 0 to `size - 1`.
+    :type size: int
+
+    :param seed: The seed for choosing commands and items.
+    :type seed: int = 0
+
+    :returns: The answers for each pass.
+    :rtype: Iterator[List[str]]
+    """
+
+    picker: Random = Random(seed)
+    commands: List[str] = picker.choices(tuple(mix), weights=tuple(mix.values()), k=passes)
+    ids: List[int] = [max(size, 1)]
+
+    def answers(command: str) -> List[str]:
+        made_up: List[str] = [
+            str(_DISPATCH_TABLE[command].number), *ANSWERS[command](picker, ids[0])
+        ]
+        ids[0] += command == "add_item"
+        return made_up
+
+    return map(answers, commands)
+
+
+def replay(trace: Iterable[List[str]], size: int) -> List[Result]:
+    """
+    Feed every pass of a trace through the menu, timing each one.
+
+    :param trace: The answers for each pass.
+    :type trace: Iterable[List[str]]
+
+    :param size: How many items the TODO list starts with.
+    :type size: int
+
+    :raises: ValueError when a pass asks for more answers than the trace gives it.
+
+    :returns: The measurements for each command, in the order they first ran, and then for every
+        pass together under the name "all".
+    :rtype: List[Result]
+    """
+
+    todo_list = build_list(size)
+    state: Tuple = (
+        False,
+        todo_list,
+        None,
+        SearchIndex(todo_list=todo_list),
+        History(),
+        ScheduleIndex(todo_list=todo_list)
+    )
+    answers: List[Iterator[str]] = [iter(())]
+    timings: Dict[str, List[int]] = {}
+
+    def answer(*_: object) -> str:
+        try:
+            return next(answers[0])
+        except StopIteration:
+            raise ValueError("A pass of the trace ran out of answers.") from None
+
+    with open(devnull, "w", encoding="utf-8") as sink, redirect_stdout(sink), patch(
+        target="builtins.input", new=answer
+    ):
+        for this_pass in trace:
+            answers[0] = iter(this_pass)
+            command = _DISPATCH_TABLE.get(int(this_pass[0]) if this_pass[0].isdigit() else None)
+
+            started: int = perf_counter_ns()
+            state = _main_step(*state)
+            timings.setdefault("unknown" if command is None else command.name, []).append(
+                perf_counter_ns() - started
+            )
+
+            if isinstance(state, int):
+                break
+
+    return [
+        *map(lambda pair: _result(*pair), timings.items()),
+        _result("all", [timing for each in timings.values() for timing in each])
+    ]
+
+
+def _result(command: str, timings: List[int]) -> Result:
+    cuts: List[float] = (
+        quantiles(timings, n=100, method="inclusive") if len(timings) > 1 else timings * 99
+    )
+
+    return Result(
+        command=command,
+        passes=len(timings),
+        throughput=len(timings) / (sum(timings) / 1e9) if timings else 0.0,
+        p50=cuts[49] if timings else 0.0,
+        p90=cuts[89] if timings else 0.0,
+        p99=cuts[98] if timings else 0.0,
+        worst=max(timings, default=0)
+    )
+
+
+def report(results: List[Result]) -> NoneType:
+    """
+    Print results as a table.
+    """
+
+    print(f"{'command':<18}{'passes':>9}{'passes/s':>13}{'p50 us':>11}{'p90 us':>11}"
+        + f"{'p99 us':>11}{'worst us':>11}")
+
+    any(map(
+        lambda result: print(
+            f"{result.command:<18}{result.passes:>9}{result.throughput:>13.1f}"
+            + f"{result.p50 / 1e3:>11.1f}{result.p90 / 1e3:>11.1f}{result.p99 / 1e3:>11.1f}"
+            + f"{result.worst / 1e3:>11.1f}"
+        ),
+        results
+    ))
+
+
+def _parse_arguments(arguments: List[str]) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(
+        prog="bench_replay", description="Replay a session of the menu and time every pass."
+    )
+
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--trace", metavar="PATH", help="Replay a trace recorded from the menu.")
+    source.add_argument(
+        "--mix", nargs="+", metavar="COMMAND=WEIGHT",
+        help=f"Make up a trace from a mix of {', '.join(ANSWERS)}."
+    )
+
+    parser.add_argument("--passes", type=int, default=10000, help="How many passes to make up.")
+    parser.add_argument("--size", type=int, default=10 ** 5, help="How many items to start with.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save-trace", metavar="PATH", help="Save the made-up trace to PATH.")
+
+    return parser.parse_args(arguments)
+
+
+def main(arguments: List[str]) -> int:
+    """
+    Run the replay from the command line.
+
+    :param arguments: The command line arguments, not including the program name.
+    :type arguments: List[str]
+
+    :returns: 0 once the results have been printed.
+    :rtype: int
+    """
+
+    options: Namespace = _parse_arguments(arguments=arguments)
+
+    if options.trace is not None:
+        with open(options.trace, encoding="utf-8") as trace_file:
+            trace: List[List[str]] = list(read_trace(trace_file))
+    else:
+        trace = list(synthetic(
+            mix=parse_mix(options.mix), passes=options.passes, size=options.size, seed=options.seed
+        ))
+
+    if options.save_trace is not None:
+        with open(options.save_trace, "w", encoding="utf-8") as trace_file:
+            trace_file.writelines(map(lambda this_pass: dumps(this_pass) + "\n", trace))
+
+    report(results=replay(trace=trace, size=options.size))
+    return 0
+
+
+if __name__ == "__main__": # pragma: no cover
+    close_program(main(arguments=argv[1:]))
@@ -0,0 +1,207 @@
+"""
+Cold start times for the one-shot commands and the interactive program.
+
+Each command is run as a fresh `python` process against a small stored TODO list, the way a script
+or a shell prompt would run it, and timed from start to exit. The interactive program is timed
+too, starting up and choosing Exit The Program straight away, for comparison.
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --samples 50 --limit 80
+
+With `--limit`, the exit code is 1 if any one-shot command's median start up took longer than that
+many milliseconds, so the start up time can be kept in check.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from os import path as os_path
+
+from statistics import quantiles
+
+from subprocess import DEVNULL
+from subprocess import run as run_process
+
+from sys import argv
+from sys import executable
+from sys import exit as close_program
+
+from tempfile import TemporaryDirectory
+
+from time import perf_counter_ns
+
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+from types import NoneType
+
+
+# The root of the repository, where `python -m src` has to be run from.
+ROOT: str = os_path.dirname(os_path.dirname(os_path.abspath(__file__)))
+
+# The command line for each thing being timed, and what to feed it on stdin. `{file}` is replaced
+# with the stored TODO list.
+COMMANDS: Dict[str, Tuple[Tuple[str, ...], str]] = {
+    "count": (("-m", "src", "count", "--incomplete", "--file", "{file}"), ""),
+    "ls": (("-m", "src", "ls", "--file", "{file}"), ""),
+    "add": (("-m", "src", "add", "Title", "Description", "--file", "{file}"), ""),
+    "done": (("-m", "src", "done", "0", "--file", "{file}"), ""),
+    "interactive": (("-m", "src.main", "--file", "{file}"), "3\n"),
+}
+
+
+class Result(NamedTuple):
+    """
+    The start up times for one command, in milliseconds.
+    """
+
+    command: str
+    samples: int
+    p50: float
+    p90: float
+
+
+def _time(arguments: Tuple[str, ...], stdin: str) -> int:
+    started: int = perf_counter_ns()
+    run_process(
+        (executable, *arguments), input=stdin, text=True, cwd=ROOT, stdout=DEVNULL, check=True
+    )
+    return perf_counter_ns() - started
+
+
+def measure(name: str, file: str, samples: int) -> Result:
+    """
+    Time `samples` fresh runs of one command.
+
+    :param name: The name of the command, one of `COMMANDS`.
+    :type name: str
+
+    :param file: The stored TODO list to run it against.
+    :type file: str
+
+    :param samples: How many times to run it.
+    :type samples: int
+
+    :returns: The measurements.
+    :rtype: Result
+    """
+
+    arguments: Tuple[str, ...] = tuple(map(
+        lambda argument: argument.format(file=file), COMMANDS[name][0]
+    ))
+    timings: List[float] = [_time(arguments, COMMANDS[name][1]) / 1e6 for _ in range(samples)]
+    cuts: List[float] = (
+        quantiles(timings, n=10, method="inclusive") if samples > 1 else timings * 9
+    )
+
+    return Result(command=name, samples=samples, p50=cuts[4], p90=cuts[8])
+
+
+def run(samples: int = 20, commands: Tuple[str, ...] = tuple(COMMANDS)) -> List[Result]:
+    """
+    Time every command against a freshly stored TODO list of 100 items.
+
+    :param samples: How many times to run each command.
+    :type samples: int = 20
+
+    :param commands: The names of the commands to time.
+    :type commands: Tuple[str, ...] = tuple(COMMANDS)
+
+    :returns: The measurements, in the order of `commands`.
+    :rtype: List[Result]
+    """
+
+    with TemporaryDirectory() as directory:
+        file: str = os_path.join(directory, "todo.json")
+
+        with open(os_path.join(directory, "script.txt"), "w", encoding="utf-8") as script:
+            script.writelines(f'add "Title {number}" "Description"\n' for number in range(100))
+
+        run_process(
+            (executable, "-m", "src.main", "--file", file, "--batch", script.name),
+            cwd=ROOT, stdout=DEVNULL, check=True
+        )
+
+        return [measure(name=name, file=file, samples=samples) for name in commands]
+
+
+def report(results: List[Result]) -> NoneType:
+    """
+    Print results as a table.
+    """
+
+    print(f"{'command':<14}{'runs':>6}{'p50 ms':>10}{'p90 ms':>10}")
+
+    any(map(
+        lambda result: print(
+            f"{result.command:<14}{result.samples:>6}{result.p50:>10.1f}{result.p90:>10.1f}"
+        ),
+        results
+    ))
+
+
+def _parse_arguments(arguments: List[str]) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(
+        prog="bench_startup", description="Time how long the program takes to start."
+    )
+
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("--commands", nargs="+", choices=tuple(COMMANDS), default=None)
+    parser.add_argument(
+        "--limit", type=float, default=None, metavar="MS",
+        help="Fail if a one-shot command's median start up takes longer than this."
+    )
+
+    return parser.parse_args(arguments)
+
+
+def main(arguments: List[str]) -> int:
+    """
+    Run the start up benchmark from the command line.
+
+    :param arguments: The command line arguments, not including the program name.
+    :type arguments: List[str]
+
+    :returns: 1 if a one-shot command went over the limit, otherwise 0.
+    :rtype: int
+    """
+
+    options: Namespace = _parse_arguments(arguments=arguments)
+    results: List[Result] = run(
+        samples=options.samples, commands=tuple(options.commands or COMMANDS)
+    )
+
+    report(results=results)
+
+    slow: List[Result] = [
+        result for result in results
+        if options.limit is not None
+        and result.command != "interactive"
+        and result.p50 > options.limit
+    ]
+
+    any(map(
+        lambda result: print(
+            f"TOO SLOW {result.command}: p50 {result.p50:.1f}ms, limit {options.limit:.1f}ms"
+        ),
+        slow
+    ))
+
+    return 1 if slow else 0
+
+
+if __name__ == "__main__": # pragma: no cover
+    close_program(main(arguments=argv[1:]))
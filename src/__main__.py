@@ -0,0 +1,32 @@
+"""
+Entry point for `python -m src`.
+
+The one-shot commands (`add`, `done`, `ls` and `count`, see `src/cli.py`) are run without importing
+the interactive program in `src/main.py`, so they start quickly. Anything else is handed to it, so
+`python -m src --file todo.json` starts the menu just as `python -m src.main` does.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from sys import argv
+from sys import exit as close_program
+
+# Local Imports
+from src.cli import COMMANDS
+
+
+if argv[1:2] and argv[1] in COMMANDS:
+    from src.cli import run
+else:
+    from src.main import _run as run
+
+close_program(run(arguments=argv[1:]))
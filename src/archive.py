@@ -0,0 +1,300 @@
+"""
+A compact binary file format for very large TODO lists, read lazily through `mmap`.
+
+An archive is laid out as a fixed size header, a heap of UTF-8 strings and five tables:
+
+    header      magic, sequence, count and where each table starts, as little-endian integers
+    heap        every item's title then description, one after another
+    ids         one signed 64 bit ID per item
+    offsets     2 * count + 1 unsigned 64 bit file offsets, so string i is [offset i, offset i + 1)
+    completed   one bit per item, lowest bit first, set if it's completed
+    missing     two bits per item, set if its title or description is None rather than a string
+    schedule    two unsigned 64 bit integers per item: its priority and the ordinal of its due date
+                (see `date.toordinal()`), each 0 if it has none
+
+Archives written before items had priorities and due dates have the magic `TODOARC1`, a header
+without the schedule table's offset and no schedule table. They're still read, as items with
+neither; the next compaction rewrites them in the current format.
+
+Every table has a fixed width per item, so finding anything about the item at a position is a
+little arithmetic and one read, and how many items are completed between two positions is a
+popcount over the completed bits without looking at the items at all.
+
+`Archive` opens the file with `mmap` and hands back a `PVector` made with `PVector.lazy()`, so an
+item is only decoded when it's rendered, edited or otherwise reached, and only the pages of the
+file that have been read are ever brought into memory. Opening a list of any size only reads the
+header. Changes are written to a journal next to the archive, exactly as `Journal` does, and the
+archive is rewritten once `compact_every` of them have built up.
+
+A file can't be replaced while it's mapped on every platform, and older versions of the TODO list,
+such as the ones undo goes back to, still read from the archive they were loaded from. So the
+archive being replaced is unmapped, moved aside to `path` + ".<sequence>.old" and mapped again
+there, and the new one is moved into place. An old archive is deleted once nothing reads from it
+any more, and any left behind by a crash are deleted when the archive is next loaded.
+
+Use a file ending in `.archive` with `--file` to store the TODO list this way.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from array import array
+
+from contextlib import suppress
+
+from datetime import date
+
+from glob import escape
+from glob import glob
+
+from mmap import ACCESS_READ
+from mmap import mmap
+
+from os import fsync
+from os import remove
+from os import replace
+from os.path import exists
+from os.path import getsize
+
+from struct import Struct
+
+from sys import byteorder
+
+from typing import Dict
+from typing import Iterable
+from typing import Tuple
+
+from types import NoneType
+
+from weakref import finalize
+
+# Local Imports
+from src.item import Item
+from src.journal import Journal
+from src.pvector import PVector
+
+
+MAGIC: bytes = b"TODOARC2"
+
+# The magic, the journal sequence number the archive covers, the number of items and where the
+# ids, offsets, completed, missing and schedule tables start.
+_HEADER: Struct = Struct("<8sQQQQQQQ")
+_ID: Struct = Struct("<q")
+_OFFSETS: Struct = Struct("<3Q")
+_SCHEDULE: Struct = Struct("<2Q")
+
+# The header of the archives written before there was a schedule table, by their magic.
+_HEADERS: Dict[bytes, Struct] = {MAGIC: _HEADER, b"TODOARC1": Struct("<8sQQQQQQ")}
+
+
+def _little_endian(table: array) -> bytes:
+    if byteorder == "big": # pragma: no cover
+        table.byteswap()
+
+    return table.tobytes()
+
+
+def write_archive(path: str, todo_list: Iterable[Item], sequence: int = 0) -> int:
+    """
+    Write a TODO list out as an archive, replacing whatever is at `path` atomically.
+
+    The items are written out one at a time as the list is walked, so only the fixed width tables,
+    not the text, are held in memory.
+
+    :param path: Where to write the archive.
+    :type path: str
+
+    :param todo_list: The items to write.
+    :type todo_list: Iterable[Item]
+
+    :param sequence: The sequence number of the last journal record the archive includes.
+    :type sequence: int = 0
+
+    :returns: How many items were written.
+    :rtype: int
+    """
+
+    ids: array = array("q")
+    offsets: array = array("Q", [_HEADER.size])
+    completed: bytearray = bytearray()
+    missing: bytearray = bytearray()
+    schedule: array = array("Q")
+
+    with open(f"{path}.tmp", "wb") as archive:
+        archive.write(bytes(_HEADER.size))
+
+        for position, item in enumerate(todo_list):
+            if position % 8 == 0:
+                completed.append(0)
+            if position % 4 == 0:
+                missing.append(0)
+
+            for number, text in enumerate((item.title, item.description)):
+                data: bytes = b"" if text is None else text.encode("utf-8")
+                archive.write(data)
+                offsets.append(offsets[-1] + len(data))
+                missing[position >> 2] |= (text is None) << ((position & 3) * 2 + number)
+
+            completed[position >> 3] |= bool(item.completed) << (position & 7)
+            ids.append(item.id)
+            schedule.extend((
+                item.priority or 0,
+                0 if item.due is None else date.fromisoformat(item.due).toordinal()
+            ))
+
+        ids_at: int = offsets[-1]
+        offsets_at: int = ids_at + len(ids) * ids.itemsize
+        completed_at: int = offsets_at + len(offsets) * offsets.itemsize
+
+        archive.write(_little_endian(ids))
+        archive.write(_little_endian(offsets))
+        archive.write(completed)
+        archive.write(missing)
+        archive.write(_little_endian(schedule))
+
+        archive.seek(0)
+        archive.write(_HEADER.pack(
+            MAGIC, sequence, len(ids), ids_at, offsets_at, completed_at,
+            completed_at + len(completed), completed_at + len(completed) + len(missing)
+        ))
+        archive.flush()
+        fsync(archive.fileno())
+
+    replace(f"{path}.tmp", path)
+    return len(ids)
+
+
+class _Mapped:
+    """
+    An archive opened with `mmap`, reading items and counts straight out of it.
+    """
+
+    def __init__(self, path: str) -> NoneType:
+        self.path: str = path
+        self._map: mmap = self._open(path=path)
+
+        header: (Struct | NoneType) = _HEADERS.get(self._map[:8])
+
+        if header is None or len(self._map) < header.size:
+            raise ValueError(f"{path} is not a TODO list archive.")
+
+        (
+            _, self.sequence, self.count, self._ids_at, self._offsets_at, self._completed_at,
+            self._missing_at, *schedule_at
+        ) = header.unpack_from(self._map, 0)
+
+        self._schedule_at: (int | NoneType) = schedule_at[0] if schedule_at else None
+
+    @staticmethod
+    def _open(path: str) -> mmap:
+        with open(path, "rb") as archive:
+            return mmap(archive.fileno(), 0, access=ACCESS_READ)
+
+    def move(self, path: str) -> NoneType:
+        """
+        Move the archive to `path`, unmapping it while it's moved, and carry on reading from there.
+        Once nothing reads from it any more it's unmapped and deleted.
+        """
+
+        self._map.close()
+        replace(self.path, path)
+        self.path = path
+        self._map = self._open(path=path)
+
+        finalize(self, _discard, self._map, path)
+
+    def _text(self, string: int, start: int, end: int) -> (str | NoneType):
+        return None if self._map[self._missing_at + (string >> 3)] >> (string & 7) & 1 else str(
+            self._map[start:end], "utf-8"
+        )
+
+    def item(self, position: int) -> Item:
+        """
+        Decode the item at a position.
+        """
+
+        start, middle, end = _OFFSETS.unpack_from(self._map, self._offsets_at + 16 * position)
+        priority, due = (0, 0) if self._schedule_at is None else _SCHEDULE.unpack_from(
+            self._map, self._schedule_at + 16 * position
+        )
+
+        return Item(
+            self._text(2 * position, start, middle),
+            self._text(2 * position + 1, middle, end),
+            self.completed_between(position, position + 1),
+            _ID.unpack_from(self._map, self._ids_at + 8 * position)[0],
+            priority or None,
+            date.fromordinal(due).isoformat() if due else None
+        )
+
+    def completed_between(self, low: int, high: int) -> int:
+        """
+        Count the completed items from position `low` up to, but not including, `high`.
+        """
+
+        bits: int = int.from_bytes(
+            self._map[self._completed_at + (low >> 3):self._completed_at + ((high + 7) >> 3)],
+            "little"
+        ) >> (low & 7)
+
+        return (bits & ((1 << (high - low)) - 1)).bit_count() if high > low else 0
+
+
+def _discard(mapped: mmap, path: str) -> NoneType:
+    """
+    Unmap and delete an archive that's been replaced.
+    """
+
+    mapped.close()
+
+    with suppress(OSError):
+        remove(path)
+
+
+class Archive(Journal):
+    """
+    A journal whose snapshot is an archive, opened lazily with `mmap`.
+
+    The archive is kept at `path` and the journal at `path` + ".journal". It's used just like a
+    `Journal`.
+    """
+
+    def __init__(self, path: str, sync_every: int = 32, compact_every: int = 1024) -> NoneType:
+        super().__init__(path=path, sync_every=sync_every, compact_every=compact_every)
+
+        # The mapping of the archive at `path`, if it's been loaded and not replaced since.
+        self._mapped: (_Mapped | NoneType) = None
+
+    def _read_snapshot(self) -> Tuple[int, PVector[Item]]:
+        for old in glob(f"{escape(self.path)}.*.old"):
+            with suppress(OSError):
+                remove(old)
+
+        if not exists(self.path) or getsize(self.path) == 0:
+            return 0, PVector()
+
+        self._mapped = _Mapped(path=self.path)
+
+        return self._mapped.sequence, PVector.lazy(
+            size=self._mapped.count,
+            value_at=self._mapped.item,
+            completed_between=self._mapped.completed_between
+        )
+
+    def _write_snapshot(self, todo_list: PVector[Item]) -> NoneType:
+        # The TODO list may be read from the mapped archive, so it's written out before that moves.
+        write_archive(path=f"{self.path}.next", todo_list=todo_list, sequence=self._sequence)
+
+        if self._mapped is not None:
+            self._mapped.move(path=f"{self.path}.{self._mapped.sequence}.old")
+            self._mapped = None
+
+        replace(f"{self.path}.next", self.path)
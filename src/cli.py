@@ -0,0 +1,254 @@
+"""
+One-shot commands for scripts and shell prompts, which run without the interactive menu.
+
+    python -m src add "Buy milk" "Semi-skimmed" --file todo.json
+    python -m src done 3 --file todo.json
+    python -m src ls --incomplete --file todo.json
+    python -m src ls --title Buy --file todo.db
+    python -m src count --incomplete --file todo.json
+
+`--file` defaults to the `TODO_FILE` environment variable, so a shell prompt can just run
+`python -m src count --incomplete`.
+
+Starting the interactive program means importing everything in `src/main.py`: the third party
+`funcs` package, `asyncio` for the server, SQLite, and building the command registry and the help
+text from the menu's functions. None of that is needed to add one item or count what's left, so
+this module only imports `argparse` up front, and each command imports the little it uses when it
+runs - the journal, SQLite, the replica or the archive code only for a file of that kind.
+`python -m src` runs these commands without importing `src/main.py` at all (see
+`src/__main__.py`), which takes start up from about a third of a second to a few tens of
+milliseconds. `benchmarks/bench_startup.py` measures it.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from contextlib import nullcontext
+
+from os import environ
+
+from sys import argv
+from sys import exit as close_program
+
+from typing import Callable
+from typing import ContextManager
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import TYPE_CHECKING
+
+from types import NoneType
+
+# Local Imports
+if TYPE_CHECKING: # pragma: no cover
+    from src.archive import Archive
+    from src.item import Item
+    from src.journal import Journal
+    from src.pvector import PVector
+    from src.replica import Replica
+    from src.store import SqliteStore
+
+    Storage = (Journal | SqliteStore | Replica | Archive)
+
+
+def open_storage(path: (str | NoneType)) -> ContextManager:
+    """
+    Get the storage for the TODO list at `path`, picked by its extension, importing only its module.
+
+    :param path: Where the TODO list is stored, or None to not store it at all.
+    :type path: (str | NoneType)
+
+    :returns: A `SqliteStore` for `.db`, `.sqlite` and `.sqlite3` files, a `Replica` for `.replica`
+        files, an `Archive` for `.archive` files, a `Journal` for anything else, or a context that
+        gives None when there's no path.
+    :rtype: ContextManager
+    """
+
+    if path is None:
+        return nullcontext()
+
+    if path.lower().endswith((".db", ".sqlite", ".sqlite3")):
+        from src.store import SqliteStore # pylint: disable=import-outside-toplevel
+        return SqliteStore(path=path)
+
+    if path.endswith(".replica"):
+        from src.replica import Replica # pylint: disable=import-outside-toplevel
+        return Replica(path=path)
+
+    if path.endswith(".archive"):
+        from src.archive import Archive # pylint: disable=import-outside-toplevel
+        return Archive(path=path)
+
+    from src.journal import Journal # pylint: disable=import-outside-toplevel
+    return Journal(path=path)
+
+
+def _add(store: "Storage", options: Namespace) -> int:
+    todo_list: "PVector[Item]" = store.step(
+        todo_list=store.load(), operation=("add", options.title, options.description)
+    )
+    print(f"Added item {todo_list[-1].id}.")
+    return 0
+
+
+def _done(store: "Storage", options: Namespace) -> int:
+    from src.operations import position_of # pylint: disable=import-outside-toplevel
+
+    todo_list: "PVector[Item]" = store.load()
+    position: (int | NoneType) = position_of(todo_list, options.id)
+
+    if position is None:
+        print(f"There is no item with ID {options.id}.")
+        return 1
+
+    if not todo_list[position].completed:
+        store.step(todo_list=todo_list, operation=("toggle", options.id))
+
+    print(f"Item {options.id} is done.")
+    return 0
+
+
+def _ls(store: "Storage", options: Namespace) -> int:
+    from src.transfer import export_jsonl # pylint: disable=import-outside-toplevel
+
+    # An SQLite database finds titles by their index rather than by reading every item.
+    if options.title is not None and hasattr(store, "titles_starting_with"):
+        return int(any(map(
+            lambda line: print(line, end=""),
+            export_jsonl(filter(
+                lambda item: options.completed is None or item.completed == options.completed,
+                store.titles_starting_with(prefix=options.title)
+            ))
+        )))
+
+    todo_list: "PVector[Item]" = store.load()
+    items: "Iterable[Item]" = (
+        todo_list
+        if options.completed is None
+        else map(lambda numbered: numbered[1], todo_list.iterate_completed(options.completed))
+    )
+
+    return int(any(map(
+        lambda line: print(line, end=""),
+        export_jsonl(
+            items
+            if options.title is None
+            else filter(
+                lambda item: isinstance(item.title, str) and item.title.startswith(options.title),
+                items
+            )
+        )
+    )))
+
+
+def _count(store: "Storage", options: Namespace) -> int:
+
+    # An SQLite database is counted with `SELECT COUNT`, without loading the TODO list.
+    if hasattr(store, "count_completed"):
+        print(
+            store.count()
+            if options.completed is None
+            else store.count_completed(completed=options.completed)
+        )
+        return 0
+
+    todo_list: "PVector[Item]" = store.load()
+
+    print(
+        len(todo_list)
+        if options.completed is None
+        else todo_list.count_completed(completed=options.completed)
+    )
+    return 0
+
+
+# The function that runs each command, by its name.
+COMMANDS: Dict[str, Callable[["Storage", Namespace], int]] = {
+    "add": _add,
+    "done": _done,
+    "ls": _ls,
+    "count": _count,
+}
+
+
+def _parse_arguments(arguments: List[str]) -> Namespace:
+    """
+    Parse the arguments for a one-shot command.
+
+    :param arguments: The command line arguments, not including the program name.
+    :type arguments: List[str]
+
+    :returns: The parsed arguments.
+    :rtype: Namespace
+    """
+
+    parser: ArgumentParser = ArgumentParser(
+        prog="todo", description="Change or look at a stored TODO list in one command."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="Add an item and print its ID.")
+    add.add_argument("title")
+    add.add_argument("description", nargs="?", default="")
+
+    done = commands.add_parser("done", help="Check off the item with the given ID.")
+    done.add_argument("id", type=int)
+
+    listing = commands.add_parser("ls", help="Print the items as JSON Lines.")
+    count = commands.add_parser("count", help="Print how many items there are.")
+
+    listing.add_argument(
+        "--title", metavar="PREFIX", help="Only print the items whose titles start with PREFIX."
+    )
+
+    for command in (listing, count):
+        shown = command.add_mutually_exclusive_group()
+        shown.add_argument("--completed", dest="completed", action="store_const", const=True)
+        shown.add_argument("--incomplete", dest="completed", action="store_const", const=False)
+
+    for command in (add, done, listing, count):
+        command.add_argument(
+            "--file",
+            metavar="PATH",
+            default=environ.get("TODO_FILE"),
+            help="Where the TODO list is stored, as for the main program. Defaults to $TODO_FILE."
+        )
+
+    options: Namespace = parser.parse_args(arguments)
+
+    if options.file is None:
+        parser.error("the TODO list's --file is needed, or set TODO_FILE")
+
+    return options
+
+
+def run(arguments: List[str]) -> int:
+    """
+    Run one one-shot command against the stored TODO list.
+
+    :param arguments: The command line arguments, not including the program name.
+    :type arguments: List[str]
+
+    :returns: The exit code for the program.
+    :rtype: int
+    """
+
+    options: Namespace = _parse_arguments(arguments=arguments)
+
+    with open_storage(path=options.file) as store:
+        return COMMANDS[options.command](store, options)
+
+
+if __name__ == "__main__": # pragma: no cover
+    close_program(run(arguments=argv[1:]))
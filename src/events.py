@@ -0,0 +1,243 @@
+"""
+A stream of structured change events, so whatever follows the TODO list can update from just what
+changed.
+
+Every command returns a whole new version of the TODO list. Working out what changed from the two
+versions alone means comparing them (see `changes()` in `src/operations.py`), so the commands that
+know exactly what they did - adding, editing, checking off, unchecking and removing an item - say so
+as well, with `emit_change()`:
+
+    Change(kind="inserted", id=7, item=Item("Buy milk", "", False, id=7))
+    Change(kind="updated", id=3, item=Item("Walk the dog", "", True, id=3))
+    Change(kind="removed", id=5)
+
+At the end of each pass of the menu the changes emitted on the way from the old version to the new
+one are taken with `ChangeStream.take()`, and only a command that didn't emit any, such as Undo or
+Update Many Items, has its changes worked out by comparing the versions. The changes then go, as
+records, to the search index, the undo history and the journal, and as they are to every consumer
+that subscribed with `subscribe()`, so each of them does O(changes) work per pass however long the
+TODO list is.
+
+Emitted changes are kept along with the versions of the TODO list they lead from and to, and are
+only taken if those are the versions the pass went between, so changes emitted by a call whose
+result was thrown away are never mistaken for the pass's own.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from typing import Callable
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+from types import NoneType
+
+# Local Imports
+from src.item import Item
+from src.item import schedule_of
+from src.operations import position_of
+from src.pvector import PVector
+
+
+INSERTED: str = "inserted"
+REMOVED: str = "removed"
+UPDATED: str = "updated"
+
+
+class Change(NamedTuple):
+    """
+    One change to the TODO list: an item inserted, removed or updated, with its ID and, unless it
+    was removed, the item as it is now.
+    """
+
+    kind: str
+    id: int
+    item: (Item | NoneType) = None
+
+    def as_record(self) -> Tuple:
+        """
+        Get the change as the `append`, `replace` or `remove` record `changes()` would give for it.
+        """
+        return (
+            ("remove", self.id)
+            if self.kind == REMOVED
+            else (
+                (
+                    "append", self.item.title, self.item.description, self.item.completed, self.id,
+                    *schedule_of(self.item)
+                )
+                if self.kind == INSERTED
+                else (
+                    "replace", self.id, self.item.title, self.item.description, self.item.completed,
+                    *schedule_of(self.item)
+                )
+            )
+        )
+
+
+def from_record(record: Tuple) -> Change:
+    """
+    Get an `append`, `replace` or `remove` record, as `changes()` gives them, as a change.
+
+    :param record: The record.
+    :type record: Tuple
+
+    :returns: The change.
+    :rtype: Change
+    """
+    return (
+        Change(kind=REMOVED, id=record[1])
+        if record[0] == "remove"
+        else (
+            Change(kind=INSERTED, id=record[4], item=Item(*record[1:4], record[4], *record[5:]))
+            if record[0] == "append"
+            else Change(kind=UPDATED, id=record[1], item=Item(*record[2:5], record[1], *record[5:]))
+        )
+    )
+
+
+class ChangeStream:
+    """
+    Collects the changes commands emit and hands them on to every subscribed consumer.
+    """
+
+    def __init__(self) -> NoneType:
+        self._consumers: List[Callable[[Tuple[Change, ...]], object]] = []
+        self._pending: List[Change] = []
+        self._from: (PVector[Item] | NoneType) = None
+        self._to: (PVector[Item] | NoneType) = None
+
+    def subscribe(self, consumer: Callable[[Tuple[Change, ...]], object]) -> Callable[[], NoneType]:
+        """
+        Have `consumer` called with the changes made by every pass of the menu that changed the
+        TODO list.
+
+        :param consumer: Called with the changes, in the order they were made.
+        :type consumer: Callable[[Tuple[Change, ...]], object]
+
+        :returns: A function that unsubscribes the consumer again.
+        :rtype: Callable[[], NoneType]
+        """
+
+        self._consumers.append(consumer)
+        return lambda: self._consumers.remove(consumer)
+
+    def emit(
+                self,
+                before: PVector[Item],
+                after: PVector[Item],
+                changes: Tuple[Change, ...]
+            ) -> NoneType:
+        """
+        Keep the changes that turned `before` into `after` until the end of the pass.
+
+        Changes that carry on from the last ones emitted are added to them, and anything else
+        starts afresh.
+        """
+
+        if self._to is not before:
+            self._pending = []
+            self._from = before
+
+        self._pending.extend(changes)
+        self._to = after
+
+    def take(
+                self,
+                before: PVector[Item],
+                after: PVector[Item]
+            ) -> (Tuple[Change, ...] | NoneType):
+        """
+        Take the changes emitted since the last time, if they turned `before` into `after`.
+
+        :param before: The TODO list at the start of the pass.
+        :type before: PVector[Item]
+
+        :param after: The TODO list at the end of the pass.
+        :type after: PVector[Item]
+
+        :returns: The changes, or None if they weren't emitted for these two versions.
+        :rtype: (Tuple[Change, ...] | NoneType)
+        """
+
+        emitted: Tuple[Change, ...] = tuple(self._pending)
+        matched: bool = self._from is before and self._to is after
+
+        self._pending, self._from, self._to = [], None, None
+        return emitted if matched else None
+
+    def publish(self, changes: Tuple[Change, ...]) -> NoneType:
+        """
+        Hand changes to every subscribed consumer, unless there aren't any.
+        """
+
+        for consumer in tuple(self._consumers) if changes else ():
+            consumer(changes)
+
+
+# The stream every command emits its changes to.
+STREAM: ChangeStream = ChangeStream()
+
+
+def subscribe(consumer: Callable[[Tuple[Change, ...]], object]) -> Callable[[], NoneType]:
+    """
+    Have `consumer` called with the changes made by every pass of the menu that changed the TODO
+    list (see `ChangeStream.subscribe()`).
+
+    :param consumer: Called with the changes, in the order they were made.
+    :type consumer: Callable[[Tuple[Change, ...]], object]
+
+    :returns: A function that unsubscribes the consumer again.
+    :rtype: Callable[[], NoneType]
+    """
+    return STREAM.subscribe(consumer)
+
+
+def emit_change(
+            before: PVector[Item],
+            after: PVector[Item],
+            kind: str,
+            item_id: (int | NoneType) = None
+        ) -> PVector[Item]:
+    """
+    Emit the change a single add, update or removal made, if it made one.
+
+    :param before: The TODO list before the change.
+    :type before: PVector[Item]
+
+    :param after: The TODO list after the change, which is `before` itself if nothing changed.
+    :type after: PVector[Item]
+
+    :param kind: `INSERTED`, `UPDATED` or `REMOVED`.
+    :type kind: str
+
+    :param item_id: The ID of the updated or removed item. An inserted item is the last one.
+    :type item_id: (int | NoneType) = None
+
+    :returns: `after`, unchanged.
+    :rtype: PVector[Item]
+    """
+
+    if after is not before:
+        item: (Item | NoneType) = (
+            after[-1]
+            if kind == INSERTED
+            else (None if kind == REMOVED else after[position_of(after, item_id)])
+        )
+
+        STREAM.emit(
+            before=before,
+            after=after,
+            changes=(Change(kind=kind, id=item.id if item_id is None else item_id, item=item),)
+        )
+
+    return after
@@ -0,0 +1,174 @@
+"""
+Undo and redo for the TODO list.
+
+Every operation returns a new version of the TODO list and leaves the old one as it was, so undoing
+a change is just a matter of going back to the version before it. The versions are `PVector`s,
+which share every item and subtree they have in common, so keeping a history of 1,000 versions costs
+the O(log n) nodes each change added rather than 1,000 copies of the TODO list.
+
+Counting versions doesn't cap the memory they hold on to, though: a bulk change that rebuilds the
+TODO list shares nothing with the version before it, so one version can cost as much as the whole
+list. So each version is also charged the tree nodes it doesn't share with the version next to it
+(see `PVector.unshared_nodes()`), which costs O(k log n) for a change to k items, and once the
+history holds more than `limit` versions or more than `budget` bytes of them, the oldest are
+dropped until it fits. The latest version is always kept, so the latest change can be undone
+however much it cost.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from collections import deque
+
+from typing import Deque
+from typing import Tuple
+
+from types import NoneType
+
+# Local Imports
+from src.item import Item
+from src.pvector import NODE_BYTES
+from src.pvector import PVector
+
+
+# How many versions of the TODO list can be undone by default.
+DEFAULT_LIMIT: int = 1000
+
+# Roughly how many bytes of versions the history holds on to by default.
+DEFAULT_BUDGET: int = 32 * 1024 * 1024
+
+
+class History:
+    """
+    The versions of the TODO list that can be undone and redone.
+    """
+
+    def __init__(self, limit: int = DEFAULT_LIMIT, budget: int = DEFAULT_BUDGET) -> NoneType:
+        self.limit: int = limit
+        self.budget: int = budget
+
+        # Each version alongside the bytes it was charged when it was kept.
+        self._undo: Deque[Tuple[PVector[Item], int]] = deque()
+        self._redo: Deque[Tuple[PVector[Item], int]] = deque()
+        self._restored: (PVector[Item] | NoneType) = None
+        self._bytes: int = 0
+
+    def memory_used(self) -> int:
+        """
+        The estimated bytes held on to by the versions that can be undone and redone.
+        """
+        return self._bytes
+
+    def _push(
+                self,
+                versions: Deque[Tuple[PVector[Item], int]],
+                version: PVector[Item],
+                next_to: PVector[Item]
+            ) -> NoneType:
+        cost: int = version.unshared_nodes(next_to) * NODE_BYTES
+        versions.append((version, cost))
+        self._bytes += cost
+        self._trim()
+
+    def _pop(
+                self,
+                versions: Deque[Tuple[PVector[Item], int]],
+                oldest: bool = False
+            ) -> PVector[Item]:
+        version, cost = versions.popleft() if oldest else versions.pop()
+        self._bytes -= cost
+        return version
+
+    def _trim(self) -> NoneType:
+        """
+        Drop the oldest versions, and then the furthest redone ones, until the history fits.
+        """
+
+        while len(self._undo) > self.limit:
+            self._pop(versions=self._undo, oldest=True)
+
+        while len(self._redo) > self.limit:
+            self._pop(versions=self._redo, oldest=True)
+
+        while self._bytes > self.budget and len(self._undo) + len(self._redo) > 1:
+            self._pop(versions=self._undo if len(self._undo) > 1 else self._redo, oldest=True)
+
+    def record(self, before: PVector[Item], after: PVector[Item]) -> NoneType:
+        """
+        Record that the TODO list changed from `before` to `after`.
+
+        A new change can't be redone past, so it empties the redo history. Versions handed out by
+        `undo()` and `redo()` are already in the history and aren't recorded again.
+
+        :param before: The TODO list before the change.
+        :type before: PVector[Item]
+
+        :param after: The TODO list after the change.
+        :type after: PVector[Item]
+        """
+
+        if after is not self._restored and after is not before:
+            while self._redo:
+                self._pop(versions=self._redo)
+
+            self._push(versions=self._undo, version=before, next_to=after)
+
+        self._restored = None
+
+    def undo(self, todo_list: PVector[Item]) -> PVector[Item]:
+        """
+        Go back to the version of the TODO list before the latest change.
+
+        :param todo_list: The current TODO list.
+        :type todo_list: PVector[Item]
+
+        :returns: The previous version, or `todo_list` if there is nothing to undo.
+        :rtype: PVector[Item]
+        """
+
+        if not self._undo:
+            return todo_list
+
+        self._restored = self._pop(versions=self._undo)
+        self._push(versions=self._redo, version=todo_list, next_to=self._restored)
+
+        return self._restored
+
+    def redo(self, todo_list: PVector[Item]) -> PVector[Item]:
+        """
+        Go forward to the version of the TODO list that was last undone.
+
+        :param todo_list: The current TODO list.
+        :type todo_list: PVector[Item]
+
+        :returns: The undone version, or `todo_list` if there is nothing to redo.
+        :rtype: PVector[Item]
+        """
+
+        if not self._redo:
+            return todo_list
+
+        self._restored = self._pop(versions=self._redo)
+        self._push(versions=self._undo, version=todo_list, next_to=self._restored)
+
+        return self._restored
+
+    def can_undo(self) -> bool:
+        """
+        Whether there is a change to undo.
+        """
+        return len(self._undo) > 0
+
+    def can_redo(self) -> bool:
+        """
+        Whether there is an undone change to redo.
+        """
+        return len(self._redo) > 0
@@ -0,0 +1,217 @@
+"""
+Opt-in timing and allocation instrumentation for the interactive menu.
+
+While an `Instrumentation` is active (see `Instrumentation.activate()`), every call made through
+`measured()` is timed and recorded under the name of its phase. Phases nest, and a nested phase is
+recorded under its parents' names joined with "/", so a pass of the menu breaks down as:
+
+ - `render`: showing the viewport before the prompt.
+ - `choose/prompt`: waiting for the user to pick a command.
+ - `<command>`: running the command, for example `add_item`.
+ - `<command>/prompt`: the part of that spent waiting for the user to answer its prompts.
+ - `record`: working out what changed and updating the journal, search index and undo history.
+
+Subtracting a command's `prompt` time from its total gives the time spent transforming the TODO
+list. For each phase the wall time, CPU time and peak bytes allocated (traced with `tracemalloc`)
+are summed over every call.
+
+When no `Instrumentation` is active, `measured()` just calls the function, so the menu pays
+nothing for this unless it's switched on.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from contextlib import contextmanager
+
+from contextvars import ContextVar
+
+from json import dump
+
+from time import perf_counter_ns
+from time import thread_time_ns
+
+from tracemalloc import get_traced_memory
+from tracemalloc import is_tracing
+from tracemalloc import reset_peak
+from tracemalloc import start as start_tracing
+from tracemalloc import stop as stop_tracing
+
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import TypeVar
+
+from types import NoneType
+
+
+Result = TypeVar("Result")
+
+
+class PhaseStats:
+    """
+    The totals recorded for one phase.
+    """
+
+    __slots__ = ("calls", "wall_ns", "cpu_ns", "peak_bytes")
+
+    def __init__(self) -> NoneType:
+        self.calls: int = 0
+        self.wall_ns: int = 0
+        self.cpu_ns: int = 0
+        self.peak_bytes: int = 0
+
+    def as_dict(self) -> Dict[str, (int | float)]:
+        """
+        Get the totals as a dictionary, with times in milliseconds.
+        """
+        return {
+            "calls": self.calls,
+            "wall_ms": self.wall_ns / 1e6,
+            "cpu_ms": self.cpu_ns / 1e6,
+            "peak_bytes": self.peak_bytes
+        }
+
+
+class Instrumentation:
+    """
+    Collects the `PhaseStats` for every phase measured while it's active.
+    """
+
+    def __init__(self) -> NoneType:
+        self.phases: Dict[str, PhaseStats] = {}
+
+        # One entry per phase being measured: its name, its start values and the highest traced
+        # memory seen so far. Child phases reset the peak, so they pass what they saw back up.
+        self._stack: List[List] = []
+
+    @contextmanager
+    def activate(self, save_to: (str | NoneType) = None) -> Iterator["Instrumentation"]:
+        """
+        Make this the active instrumentation, tracing allocations, for the duration of a `with`.
+
+        :param save_to: Where to write the totals as JSON (see `save()`) on leaving the `with`.
+        :type save_to: (str | NoneType) = None
+        """
+
+        tracing_already: bool = is_tracing()
+        token = _ACTIVE.set(self)
+
+        if not tracing_already:
+            start_tracing()
+
+        try:
+            yield self
+        finally:
+            _ACTIVE.reset(token)
+
+            if not tracing_already:
+                stop_tracing()
+
+            if save_to is not None:
+                self.save(path=save_to)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[NoneType]:
+        """
+        Measure the body of a `with` block as the phase `name`, nested under any enclosing phase.
+        """
+
+        current: int = get_traced_memory()[0]
+
+        if self._stack:
+            self._stack[-1][4] = max(self._stack[-1][4], get_traced_memory()[1])
+
+        reset_peak()
+        key: str = "/".join([*map(lambda entry: entry[0], self._stack), name])
+        self._stack.append([name, perf_counter_ns(), thread_time_ns(), current, current])
+
+        try:
+            yield
+        finally:
+            wall_end, cpu_end = perf_counter_ns(), thread_time_ns()
+            entry: List = self._stack.pop()
+            entry[4] = max(entry[4], get_traced_memory()[1])
+
+            if self._stack:
+                self._stack[-1][4] = max(self._stack[-1][4], entry[4])
+
+            stats: PhaseStats = self.phases.setdefault(key, PhaseStats())
+            stats.calls += 1
+            stats.wall_ns += wall_end - entry[1]
+            stats.cpu_ns += cpu_end - entry[2]
+            stats.peak_bytes = max(stats.peak_bytes, entry[4] - entry[3])
+
+    def as_dict(self) -> Dict[str, Dict[str, (int | float)]]:
+        """
+        Get the totals for every phase, by phase name.
+        """
+        return {key: stats.as_dict() for key, stats in sorted(self.phases.items())}
+
+    def report(self) -> bool:
+        """
+        Print the totals for every phase as a table.
+
+        :returns: False once the table has been printed.
+        :rtype: bool
+        """
+
+        print(f"{'phase':<32}{'calls':>7}{'wall ms':>12}{'cpu ms':>12}{'peak bytes':>13}")
+
+        return any(map(
+            lambda pair: print(
+                f"{pair[0]:<32}{pair[1]['calls']:>7}{pair[1]['wall_ms']:>12.3f}"
+                + f"{pair[1]['cpu_ms']:>12.3f}{pair[1]['peak_bytes']:>13}"
+            ),
+            self.as_dict().items()
+        ))
+
+    def save(self, path: str) -> NoneType:
+        """
+        Write the totals for every phase to `path` as JSON.
+        """
+        with open(path, "w", encoding="utf-8") as stats_file:
+            dump(self.as_dict(), stats_file, indent=4)
+
+
+_ACTIVE: ContextVar[(Instrumentation | NoneType)] = ContextVar("instrumentation", default=None)
+
+
+def active() -> (Instrumentation | NoneType):
+    """
+    Get the active instrumentation, if there is one.
+    """
+    return _ACTIVE.get()
+
+
+def measured(name: str, function: Callable[..., Result], *args, **kwargs) -> Result:
+    """
+    Call `function` with the given arguments, measuring it as the phase `name` if instrumentation
+    is active.
+
+    :param name: The name of the phase.
+    :type name: str
+
+    :param function: The function to call.
+    :type function: Callable[..., Result]
+
+    :returns: Whatever the function returned.
+    :rtype: Result
+    """
+
+    instrumentation: (Instrumentation | NoneType) = _ACTIVE.get()
+
+    if instrumentation is None:
+        return function(*args, **kwargs)
+
+    with instrumentation.phase(name):
+        return function(*args, **kwargs)
@@ -0,0 +1,213 @@
+"""
+Compact, immutable representation of a single TODO list item.
+
+An item used to be a `dict` holding the same three keys over and over, which costs a hash table
+per item before the title and description are even counted. `Item` keeps the three values in
+`__slots__` instead, which is about a third of the size.
+
+`Item` is a read-only `Mapping`, so code written against the old dictionaries keeps working:
+`item.get("title")`, `item["completed"]`, `{**item}` and `dict(item)` all behave as before, and an
+`Item` compares equal to a `dict` with the same keys and values. `json.dumps` needs `default=dict`
+to serialise one.
+
+Every item also carries a stable `id`. IDs are handed out in increasing order as items are added
+and an item keeps its ID however it's edited, so a TODO list is always sorted by ID and an item can
+be found by binary search (see `position_of()` in `src/operations.py`). The ID is an attribute
+rather than one of the mapping's keys, so it doesn't show up in the JSON output or in comparisons.
+
+Titles and descriptions are kept through `src/strings.py`, so equal ones are shared between items
+and long descriptions are kept compressed until `description` is read.
+
+An item can also have a `priority` (1 being the highest) and a `due` date, as `YYYY-MM-DD`, which
+the Next Up and Overdue Items commands go by (see `src/schedule.py`). Both are optional and are only
+keys of the mapping when they're set, so an item without them looks exactly as items always have.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from collections.abc import Mapping
+
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Tuple
+
+from types import NoneType
+
+# Local Imports
+from src.strings import CompressedText
+from src.strings import share
+from src.strings import store
+from src.strings import text_of
+
+
+# The keys of an item, in the order they're serialised in.
+FIELDS: Tuple[str, ...] = ("title", "description", "completed")
+
+# The optional keys of an item, serialised after the others when they're set.
+SCHEDULE_FIELDS: Tuple[str, ...] = ("priority", "due")
+
+
+class Item(Mapping):
+    """
+    A single TODO list item, holding its title, description and completed status, and optionally
+    its priority and due date.
+    """
+
+    __slots__ = ("title", "_description", "completed", "id", "priority", "due")
+
+    def __init__(
+                self,
+                title: (str | NoneType) = None,
+                description: (str | CompressedText | NoneType) = None,
+                completed: bool = False,
+                id: int = 0, # pylint: disable=redefined-builtin
+                priority: (int | NoneType) = None,
+                due: (str | NoneType) = None
+            ) -> NoneType:
+        object.__setattr__(self, "title", share(title))
+        object.__setattr__(self, "_description", store(description))
+        object.__setattr__(self, "completed", bool(completed))
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "priority", priority)
+        object.__setattr__(self, "due", share(due))
+
+    @property
+    def description(self) -> (str | NoneType):
+        """
+        The description, decompressed if it was long enough to be kept compressed.
+        """
+        return text_of(self._description)
+
+    def __setattr__(self, name: str, value: object) -> NoneType:
+        raise AttributeError(f"Item is immutable, can't set {name!r}.")
+
+    def __getitem__(self, key: str) -> (str | bool | int | NoneType):
+        if key not in FIELDS and (key not in SCHEDULE_FIELDS or getattr(self, key) is None):
+            raise KeyError(key)
+
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def _keys(self) -> Tuple[str, ...]:
+        return FIELDS if self.priority is None and self.due is None else (
+            *FIELDS, *filter(lambda field: getattr(self, field) is not None, SCHEDULE_FIELDS)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Item({self.title!r}, {self.description!r}, {self.completed!r}, id={self.id!r}"
+            + "".join(map(
+                lambda field: f", {field}={getattr(self, field)!r}",
+                self._keys()[len(FIELDS):]
+            ))
+            + ")"
+        )
+
+    def replace(self, **changes: (str | bool | NoneType)) -> "Item":
+        """
+        Return a new item with some of the values replaced, for example `replace(completed=True)`.
+
+        The new item keeps this item's ID, and its description isn't decompressed unless it changes.
+        """
+        return Item(**{
+            "title": self.title,
+            "description": self._description,
+            "completed": self.completed,
+            "id": self.id,
+            "priority": self.priority,
+            "due": self.due,
+            **changes
+        })
+
+
+def schedule_of(item: Item) -> Tuple[(int | str | NoneType), ...]:
+    """
+    Get an item's priority and due date, to go on the end of a record, or nothing if it has neither.
+
+    :param item: The item.
+    :type item: Item
+
+    :returns: The priority and due date, or an empty tuple.
+    :rtype: Tuple[(int | str | NoneType), ...]
+    """
+    return () if item.priority is None and item.due is None else (item.priority, item.due)
+
+
+def schedule_in(record: Tuple, start: int) -> Tuple[(int | str | NoneType), ...]:
+    """
+    Get the priority and due date from the end of a record, which are None if it doesn't have them.
+
+    :param record: An `append` or `replace` record.
+    :type record: Tuple
+
+    :param start: Where the priority would be in the record.
+    :type start: int
+
+    :returns: The priority and due date.
+    :rtype: Tuple[(int | str | NoneType), ...]
+    """
+    return (*record[start:start + 2], None, None)[:2]
+
+
+def as_item(item: Mapping, default_id: int = 0) -> Item:
+    """
+    Get an item as an `Item`, converting it from a dictionary if need be.
+
+    :param item: The item to convert.
+    :type item: Mapping
+
+    :param default_id: The ID to give a dictionary that doesn't have an "id" key.
+    :type default_id: int = 0
+
+    :returns: The item as an `Item`.
+    :rtype: Item
+    """
+    return item if isinstance(item, Item) else Item(
+        item.get("title"),
+        item.get("description"),
+        item.get("completed", False),
+        item.get("id", default_id),
+        item.get("priority"),
+        item.get("due")
+    )
+
+
+def as_items(items: Iterable[Mapping]) -> Iterator[Item]:
+    """
+    Convert a sequence of items to `Item`s, numbering any that don't have an ID by their position.
+
+    :param items: The items to convert.
+    :type items: Iterable[Mapping]
+
+    :returns: The items as `Item`s.
+    :rtype: Iterator[Item]
+    """
+    return map(lambda numbered: as_item(numbered[1], default_id=numbered[0]), enumerate(items))
+
+
+def serialise(item: Item) -> Dict[str, (str | bool | int | NoneType)]:
+    """
+    Get an item as a dictionary that includes its ID, for storage.
+
+    :param item: The item to serialise.
+    :type item: Item
+
+    :returns: The item's values and its ID.
+    :rtype: Dict[str, (str | bool | int | NoneType)]
+    """
+    return {**item, "id": item.id}
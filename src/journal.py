@@ -0,0 +1,239 @@
+"""
+Durable storage for the TODO list as an append-only journal of operations plus compacted snapshots.
+
+Every change to the TODO list is written to the end of the journal as one JSON line holding a
+sequence number and the operation tuple (see `src/operations.py`), for example:
+
+    {"sequence": 12, "operation": ["toggle", 3]}
+
+The snapshot stores each item along with its ID (see `src/item.py`).
+
+Writes are buffered and only `fsync`ed once every `sync_every` records (and when the journal is
+closed), so a long batch doesn't pay for a disk flush per operation.
+
+Once `compact_every` records have been written since the last snapshot, the whole TODO list is
+written to the snapshot file and the journal is emptied. Loading reads the snapshot and replays
+only the records after it, so start up time is bounded by `compact_every` rather than by how long
+the TODO list has been in use.
+
+The snapshot is replaced atomically and records the sequence number it covers, so a crash between
+writing the snapshot and emptying the journal only leaves records behind that are skipped on the
+next load. A record that was only partly written when the program stopped is cut off the end of
+the journal.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from itertools import count
+
+from json import JSONDecodeError
+from json import dump
+from json import dumps
+from json import load
+from json import loads
+
+from os import fsync
+from os import replace
+from os.path import exists
+
+from typing import BinaryIO
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Tuple
+
+from types import NoneType
+
+# Local Imports
+from src.item import Item
+from src.item import as_items
+from src.item import serialise
+from src.operations import apply_operation
+from src.operations import apply_operations
+from src.pvector import PVector
+
+
+class Journal:
+    """
+    An append-only journal of operations with periodic snapshots, stored next to each other.
+
+    The snapshot is kept at `path` and the journal at `path` + ".journal". Use `load()` to read the
+    stored TODO list back before recording anything, and `close()` (or a `with` block) to make sure
+    every record has reached the disk.
+    """
+
+    def __init__(self, path: str, sync_every: int = 32, compact_every: int = 1024) -> NoneType:
+        self.path: str = path
+        self.journal_path: str = f"{path}.journal"
+        self.sync_every: int = sync_every
+        self.compact_every: int = compact_every
+
+        self._file: (BinaryIO | NoneType) = None
+        self._sequence: int = 0
+        self._unsynced: int = 0
+        self._since_snapshot: int = 0
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *_: object) -> NoneType:
+        self.close()
+
+    def _read_snapshot(self) -> Tuple[int, PVector[Item]]:
+        if not exists(self.path):
+            return 0, PVector()
+
+        with open(self.path, encoding="utf-8") as snapshot:
+            contents: Dict[str, object] = load(snapshot)
+
+        return contents["sequence"], PVector(as_items(contents["items"]))
+
+    def _write_snapshot(self, todo_list: PVector[Item]) -> NoneType:
+        with open(f"{self.path}.tmp", "w", encoding="utf-8") as snapshot:
+            dump({"sequence": self._sequence, "items": list(map(serialise, todo_list))}, snapshot)
+            snapshot.flush()
+            fsync(snapshot.fileno())
+
+        replace(f"{self.path}.tmp", self.path)
+
+    def _read_records(self, journal: BinaryIO) -> Iterator[Dict[str, object]]:
+        """
+        Read the records in the journal, cutting off a record that was only partly written.
+        """
+
+        for line in iter(journal.readline, b""):
+            try:
+                record: Dict[str, object] = loads(line) if line.endswith(b"\n") else None
+            except (JSONDecodeError, UnicodeDecodeError):
+                record = None
+
+            if record is None:
+                journal.truncate(journal.tell() - len(line))
+                return
+
+            yield record
+
+    def load(self) -> PVector[Item]:
+        """
+        Read the latest snapshot and replay the journal records written after it.
+
+        :returns: The stored TODO list, or an empty one if nothing has been stored yet.
+        :rtype: PVector[Item]
+        """
+
+        snapshot_sequence, todo_list = self._read_snapshot()
+
+        self._file = open(self.journal_path, "a+b")
+        self._file.seek(0)
+
+        tail: Tuple[Dict[str, object], ...] = tuple(filter(
+            lambda record: record["sequence"] > snapshot_sequence,
+            self._read_records(journal=self._file)
+        ))
+
+        self._file.seek(0, 2)
+        self._sequence = tail[-1]["sequence"] if tail else snapshot_sequence
+        self._since_snapshot = len(tail)
+
+        return apply_operations(
+            todo_list, map(lambda record: tuple(record["operation"]), tail)
+        )
+
+    def record(
+                self,
+                todo_list: PVector[Item],
+                operations: Iterable[Tuple]
+            ) -> PVector[Item]:
+        """
+        Write operations to the journal, given the TODO list they produced.
+
+        :param todo_list: The TODO list after the operations were applied, used for compaction.
+        :type todo_list: PVector[Item]
+
+        :param operations: The operations to write.
+        :type operations: Iterable[Tuple]
+
+        :returns: `todo_list`, unchanged.
+        :rtype: PVector[Item]
+        """
+
+        lines: Tuple[bytes, ...] = tuple(map(
+            lambda numbered: (
+                dumps({"sequence": numbered[0], "operation": list(numbered[1])}) + "\n"
+            ).encode("utf-8"),
+            zip(count(self._sequence + 1), operations)
+        ))
+
+        self._file.write(b"".join(lines))
+        self._sequence += len(lines)
+        self._unsynced += len(lines)
+        self._since_snapshot += len(lines)
+
+        if self._since_snapshot >= self.compact_every:
+            self.compact(todo_list=todo_list)
+        elif self._unsynced >= self.sync_every:
+            self.sync()
+
+        return todo_list
+
+    def step(
+                self,
+                todo_list: PVector[Item],
+                operation: Tuple
+            ) -> PVector[Item]:
+        """
+        Apply a single operation and journal it; a drop-in `step` for `apply_operations()`.
+
+        :param todo_list: The TODO list to apply the operation to.
+        :type todo_list: PVector[Item]
+
+        :param operation: The name of the operation followed by its arguments.
+        :type operation: Tuple
+
+        :returns: The updated TODO list.
+        :rtype: PVector[Item]
+        """
+        return self.record(todo_list=apply_operation(todo_list, operation), operations=(operation,))
+
+    def sync(self) -> NoneType:
+        """
+        Flush every record written so far to the disk.
+        """
+
+        self._file.flush()
+        fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def compact(self, todo_list: PVector[Item]) -> NoneType:
+        """
+        Write `todo_list` out as the new snapshot and empty the journal.
+
+        :param todo_list: The TODO list as of the latest record in the journal.
+        :type todo_list: PVector[Item]
+        """
+
+        self.sync()
+        self._write_snapshot(todo_list=todo_list)
+
+        self._file.truncate(0)
+        self.sync()
+        self._since_snapshot = 0
+
+    def close(self) -> NoneType:
+        """
+        Flush any records still waiting to be written and close the journal.
+        """
+
+        if self._file is not None and not self._file.closed:
+            self.sync()
+            self._file.close()
+
@@ -19,33 +19,103 @@ DEALINGS IN THE SOFTWARE.
 """
 
 # First Party Imports
-from copy import deepcopy
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from asyncio import run as run_coroutine
+
+from contextlib import nullcontext
+
+from datetime import date
 
 from inspect import signature
 from inspect import getmembers
 
-from json import dumps
+from itertools import accumulate
+from itertools import count
+from itertools import islice
+from itertools import repeat
 
+from sys import argv
 from sys import exit as close_program
 from sys import modules
+from sys import stdin
 
+from typing import Callable
 from typing import Dict
 from typing import List
+from typing import NamedTuple
 from typing import NoReturn
+from typing import Tuple
 
 from types import FunctionType
+from types import ModuleType
 from types import NoneType
 
 # Third Party Imports
 from funcs import raises
 
+# Local Imports
+from src.cli import open_storage
+from src.events import Change
+from src.events import INSERTED
+from src.events import REMOVED
+from src.events import STREAM
+from src.events import UPDATED
+from src.events import emit_change
+from src.events import from_record
+from src.history import DEFAULT_BUDGET
+from src.history import DEFAULT_LIMIT
+from src.history import History
+from src.item import Item
+from src.item import as_items
+from src.instrumentation import Instrumentation
+from src.instrumentation import active
+from src.instrumentation import measured
+from src.journal import Journal
+from src.operations import add
+from src.operations import changes
+from src.operations import edit
+from src.operations import edit_many
+from src.operations import mark_many
+from src.operations import position_of
+from src.operations import remove
+from src.operations import remove_many
+from src.operations import run_batch
+from src.operations import schedule
+from src.operations import selection
+from src.operations import toggle
+from src.pvector import PVector
+from src.render import PAGE_SIZE
+from src.render import render_row
+from src.render import render_viewport
+from src.render import stream_todo_list
+from src.replica import Replica
+from src.schedule import ScheduleIndex
+from src.schedule import parse_due
+from src.schedule import parse_priority
+from src.search import SearchIndex
+from src.server import serve
+from src.store import SqliteStore
+from src.strings import STRINGS
+from src.trace import TraceRecorder
+from src.trace import end_pass
+from src.trace import recorded
+from src.transfer import export_to
+from src.transfer import import_from
+from src.workspace import ListSession
+from src.workspace import Workspace
+from src.workspace import active as active_workspace
+
 
 def list_help(help_list: List[FunctionType], start: bool = False, help_item: int = 0) -> bool:
     """
     Print a list of functions as strings against the list position number for that item.
 
-    This function takes in a list of functions and sequentially iterates over that list using
-    recursion to print out each item in the list against the positional number in that list.
+    This function takes in a list of functions and iterates over that list (starting from
+    `help_item`) to print out each item in the list against the positional number in that list.
+    The printing is driven by `map()` rather than by recursion, so the stack depth stays the same
+    however long the help list is.
 
     The format for this is as follows:
         `Item Number (0, 1, 2, etc.) = Function Name (Add Item, Edit Item, etc.)`
@@ -61,41 +131,76 @@ def list_help(help_list: List[FunctionType], start: bool = False, help_item: int
     :param start: Whether or not the function is being run for the first time.
     :type start: bool = False
 
-    :param help_item: The current point we are at in the help_list.
+    :param help_item: The point in the help_list to start printing from.
     :type help_item: int = 0
 
-    :returns: False when having recursed through the `help_list`.
+    :returns: False when having printed the `help_list`.
     :rtype: bool
     """
 
     start = bool(print("Welcome to TODO. What would you like to do?") if start is True else False)
     help_item = int(bool(print("TODO - Help Menu"))) if help_item == 0 and not start else help_item
 
-    # Here we convert the name of the function, say ``
-    list_item = ' '.join(
-        map(lambda word : word.capitalize(), (help_list[help_item].__name__).split(sep='_')
+    # Here we convert the name of the function, say `add_item`, into "Add Item".
+    list_item = lambda this_function: ' '.join( # pylint: disable=unnecessary-lambda-assignment
+        map(lambda word : word.capitalize(), (this_function.__name__).split(sep='_'))
+    )
+
+    # `print()` returns None, so `any()` walks the whole help list and then returns False.
+    return any(map(
+        lambda numbered: print(f"{numbered[0]} = {list_item(numbered[1])}"),
+        enumerate(islice(help_list, help_item, None), start=help_item)
     ))
 
-    print(f"{help_item} = {list_item}")
 
-    return ( # The below code looks clearer with the brackets around help_item + 1.
-        list_help(help_list=help_list, help_item=(help_item + 1)) # pylint: disable=superfluous-parens
-        if help_item < (len(help_list) - 1)
-        else False
-    )
+def _prompt(text: str) -> str:
+    """
+    Ask the user for input, measuring the wait as a `prompt` phase when instrumentation is on and
+    keeping the answer when a trace is being recorded.
+
+    :param text: The prompt to show the user.
+    :type text: str
+
+    :returns: What the user entered.
+    :rtype: str
+    """
+    return recorded(measured("prompt", input, text))
+
+
+def _as_vector(
+            todo_list: List[Dict[str, (str | bool | NoneType)]]
+        ) -> PVector[Item]:
+    """
+    Get the TODO list as a persistent `PVector`.
+
+    Lists handed in from outside (the empty starting list, for instance) are converted once, items
+    and all, after which every operation returns a `PVector` of `Item`s and this is a no-op. Items
+    that don't have an ID yet are numbered by their position.
+
+    :param todo_list: The TODO list to convert.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :returns: The TODO list as a `PVector`.
+    :rtype: PVector[Item]
+    """
+    return todo_list if isinstance(todo_list, PVector) else PVector(as_items(todo_list))
 
 
 def add_item(
             todo_list: List[Dict[str, (str | bool | NoneType)]],
             item_to_edit: (int | NoneType) = None,
             toggle_completed: bool = False
-        ) -> List[Dict[str, (str | bool | NoneType)]]:
+        ) -> PVector[Item]:
     """
     Add an item to the TODO list.
 
     This function will add an item to the passed in TODO list and then return the updated TODO list.
 
-    Items added to the TODO list default to incomplete.
+    Items added to the TODO list default to incomplete and are given the next free ID. The user is
+    also asked for a priority and a due date for a new item, either of which can be left out.
+
+    The passed in TODO list is never modified. The returned version shares every untouched item
+    with it, so adding an item costs O(log n) rather than a copy of the whole list.
 
     ---
 
@@ -105,6 +210,9 @@ def add_item(
      - item_to_edit is None and toggle_completed -> error
      - item_to_edit is None and not toggle_completed -> add item to list
 
+    `item_to_edit` is the ID of the item. Edited and toggled items keep their place in the TODO
+    list, and asking to edit an item that isn't in the TODO list leaves it as it was.
+
     ---
 
     :param todo_list: The TODO list to add an item to.
@@ -113,7 +221,7 @@ def add_item(
     :raises: ValueError when item_to_edit is None and toggle_completed is True.
 
     :returns: The updated TODO list.
-    :rtype: List[Dict[str, (str | bool | NoneType)]]
+    :rtype: PVector[Item]
     """
 
     next_error: str = ("Invalid passed parameter set."
@@ -122,115 +230,216 @@ def add_item(
         + f"\ntoggle_completed {toggle_completed}"
     )
 
-    completed_status: bool = (
+    return_list: PVector[Item] = (
         raises(ValueError(next_error))()
         if item_to_edit is None and toggle_completed
-        else (False if item_to_edit is None else todo_list[item_to_edit].get("completed", False))
+        else _as_vector(todo_list)
     )
 
     # In the below case the code is not unreachable. This is a misunderstanding by PyLint.
-    return deepcopy(todo_list) + [{ # pylint: disable=unreachable
-        "title": (
-            todo_list[item_to_edit].get("title", None)
-            if toggle_completed
-            else str(input("Enter a title for the item in question.\n>>> "))
-        ),
-        "description": (
-            todo_list[item_to_edit].get("description", None)
-            if toggle_completed
-            else str(input("Enter a description for the item in question.\n>>> "))
-        ),
-        "completed": not bool(completed_status) if toggle_completed else completed_status
-    }]
+    return ( # pylint: disable=unreachable
+        return_list
+        if item_to_edit is not None and position_of(return_list, item_to_edit) is None
+        else emit_change(
+            before=return_list,
+            after=(
+                toggle(return_list, item_to_edit)
+                if toggle_completed
+                else (
+                    add(
+                        return_list,
+                        title=str(_prompt("Enter a title for the item in question.\n>>> ")),
+                        description=str(_prompt(
+                            "Enter a description for the item in question.\n>>> "
+                        )),
+                        priority=_get_priority(),
+                        due=_get_due()
+                    )
+                    if item_to_edit is None
+                    else edit(
+                        return_list,
+                        item_id=item_to_edit,
+                        title=str(_prompt("Enter a title for the item in question.\n>>> ")),
+                        description=str(_prompt(
+                            "Enter a description for the item in question.\n>>> "
+                        ))
+                    )
+                )
+            ),
+            kind=INSERTED if item_to_edit is None else UPDATED,
+            item_id=item_to_edit
+        )
+    )
+
+
+def _get_valid(text: str, parse: Callable[[str], object]) -> object:
+    """
+    Ask the user for a value until they enter one that `parse` can read.
+
+    As with `_get_item_number()`, the retries come from an endless `map()` over `count()` that
+    `filter()` stops at the first answer that could be read. If the input runs out, that's taken as
+    no value at all.
+
+    :param text: The prompt to show the user.
+    :type text: str
+
+    :param parse: Reads the answer, raising ValueError when it can't.
+    :type parse: Callable[[str], object]
+
+    :returns: The value `parse` read, or None if the input ran out.
+    :rtype: object
+    """
+
+    def attempt(_: int) -> Tuple[bool, object]:
+        try:
+            answer: str = str(_prompt(text))
+        except EOFError:
+            return True, None
+
+        try:
+            return True, parse(answer)
+        except ValueError as error:
+            return bool(print(error)), None
+
+    return next(filter(lambda answer: answer[0], map(attempt, count())))[1]
+
+
+def _get_priority() -> (int | NoneType):
+    """
+    Ask the user for the priority of an item, 1 being the highest, or nothing for none.
+    """
+    return _get_valid(
+        text="Enter a priority, 1 being the highest, or nothing for none.\n>>> ",
+        parse=parse_priority
+    )
+
+
+def _get_due() -> (str | NoneType):
+    """
+    Ask the user for the due date of an item, as `YYYY-MM-DD`, or nothing for none.
+    """
+    return _get_valid(
+        text="Enter a due date as YYYY-MM-DD, or nothing for none.\n>>> ", parse=parse_due
+    )
 
 
 def _get_item_number(operation: str = "", retry: bool = False) -> int:
     """
     Get the item number of the TODO list item to be operated on.
 
+    For the remove, edit and toggle operations this is the item's ID rather than its position.
+
+    The user is asked again until they enter only digits. The retries come from an endless
+    `map()` over `count()` that `filter()` stops at the first valid answer, so any number of bad
+    inputs is handled without growing the stack.
+
     :param operation: The operation that's being performed that's requesting an item number.
     :type operation: str = ""
 
+    :param retry: Whether the user has already been asked and entered something invalid.
+    :type retry: bool = False
+
     :returns: The number of the selected item.
     :rtype: int
     """
 
-    print("You may only enter digits.") if retry else False
-
-    next_prompt: str = ("" if operation not in ["remove", "edit", "toggle"] else (
-        f"Enter the number of the list item you want to {operation}."
+    next_prompt: str = ("" if operation not in ["remove", "edit", "toggle", "schedule"] else (
+        f"Enter the ID of the list item you want to {operation}."
     ))
 
-    item_number: str = input(prompt=f"{next_prompt}\n>>> ")
-
-    return (
-        int(item_number)
-        if item_number.isdigit()
-        else _get_item_number(operation=operation, retry=True)
-    )
+    return int(next(filter(
+        lambda item_number: item_number.isdigit(),
+        map(
+            lambda attempt: (
+                print("You may only enter digits.") if retry or attempt > 0 else False,
+                _prompt(f"{next_prompt}\n>>> ")
+            )[1],
+            count()
+        )
+    )))
 
 
 def remove_item(
             todo_list: List[Dict[str, (str | bool | NoneType)]],
             item_to_remove: (int | NoneType) = None,
-        ) -> List[Dict[str, (str | bool | NoneType)]]:
+        ) -> PVector[Item]:
     """
     Remove an item from the TODO list.
 
     This function will ask the user which item they want to remove from the passed in TODO list,
-    then update the TODO list and return the updated version.
+    by its ID, then update the TODO list and return the updated version.
+
+    Asking to remove an item that isn't in the TODO list leaves the TODO list as it was.
 
     :param todo_list: The TODO list to remove an item from.
     :type todo_list: List[Dict[str, (str | bool | NoneType)]]
 
     :returns: The updated TODO list.
-    :rtype: List[Dict[str, (str | bool | NoneType)]]
+    :rtype: PVector[Item]
     """
-
-    return_list: List[Dict[str, (str | bool | NoneType)]] = deepcopy(todo_list)
-
-    this_item_to_remove: (int | NoneType) = (
-        _get_item_number(operation="remove")
-        if item_to_remove is None
-        else item_to_remove
+    this_list: PVector[Item] = _as_vector(todo_list)
+    item_id: int = (
+        _get_item_number(operation="remove") if item_to_remove is None else item_to_remove
     )
 
-    return return_list[:this_item_to_remove] + (
-        return_list[(this_item_to_remove + 1):]
-        if (this_item_to_remove + 1) < len(return_list)
-        else []
+    return emit_change(
+        before=this_list, after=remove(this_list, item_id), kind=REMOVED, item_id=item_id
     )
 
 
 def edit_item(
             todo_list: List[Dict[str, (str | bool | NoneType)]],
             toggle_completed: bool = False
-        ) -> List[Dict[str, (str | bool | NoneType)]]:
+        ) -> PVector[Item]:
     """
     Edit an item in the TODO list.
 
     This function will ask the user which item they want to edit from the passed in TODO list,
-    then update the TODO list and return the updated version.
+    by its ID, then update the TODO list and return the updated version. The edited item keeps its
+    place in the TODO list.
 
     :param todo_list: The TODO list to edit an item in.
     :type todo_list: List[Dict[str, (str | bool | NoneType)]]
 
     :returns: The updated TODO list.
-    :rtype: List[Dict[str, (str | bool | NoneType)]]
+    :rtype: PVector[Item]
     """
-
-    item_to_edit: int = _get_item_number(operation=("edit" if not toggle_completed else "toggle"))
-
     return add_item(
-        todo_list=remove_item(todo_list=deepcopy(todo_list), item_to_remove=item_to_edit),
-        item_to_edit=item_to_edit,
+        todo_list=todo_list,
+        item_to_edit=_get_item_number(operation=("edit" if not toggle_completed else "toggle")),
         toggle_completed=toggle_completed
     )
 
 
+def schedule_item(todo_list: List[Dict[str, (str | bool | NoneType)]]) -> PVector[Item]:
+    """
+    Set the priority and due date of an item in the TODO list.
+
+    This function asks the user which item to change, by its ID, then for its new priority and due
+    date, either of which can be left empty to clear it. The item keeps its place in the TODO list.
+    Asking to change an item that isn't in the TODO list leaves the TODO list as it was.
+
+    :param todo_list: The TODO list to change an item in.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :returns: The updated TODO list.
+    :rtype: PVector[Item]
+    """
+
+    this_list: PVector[Item] = _as_vector(todo_list)
+    item_id: int = _get_item_number(operation="schedule")
+
+    return this_list if position_of(this_list, item_id) is None else emit_change(
+        before=this_list,
+        after=schedule(this_list, item_id, priority=_get_priority(), due=_get_due()),
+        kind=UPDATED,
+        item_id=item_id
+    )
+
+
 def checkoff_item(
             todo_list: List[Dict[str, (str | bool | NoneType)]]
-        ) -> List[Dict[str, (str | bool | NoneType)]]:
+        ) -> PVector[Item]:
     """
     Check off an item in the TODO list.
 
@@ -241,14 +450,14 @@ def checkoff_item(
     :type todo_list: List[Dict[str, (str | bool | NoneType)]]
 
     :returns: The updated TODO list.
-    :rtype: List[Dict[str, (str | bool | NoneType)]]
+    :rtype: PVector[Item]
     """
     return edit_item(todo_list=todo_list, toggle_completed=True)
 
 
 def uncheck_item(
             todo_list: List[Dict[str, (str | bool | NoneType)]]
-        ) -> List[Dict[str, (str | bool | NoneType)]]:
+        ) -> PVector[Item]:
     """
     Uncheck an item in the TODO list.
 
@@ -259,7 +468,7 @@ def uncheck_item(
     :type todo_list: List[Dict[str, (str | bool | NoneType)]]
 
     :returns: The updated TODO list.
-    :rtype: List[Dict[str, (str | bool | NoneType)]]
+    :rtype: PVector[Item]
     """
     return edit_item(todo_list=todo_list, toggle_completed=True)
 
@@ -268,7 +477,9 @@ def render_todo_list(todo_list: List[Dict[str, (str | bool | NoneType)]]) -> Non
     """
     Display the TODO list to the user.
 
-    This function prints the TODO list to the console.
+    This function prints the whole TODO list to the console as JSON. It's printed a row at a time
+    rather than built into one string first, and rows that were printed before are not serialised
+    again (see `src/render.py`).
 
     :param todo_list: The TODO list to check off an item from.
     :type todo_list: List[Dict[str, (str | bool | NoneType)]]
@@ -276,7 +487,490 @@ def render_todo_list(todo_list: List[Dict[str, (str | bool | NoneType)]]) -> Non
     :returns: None
     :rtype: NoneType
     """
-    return bool(print(str(dumps(todo_list, indent=4))))
+    return stream_todo_list(todo_list=todo_list)
+
+
+def export_items(todo_list: List[Dict[str, (str | bool | NoneType)]]) -> bool:
+    """
+    Export the TODO list to a file.
+
+    This function asks the user for a file name and writes every item to it, IDs and all, as CSV if
+    the name ends in `.csv` and as JSON Lines otherwise. The items are written one at a time as
+    they're converted (see `src/transfer.py`), so the export is never held in memory as a whole.
+
+    :param todo_list: The TODO list to export.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :returns: False once the TODO list has been exported, or the file couldn't be written.
+    :rtype: bool
+    """
+
+    path: str = str(_prompt("Enter the file to export the TODO list to.\n>>> "))
+
+    try:
+        export_to(todo_list=_as_vector(todo_list), path=path)
+    except OSError as error:
+        return bool(print(f"Could not export to {path}: {error.strerror}."))
+
+    return bool(print(f"Exported {len(todo_list)} items to {path}."))
+
+
+def import_items(
+            todo_list: List[Dict[str, (str | bool | NoneType)]]
+        ) -> (PVector[Item] | bool):
+    """
+    Import items from a file onto the end of the TODO list.
+
+    This function asks the user for a file written by Export Items (or by hand) and adds its items
+    to the end of the TODO list, with new IDs after the ones already in it. The file is read a line
+    at a time and the items are added all at once rather than one by one.
+
+    :param todo_list: The TODO list to add the items to.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :returns: The updated TODO list, or False if the file couldn't be read.
+    :rtype: (PVector[Item] | bool)
+    """
+
+    path: str = str(_prompt("Enter the file to import items from.\n>>> "))
+
+    try:
+        return import_from(todo_list=_as_vector(todo_list), path=path)
+    except OSError as error:
+        return bool(print(f"Could not import from {path}: {error.strerror}."))
+    except ValueError as error:
+        return bool(print(f"Could not import from {path}: {error}"))
+
+
+def search_items(
+            todo_list: List[Dict[str, (str | bool | NoneType)]],
+            search_index: SearchIndex
+        ) -> bool:
+    """
+    Search the titles and descriptions of the items in the TODO list.
+
+    This function asks the user for some words and prints every item whose title or description has
+    a word starting with each of them, so "buy mil" finds "Buy milk". The search is answered by the
+    session's `SearchIndex` rather than by reading through the TODO list.
+
+    :param todo_list: The TODO list to search.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :param search_index: The index of the words in the TODO list.
+    :type search_index: SearchIndex
+
+    :returns: False once the matching items have been printed.
+    :rtype: bool
+    """
+
+    return_list: PVector[Item] = _as_vector(todo_list)
+    found: Tuple[int, ...] = search_index.search(
+        query=str(_prompt("Enter the words to search for.\n>>> "))
+    )
+
+    print(f"Found {len(found)} items:")
+
+    return any(map(
+        lambda position: print(
+            f"{position} (ID {return_list[position].id}) = {render_row(item=return_list[position])}"
+        ),
+        map(lambda item_id: position_of(return_list, item_id), found)
+    ))
+
+
+def _print_items(todo_list: PVector[Item], item_ids: Tuple[int, ...]) -> bool:
+    """
+    Print items against their positions and IDs, in the order given.
+
+    :param todo_list: The TODO list the items are in.
+    :type todo_list: PVector[Item]
+
+    :param item_ids: The IDs of the items to print.
+    :type item_ids: Tuple[int, ...]
+
+    :returns: False once the items have been printed.
+    :rtype: bool
+    """
+    return any(map(
+        lambda position: print(
+            f"{position} (ID {todo_list[position].id}) = {render_row(item=todo_list[position])}"
+        ),
+        map(lambda item_id: position_of(todo_list, item_id), item_ids)
+    ))
+
+
+def next_up(
+            todo_list: List[Dict[str, (str | bool | NoneType)]],
+            schedule_index: ScheduleIndex
+        ) -> bool:
+    """
+    Show the incomplete items with a priority or a due date that should be done first.
+
+    Items are shown highest priority first, then earliest due date first. They come from the
+    session's `ScheduleIndex`, which keeps them in a heap, so showing a page of them doesn't sort,
+    or even read, the rest of the TODO list.
+
+    :param todo_list: The TODO list to show items from.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :param schedule_index: The index of the items by priority and due date.
+    :type schedule_index: ScheduleIndex
+
+    :returns: False once the items have been printed.
+    :rtype: bool
+    """
+
+    found: Tuple[int, ...] = schedule_index.next_up(count=PAGE_SIZE)
+
+    return bool(print(
+        "Nothing has a priority or a due date." if not found else f"Next up, {len(found)} items:"
+    )) or _print_items(todo_list=_as_vector(todo_list), item_ids=found)
+
+
+def overdue_items(
+            todo_list: List[Dict[str, (str | bool | NoneType)]],
+            schedule_index: ScheduleIndex
+        ) -> bool:
+    """
+    Show the incomplete items that were due before today, the longest overdue first.
+
+    As with Next Up, the items come from the session's `ScheduleIndex` rather than from sorting the
+    TODO list.
+
+    :param todo_list: The TODO list to show items from.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :param schedule_index: The index of the items by priority and due date.
+    :type schedule_index: ScheduleIndex
+
+    :returns: False once the items have been printed.
+    :rtype: bool
+    """
+
+    found: Tuple[int, ...] = schedule_index.overdue(
+        today=date.today().isoformat(), count=PAGE_SIZE
+    )
+
+    return bool(print(
+        "Nothing is overdue." if not found else f"{len(found)} items are overdue:"
+    )) or _print_items(todo_list=_as_vector(todo_list), item_ids=found)
+
+
+def undo(
+            todo_list: List[Dict[str, (str | bool | NoneType)]],
+            history: History
+        ) -> (PVector[Item] | bool):
+    """
+    Undo the latest change to the TODO list.
+
+    :param todo_list: The current TODO list.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :param history: The session's history of TODO list versions.
+    :type history: History
+
+    :returns: The TODO list as it was before the latest change, or False if there is none.
+    :rtype: (PVector[Item] | bool)
+    """
+
+    return (
+        history.undo(todo_list=_as_vector(todo_list))
+        if history.can_undo()
+        else bool(print("There is nothing to undo."))
+    )
+
+
+def redo(
+            todo_list: List[Dict[str, (str | bool | NoneType)]],
+            history: History
+        ) -> (PVector[Item] | bool):
+    """
+    Redo the change to the TODO list that was last undone.
+
+    :param todo_list: The current TODO list.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :param history: The session's history of TODO list versions.
+    :type history: History
+
+    :returns: The TODO list as it was before the latest undo, or False if there is none.
+    :rtype: (PVector[Item] | bool)
+    """
+
+    return (
+        history.redo(todo_list=_as_vector(todo_list))
+        if history.can_redo()
+        else bool(print("There is nothing to redo."))
+    )
+
+
+def stats() -> bool:
+    """
+    Show how many bytes sharing and compressing strings has saved, and how long each command and
+    each phase of the menu has taken so far.
+
+    The strings line counts the titles and descriptions that were shared with an equal one already
+    in memory and the long descriptions that were compressed (see `src/strings.py`). For every
+    phase this prints how many times it ran, its total wall and CPU time and the most memory a
+    single run of it allocated (see `src/instrumentation.py`). The phases are only measured when
+    the program was started with `--instrument`.
+
+    :returns: False once the totals have been printed.
+    :rtype: bool
+    """
+
+    instrumentation: (Instrumentation | NoneType) = active()
+
+    return STRINGS.report() or (
+        bool(print("Instrumentation is off. Start the program with --instrument PATH to use it."))
+        if instrumentation is None
+        else instrumentation.report()
+    )
+
+
+def _no_workspace() -> bool:
+    """
+    Tell the user the list commands need a workspace.
+
+    :returns: False, so it can be returned from a menu command.
+    :rtype: bool
+    """
+    return bool(print("There is no workspace. Start the program with --workspace DIR to use one."))
+
+
+def list_lists() -> bool:
+    """
+    Show the name of every list in the workspace.
+
+    The list in use is marked with `*` and the lists that are loaded, so switching to them doesn't
+    read anything from disk, with `+`.
+
+    :returns: False once the names have been printed.
+    :rtype: bool
+    """
+
+    workspace: (Workspace | NoneType) = active_workspace()
+
+    return _no_workspace() if workspace is None else any(map(
+        lambda name: print(
+            ("*" if name == workspace.current else ("+" if workspace.is_loaded(name) else " "))
+            + f" {name}"
+        ),
+        workspace.names()
+    ))
+
+
+def _open_list(
+            todo_list: List[Dict[str, (str | bool | NoneType)]],
+            search_index: SearchIndex,
+            history: History,
+            schedule_index: ScheduleIndex,
+            create: bool
+        ) -> (ListSession | bool):
+    """
+    Keep the list in use as it is now and open the list the user names in the active workspace.
+
+    :param todo_list: The list in use.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :param search_index: The index of the words in the list in use.
+    :type search_index: SearchIndex
+
+    :param history: The undo history of the list in use.
+    :type history: History
+
+    :param schedule_index: The index of the items in the list in use by priority and due date.
+    :type schedule_index: ScheduleIndex
+
+    :param create: Whether to make the list if it doesn't exist yet.
+    :type create: bool
+
+    :returns: The opened list, or False if there is no workspace or the list couldn't be opened.
+    :rtype: (ListSession | bool)
+    """
+
+    workspace: (Workspace | NoneType) = active_workspace()
+
+    if workspace is None:
+        return _no_workspace()
+
+    name: str = str(_prompt("Enter the name of the list.\n>>> ")).strip()
+
+    if create and name in workspace.names():
+        return bool(print(f"There is already a list called {name}."))
+
+    workspace.keep(
+        todo_list=_as_vector(todo_list),
+        search_index=search_index,
+        history=history,
+        schedule_index=schedule_index
+    )
+
+    try:
+        return workspace.open(name=name, create=create)
+    except ValueError as error:
+        return bool(print(error))
+
+
+def new_list(
+            todo_list: List[Dict[str, (str | bool | NoneType)]],
+            search_index: SearchIndex,
+            history: History,
+            schedule_index: ScheduleIndex
+        ) -> (ListSession | bool):
+    """
+    Make a new, empty list in the workspace and switch to it.
+
+    :param todo_list: The list in use.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :param search_index: The index of the words in the list in use.
+    :type search_index: SearchIndex
+
+    :param history: The undo history of the list in use.
+    :type history: History
+
+    :param schedule_index: The index of the items in the list in use by priority and due date.
+    :type schedule_index: ScheduleIndex
+
+    :returns: The new list, or False if there is no workspace or the name is taken or not valid.
+    :rtype: (ListSession | bool)
+    """
+    return _open_list(
+        todo_list=todo_list,
+        search_index=search_index,
+        history=history,
+        schedule_index=schedule_index,
+        create=True
+    )
+
+
+def switch_list(
+            todo_list: List[Dict[str, (str | bool | NoneType)]],
+            search_index: SearchIndex,
+            history: History,
+            schedule_index: ScheduleIndex
+        ) -> (ListSession | bool):
+    """
+    Switch to another list in the workspace.
+
+    The list in use is kept loaded, with its indexes and undo history, and switching to a list
+    that's still loaded reads nothing from disk (see `src/workspace.py`).
+
+    :param todo_list: The list in use.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :param search_index: The index of the words in the list in use.
+    :type search_index: SearchIndex
+
+    :param history: The undo history of the list in use.
+    :type history: History
+
+    :param schedule_index: The index of the items in the list in use by priority and due date.
+    :type schedule_index: ScheduleIndex
+
+    :returns: The list switched to, or False if there is no workspace or no list by that name.
+    :rtype: (ListSession | bool)
+    """
+    return _open_list(
+        todo_list=todo_list,
+        search_index=search_index,
+        history=history,
+        schedule_index=schedule_index,
+        create=False
+    )
+
+
+# What Update Many Items can do to the selected items, by the word the user enters for it.
+_BULK_ACTIONS: Dict[str, Callable[[PVector[Item], str], PVector[Item]]] = {
+    "check": lambda todo_list, selected: mark_many(todo_list, selected, True),
+    "uncheck": lambda todo_list, selected: mark_many(todo_list, selected, False),
+    "remove": remove_many,
+    "edit": lambda todo_list, selected: edit_many(
+        todo_list,
+        selected,
+        title=str(_prompt("Enter a new title, or nothing to keep each item's own.\n>>> ")),
+        description=str(_prompt(
+            "Enter a new description, or nothing to keep each item's own.\n>>> "
+        ))
+    ),
+}
+
+
+def update_many_items(
+            todo_list: List[Dict[str, (str | bool | NoneType)]]
+        ) -> (PVector[Item] | bool):
+    """
+    Check off, uncheck, remove or edit many items in the TODO list at once.
+
+    This function asks the user which items to change - a range of IDs such as `3-10`, a list of
+    IDs such as `1,4,7`, `all`, `completed`, `incomplete`, or `title:` followed by a pattern to
+    look for in the titles - and then what to do to them. Every selected item is changed in a
+    single pass over the TODO list, which builds one new version of it, so clearing out 500
+    completed items is one command rather than 500.
+
+    :param todo_list: The TODO list to change items in.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :returns: The updated TODO list, or False if the selection or the action wasn't understood.
+    :rtype: (PVector[Item] | bool)
+    """
+
+    return_list: PVector[Item] = _as_vector(todo_list)
+    selected: str = str(_prompt(
+        "Enter the items to update: an ID range (3-10), IDs (1,4,7), all, completed, incomplete"
+        + " or title:PATTERN.\n>>> "
+    ))
+    action: str = str(_prompt("Enter check, uncheck, remove or edit.\n>>> ")).strip().lower()
+
+    try:
+        matches: Callable[[Item], bool] = selection(text=selected)
+    except ValueError as error:
+        return bool(print(error))
+
+    return (
+        bool(print("That is not an option."))
+        if action not in _BULK_ACTIONS
+        else (
+            print(f"{sum(map(matches, return_list))} items selected.")
+            or _BULK_ACTIONS[action](return_list, selected)
+        )
+    )
+
+
+# Which items View Items shows, by the word the user enters for them.
+_VIEWS: Dict[str, (bool | NoneType)] = {"all": None, "completed": True, "incomplete": False}
+
+
+def view_items(todo_list: List[Dict[str, (str | bool | NoneType)]]) -> bool:
+    """
+    Page through the TODO list, or only through its completed or incomplete items.
+
+    This function asks the user which items to show and where to start, and prints a page of them
+    against their positions and IDs. Counting and finding the completed or incomplete items uses the
+    counts kept in the `PVector`, so it doesn't read the items that aren't shown.
+
+    :param todo_list: The TODO list to view.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :returns: False once the page has been printed, or if the input wasn't understood.
+    :rtype: bool
+    """
+
+    view: str = str(_prompt("Enter all, completed or incomplete.\n>>> ")).strip().lower()
+    start: str = str(_prompt(
+        "Enter how many of those items to skip, or nothing for the last page.\n>>> "
+    )).strip()
+
+    return (
+        bool(print("That is not an option."))
+        if view not in _VIEWS or not (start == "" or start.isdigit())
+        else render_viewport(
+            todo_list=_as_vector(todo_list),
+            start=int(start) if start else None,
+            completed=_VIEWS[view]
+        )
+    )
 
 
 def exit_the_program() -> NoReturn:
@@ -289,63 +983,690 @@ def exit_the_program() -> NoReturn:
     return "Exit the program."
 
 
-def main(start: bool, todo_list: List[Dict[str, (str | bool | NoneType)]]) -> None:
+class _Command(NamedTuple):
     """
-    Main function to allow the user to select which operation in the TODO list.
+    A single entry in the command registry.
+
+    `arguments` holds the names of the session values (see `_SESSION_ARGUMENTS`) that the command's
+    function takes, worked out once when the registry is built so dispatching a command doesn't need
+    to inspect the function again.
+    """
+
+    number: int
+    name: str
+    function: FunctionType
+    arguments: Tuple[str, ...]
+
+
+# The values from the running session that a command can ask for by naming a parameter after them.
+_SESSION_ARGUMENTS: Tuple[str, ...] = (
+    "todo_list", "help_list", "search_index", "history", "schedule_index"
+)
+
+
+def _build_command_registry(module: ModuleType) -> Tuple[_Command, ...]:
+    """
+    Build the menu's command registry from the public functions of a module.
 
-    `help_list` is generated by filtering down the list of functions in the module (retrieved using
-    the `getmembers()` function - the iterable for this `filter()` operation) such that it removes
-    any private functions.
+    The commands are collected by filtering down the list of functions in the module (retrieved
+    using the `getmembers()` function - the iterable for this `filter()` operation) such that it
+    removes any private functions.
 
     This is selected by checking if the function is a dunder (Python's equivalent of private
     functions operating on "a gentleman's agreement" to not call them outside of the declaring
-    module) function or if the function is this main function. That's done by checking if the
-    function stats with two underscores or if its name is "main".
+    module) function or if the function is the main function. That's done by checking if the
+    function starts with an underscore or if its name is "main".
 
-    We then generate the iterable for the filter by calling the `getmembers()` function to get the
-    members list. We use a predicate that limits what's collected to functions in the module so we
-    don't end up collecting globals or the like.
+    We generate the iterable for the filter by calling the `getmembers()` function with a predicate
+    that limits what's collected to functions in the module so we don't end up collecting globals
+    or the like. This only happens once, when the module is imported.
 
-    :param start: Whether or not the function is being run for PyMonadthe first time.
-    :type start: bool = False
+    :param module: The module to collect the commands from.
+    :type module: ModuleType
 
-    :param todo_list: The TODO list to check off an item from.
+    :returns: The commands, numbered in the order they're shown in the help menu.
+    :rtype: Tuple[_Command, ...]
+    """
+
+    return tuple(map(
+        lambda numbered: _Command(
+            number=numbered[0],
+            name=numbered[1][0],
+            function=numbered[1][1],
+            arguments=tuple(filter(
+                lambda parameter: parameter in _SESSION_ARGUMENTS,
+                signature(obj=numbered[1][1]).parameters
+            ))
+        ),
+        enumerate(filter(
+            lambda member: not(member[0].startswith("_") or member[0] == "main"),
+            getmembers(
+                object=module,
+                predicate=lambda this_object: (
+                    isinstance(this_object, FunctionType)
+                    and this_object.__module__ == module.__name__
+                )
+            )
+        ))
+    ))
+
+
+def _dispatch(
+            command: (_Command | NoneType),
+            session: Dict[str, object]
+        ) -> (bool | str | PVector[Item]):
+    """
+    Call a command from the registry with the session values it asks for.
+
+    :param command: The command to run, or None if the user picked something that isn't a command.
+    :type command: (_Command | NoneType)
+
+    :param session: The session values commands can ask for, keyed by parameter name.
+    :type session: Dict[str, object]
+
+    :returns: Whatever the command returned, or False if there was no such command.
+    :rtype: (bool | str | PVector[Item])
+    """
+
+    return (
+        bool(print("That is not an option."))
+        if command is None
+        else command.function(**{argument: session[argument] for argument in command.arguments})
+    )
+
+
+# The state each pass of the menu hands on to the next.
+_State = Tuple[bool, PVector[Item], (Journal | NoneType), SearchIndex, History, ScheduleIndex]
+
+
+def _record_change(
+            before: PVector[Item],
+            after: PVector[Item],
+            journal: (Journal | NoneType),
+            search_index: SearchIndex,
+            history: History,
+            schedule_index: ScheduleIndex
+        ) -> PVector[Item]:
+    """
+    Bring the journal, search index, undo history, schedule index and every subscriber to the change
+    stream up to date with a change to the TODO list.
+
+    The changes are the ones the command emitted (see `src/events.py`), so nothing has to compare
+    the two versions, unless the command didn't emit any, in which case they're worked out by
+    `changes()`.
+
+    :param before: The TODO list before the change.
+    :type before: PVector[Item]
+
+    :param after: The TODO list after the change, which is `before` itself if nothing changed.
+    :type after: PVector[Item]
+
+    :param journal: The journal to record the change in, if any.
+    :type journal: (Journal | NoneType)
+
+    :param search_index: The index of the words in the TODO list.
+    :type search_index: SearchIndex
+
+    :param history: The versions of the TODO list that can be undone.
+    :type history: History
+
+    :param schedule_index: The index of the items by priority and due date.
+    :type schedule_index: ScheduleIndex
+
+    :returns: The TODO list after the change.
+    :rtype: PVector[Item]
+    """
+
+    emitted: (Tuple[Change, ...] | NoneType) = STREAM.take(before=before, after=after)
+    events: Tuple[Change, ...] = () if after is before else (
+        emitted
+        if emitted is not None
+        else tuple(map(from_record, changes(before=before, after=after)))
+    )
+    records: Tuple[Tuple, ...] = tuple(map(Change.as_record, events))
+
+    search_index.apply(records=records)
+    schedule_index.apply(records=records)
+    history.record(before=before, after=after)
+    STREAM.publish(changes=events)
+
+    return after if journal is None else journal.record(todo_list=after, operations=records)
+
+
+def _main_step(
+            start: bool,
+            todo_list: List[Dict[str, (str | bool | NoneType)]],
+            journal: (Journal | NoneType) = None,
+            search_index: (SearchIndex | NoneType) = None,
+            history: (History | NoneType) = None,
+            schedule_index: (ScheduleIndex | NoneType) = None
+        ) -> (int | _State):
+    """
+    Run a single pass of the main menu.
+
+    The selected option is looked up in `_DISPATCH_TABLE`, which was built once at import time, so
+    choosing a command is a dictionary lookup rather than a fresh round of introspection.
+
+    Only a summary and the last page of the TODO list are shown before each prompt; the Render Todo
+    List command prints the whole thing.
+
+    When a command changes the TODO list, the old version is kept in the undo history, and the
+    operations that turn the old TODO list into the new one are applied to the search index and,
+    if there is one, written to the journal before the next pass. When a command switches to another
+    list in the workspace, the next pass carries on with that list, its journal, search index, undo
+    history and schedule index instead.
+
+    With `--instrument`, the viewport (`render`), picking a command (`choose`), the command itself
+    and bringing everything up to date with its change (`record`) are each measured as a phase.
+
+    :param start: Whether or not this is the first pass of the program.
+    :type start: bool
+
+    :param todo_list: The TODO list to operate on.
     :type todo_list: List[Dict[str, (str | bool | NoneType)]]
 
-    :returns: None
-    :rtype: NoneType
+    :param journal: The journal to record changes to the TODO list in, if any.
+    :type journal: (Journal | NoneType) = None
+
+    :param search_index: The index of the words in the TODO list, built afresh if not given.
+    :type search_index: (SearchIndex | NoneType) = None
+
+    :param history: The versions of the TODO list that can be undone, started afresh if not given.
+    :type history: (History | NoneType) = None
+
+    :param schedule_index: The index of the items by priority and due date, built afresh if not
+        given.
+    :type schedule_index: (ScheduleIndex | NoneType) = None
+
+    :returns: 0 once the user chooses to exit, otherwise the state for the next pass.
+    :rtype: (int | _State)
     """
 
-    help_list: List[FunctionType] = filter(
-        lambda this_function: not(
-            bool(this_function.__name__.startswith("__"))
-            or bool(this_function.__name__.startswith("_"))
-            or this_function.__name__ == "main"
+    this_list: PVector[Item] = _as_vector(todo_list)
+    this_index: SearchIndex = (
+        SearchIndex(todo_list=this_list) if search_index is None else search_index
+    )
+    this_history: History = History() if history is None else history
+    this_schedule_index: ScheduleIndex = (
+        ScheduleIndex(todo_list=this_list) if schedule_index is None else schedule_index
+    )
+
+    measured("render", render_viewport, todo_list=this_list)
+    next_start: bool = list_help(help_list=_HELP_LIST, start=start) if start is True else False
+
+    command: (_Command | NoneType) = _DISPATCH_TABLE.get(measured("choose", _get_item_number))
+    return_value: (bool | str | PVector[Item] | ListSession) = measured(
+        "unknown" if command is None else command.name,
+        _dispatch,
+        command=command,
+        session={
+            "todo_list": todo_list,
+            "help_list": _HELP_LIST,
+            "search_index": this_index,
+            "history": this_history,
+            "schedule_index": this_schedule_index
+        }
+    )
+
+    next_list: PVector[Item] = (
+        _as_vector(return_value)
+        if not isinstance(return_value, (bool, str, NoneType, ListSession))
+        else this_list
+    )
+
+    if isinstance(return_value, ListSession):
+        return (
+            next_start,
+            return_value.todo_list,
+            return_value.journal,
+            return_value.search_index,
+            return_value.history,
+            return_value.schedule_index
+        )
+
+    return (0 if return_value == "Exit the program." else (
+        next_start,
+        measured(
+            "record", _record_change,
+            before=this_list,
+            after=next_list,
+            journal=journal,
+            search_index=this_index,
+            history=this_history,
+            schedule_index=this_schedule_index
         ),
-        getmembers(
-            object=modules[__name__],
-            predicate=lambda this_object: (
-                isinstance(this_object, FunctionType)
-                and this_object.__module__ == __name__
+        journal,
+        this_index,
+        this_history,
+        this_schedule_index
+    ))
+
+
+def main(
+            start: bool,
+            todo_list: List[Dict[str, (str | bool | NoneType)]],
+            journal: (Journal | NoneType) = None,
+            history: (History | NoneType) = None,
+            search_index: (SearchIndex | NoneType) = None,
+            schedule_index: (ScheduleIndex | NoneType) = None
+        ) -> int:
+    """
+    Main function to allow the user to select which operation in the TODO list.
+
+    Each pass of the menu is handled by `_main_step()`, which returns either the state for the next
+    pass or 0 once the user has chosen to exit. Rather than recursing into itself, `main` folds
+    `_main_step()` over an endless stream with `accumulate()` and stops at the first 0.
+
+    `accumulate()` only ever holds on to the latest state, so the stack depth stays constant
+    however long the session runs, and the TODO list versions from earlier passes can be garbage
+    collected as soon as the next pass has replaced them - apart from the ones kept in `history`
+    for undo.
+
+    :param start: Whether or not the function is being run for the first time.
+    :type start: bool = False
+
+    :param todo_list: The TODO list to start with.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :param journal: The journal to record changes to the TODO list in, if any.
+    :type journal: (Journal | NoneType) = None
+
+    :param history: The versions of the TODO list that can be undone, started afresh if not given.
+    :type history: (History | NoneType) = None
+
+    :param search_index: The index of the words in the TODO list, built afresh if not given.
+    :type search_index: (SearchIndex | NoneType) = None
+
+    :param schedule_index: The index of the items by priority and due date, built afresh if not
+        given.
+    :type schedule_index: (ScheduleIndex | NoneType) = None
+
+    :returns: 0 once the user exits the program.
+    :rtype: int
+    """
+
+    return next(filter(
+        lambda state: isinstance(state, int),
+        accumulate(
+            repeat(None),
+            lambda state, _: end_pass(_main_step(*state)),
+            initial=(
+                start, _as_vector(todo_list), journal, search_index, history, schedule_index
             )
         )
+    ))
+
+
+_COMMANDS: Tuple[_Command, ...] = _build_command_registry(module=modules[__name__])
+
+_HELP_LIST: Tuple[FunctionType, ...] = tuple(map(lambda command: command.function, _COMMANDS))
+
+# Every command can be looked up by both its menu number and its function name.
+_DISPATCH_TABLE: Dict[(int | str), _Command] = {
+    **{command.number: command for command in _COMMANDS},
+    **{command.name: command for command in _COMMANDS}
+}
+
+
+def _parse_arguments(arguments: List[str]) -> Namespace:
+    """
+    Parse the command line arguments the program was started with.
+
+    :param arguments: The command line arguments, not including the program name.
+    :type arguments: List[str]
+
+    :returns: The parsed arguments.
+    :rtype: Namespace
+    """
+
+    parser: ArgumentParser = ArgumentParser(
+        prog="todo", description="A TODO list written in the functional programming paradigm."
+    )
+
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help=(
+            "Apply a script of add/remove/edit/toggle operations, one per line, without prompting"
+            + " and print the final TODO list. Use - to read the script from stdin."
+        )
     )
 
-    render_todo_list(todo_list=todo_list)
-    next_start: bool = list_help(help_list=help_list, start=start) if start is True else False
-    selected_option: int = _get_item_number()
+    parser.add_argument(
+        "--serve",
+        metavar="ADDRESS",
+        help=(
+            "Share the TODO list with many clients over a line-based protocol (see"
+            + " src/server.py), listening on HOST:PORT or the path of a Unix socket."
+        )
+    )
 
-    return_value: (bool | List[Dict[str, (str | bool | NoneType)]]) = help_list[selected_option]( # pylint: disable=unsubscriptable-object
-        *map( # pylint: disable=unsubscriptable-object
-            lambda attribute : getattr(main, attribute),
-            signature(obj=help_list[selected_option]).format() # pylint: disable=unsubscriptable-object
+    parser.add_argument(
+        "--history",
+        metavar="N",
+        type=int,
+        default=DEFAULT_LIMIT,
+        help=f"How many changes can be undone. Defaults to {DEFAULT_LIMIT}."
+    )
+
+    parser.add_argument(
+        "--history-budget",
+        metavar="MB",
+        type=int,
+        default=DEFAULT_BUDGET // (1024 * 1024),
+        help=(
+            "Roughly how many megabytes of old versions the undo history can hold on to before the"
+            + f" oldest are dropped. Defaults to {DEFAULT_BUDGET // (1024 * 1024)}."
         )
     )
 
-    return (0 if return_value == "Exit the program." else main(start=next_start, todo_list=(
-        return_value if not isinstance(return_value, bool) else deepcopy(todo_list)
-    )))
+    parser.add_argument(
+        "--instrument",
+        metavar="PATH",
+        help=(
+            "Time every command and phase of the menu, show the totals with the Stats command and"
+            + " write them to PATH as JSON on exit."
+        )
+    )
+
+    parser.add_argument(
+        "--record-trace",
+        metavar="PATH",
+        help=(
+            "Write everything entered into the menu to PATH, one JSON line per pass, for"
+            + " benchmarks/bench_replay.py to replay."
+        )
+    )
+
+    parser.add_argument(
+        "--file",
+        metavar="PATH",
+        help=(
+            "Load the TODO list from PATH and save every change to it. PATHs ending in .db, .sqlite"
+            + " or .sqlite3 are SQLite databases, PATHs ending in .replica are replicas that can"
+            + " be synced with --sync-export and --sync-merge and PATHs ending in .archive are"
+            + " binary archives read lazily; anything else is stored as a"
+            + " snapshot at PATH plus a journal of later changes at PATH.journal."
+        )
+    )
+
+    parser.add_argument(
+        "--workspace",
+        metavar="DIR",
+        help=(
+            "Keep many named TODO lists in DIR, one NAME.json snapshot and journal each, and move"
+            + " between them with the Switch List, New List and List Lists commands."
+        )
+    )
+
+    parser.add_argument(
+        "--list",
+        metavar="NAME",
+        default="todo",
+        help="With --workspace, the list to start with, made if need be. Defaults to todo."
+    )
+
+    parser.add_argument(
+        "--workspace-budget",
+        metavar="MB",
+        type=int,
+        default=64,
+        help=(
+            "With --workspace, roughly how many megabytes of lists to keep loaded before the least"
+            + " recently used are dropped from memory. Defaults to 64."
+        )
+    )
+
+    parser.add_argument(
+        "--sync-export",
+        metavar="PATH",
+        help="Write the changes in the --file replica that a peer hasn't seen to PATH and exit."
+    )
+
+    parser.add_argument(
+        "--since",
+        metavar="PATH",
+        help=(
+            "With --sync-export, only export what's changed since the peer exported the delta at"
+            + " PATH. Without it, every item is exported."
+        )
+    )
+
+    parser.add_argument(
+        "--sync-merge",
+        metavar="PATH",
+        help="Merge a delta exported by another replica into the --file replica and exit."
+    )
+
+    options: Namespace = parser.parse_args(arguments)
+
+    if (options.sync_export or options.sync_merge) and not str(options.file).endswith(".replica"):
+        parser.error("--sync-export and --sync-merge need a --file ending in .replica")
+
+    if options.workspace is not None and any(map(
+        lambda option: option is not None,
+        (options.file, options.batch, options.serve, options.sync_export, options.sync_merge)
+    )):
+        parser.error("--workspace can't be used with --file, --batch, --serve or the sync options")
+
+    return options
+
+
+def _run_batch(path: str, journal: (Journal | NoneType) = None) -> int:
+    """
+    Run a batch script from a file (or stdin when `path` is "-") and print the final TODO list.
+
+    :param path: The path of the batch script, or "-" for stdin.
+    :type path: str
+
+    :param journal: The journal to load the TODO list from and record each operation in, if any.
+    :type journal: (Journal | NoneType) = None
+
+    :returns: 0 once the TODO list has been printed, or 1 if a line of the script couldn't be
+        parsed, in which case nothing in the script is applied.
+    :rtype: int
+    """
+
+    with (nullcontext(stdin) if path == "-" else open(path, encoding="utf-8")) as script:
+        try:
+            todo_list: PVector[Item] = (
+                run_batch(lines=script)
+                if journal is None
+                else run_batch(lines=script, todo_list=journal.load(), step=journal.step)
+            )
+        except ValueError as error:
+            print(error)
+            return 1
+
+    return int(render_todo_list(todo_list=todo_list))
+
+
+def _run_server(address: str, journal: (Journal | NoneType) = None) -> int:
+    """
+    Serve the TODO list to clients at `address` until the program is interrupted.
+
+    :param address: `HOST:PORT` or the path of a Unix socket.
+    :type address: str
+
+    :param journal: The journal to load the TODO list from and record each change in, if any.
+    :type journal: (Journal | NoneType) = None
+
+    :returns: 0 once the server has been stopped.
+    :rtype: int
+    """
+
+    try:
+        run_coroutine(serve(
+            address=address,
+            todo_list=() if journal is None else journal.load(),
+            journal=journal
+        ))
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+def _run_sync(
+            replica: Replica,
+            export_path: (str | NoneType),
+            since: (str | NoneType),
+            merge_path: (str | NoneType)
+        ) -> int:
+    """
+    Merge a delta from another replica into `replica` and/or export a delta for one.
+
+    A merge is done first, so a single run can take in a peer's changes and pass them on.
+
+    :param replica: The replica to sync.
+    :type replica: Replica
+
+    :param export_path: Where to write the delta to, if anywhere.
+    :type export_path: (str | NoneType)
+
+    :param since: A delta from the peer saying what it has already seen, if any.
+    :type since: (str | NoneType)
+
+    :param merge_path: The delta to merge in, if any.
+    :type merge_path: (str | NoneType)
+
+    :returns: 0 once the replica has been synced.
+    :rtype: int
+    """
+
+    replica.load()
+
+    if merge_path is not None:
+        print(f"Merged {replica.merge_delta(path=merge_path)} changed items from {merge_path}.")
+
+    if export_path is not None:
+        print(
+            f"Exported {replica.export_delta(path=export_path, since=since)} items"
+            + f" to {export_path}."
+        )
+
+    return 0
+
+
+def _storage(path: (str | NoneType)) -> (Journal | SqliteStore | Replica | nullcontext):
+    """
+    Get the storage for the TODO list at `path`, picked by its extension (see `open_storage()`).
+
+    :param path: Where the TODO list is stored, or None to not store it at all.
+    :type path: (str | NoneType)
+
+    :returns: A `SqliteStore` for database files, a `Replica` for `.replica` files, a `Journal` for
+        anything else, or a context that gives None when there's no path.
+    :rtype: (Journal | SqliteStore | Replica | nullcontext)
+    """
+    return open_storage(path=path)
+
+
+def _run_workspace(
+            directory: str,
+            name: str,
+            budget: int,
+            history_limit: int,
+            history_budget: int
+        ) -> int:
+    """
+    Run the menu over a workspace of named lists, starting with the list `name`.
+
+    :param directory: The directory the lists are kept in.
+    :type directory: str
+
+    :param name: The list to start with, made if it doesn't exist yet.
+    :type name: str
+
+    :param budget: Roughly how many megabytes of lists to keep loaded.
+    :type budget: int
+
+    :param history_limit: How many changes to each list can be undone.
+    :type history_limit: int
+
+    :param history_budget: Roughly how many megabytes each list's undo history can hold on to.
+    :type history_budget: int
+
+    :returns: 0 once the user exits the program.
+    :rtype: int
+    """
+
+    with Workspace(
+        directory=directory,
+        budget=budget * 1024 * 1024,
+        history_limit=history_limit,
+        history_budget=history_budget * 1024 * 1024
+    ) as workspace, workspace.activate():
+        session: ListSession = workspace.open(name=name, create=True)
+
+        return main(
+            start=True,
+            todo_list=session.todo_list,
+            journal=session.journal,
+            history=session.history,
+            search_index=session.search_index,
+            schedule_index=session.schedule_index
+        )
+
+
+def _run(arguments: List[str]) -> int:
+    """
+    Start the program in the mode selected by the command line arguments.
+
+    :param arguments: The command line arguments, not including the program name.
+    :type arguments: List[str]
+
+    :returns: The exit code for the program.
+    :rtype: int
+    """
+
+    options: Namespace = _parse_arguments(arguments=arguments)
+
+    with (
+        _storage(path=options.file)
+    ) as journal, (
+        nullcontext() if options.instrument is None
+        else Instrumentation().activate(save_to=options.instrument)
+    ), (
+        nullcontext() if options.record_trace is None
+        else TraceRecorder().activate(path=options.record_trace)
+    ):
+        return (
+            _run_sync(
+                replica=journal,
+                export_path=options.sync_export,
+                since=options.since,
+                merge_path=options.sync_merge
+            )
+            if options.sync_export is not None or options.sync_merge is not None
+            else (
+                _run_batch(path=options.batch, journal=journal)
+                if options.batch is not None
+                else (
+                    _run_server(address=options.serve, journal=journal)
+                    if options.serve is not None
+                    else (
+                        main(
+                            start=True,
+                            todo_list=[] if journal is None else journal.load(),
+                            journal=journal,
+                            history=History(
+                                limit=options.history, budget=options.history_budget * 1024 * 1024
+                            )
+                        )
+                        if options.workspace is None
+                        else _run_workspace(
+                            directory=options.workspace,
+                            name=options.list,
+                            budget=options.workspace_budget,
+                            history_limit=options.history,
+                            history_budget=options.history_budget
+                        )
+                    )
+                )
+            )
+        )
 
 
 if __name__ == "__main__": # pragma: no cover
-    close_program(main(start=True, todo_list=[]))
+    close_program(_run(arguments=argv[1:]))
@@ -0,0 +1,833 @@
+"""
+Pure, prompt-free versions of the TODO list operations.
+
+The functions in `src/main.py` ask the user for everything they need through `input()`. The
+functions in here take those values as arguments instead, which lets a whole script of operations
+be applied in one pass without a single prompt - that's what batch mode is built on.
+
+Each operation is described by a tuple of its name followed by its arguments, for example
+`("add", "Title", "Description")` or `("toggle", 3)`, where items are picked by their ID (see
+`src/item.py`). A batch script is one operation per line written the same way, with shell-style
+quoting:
+
+    add "Buy milk" "Two litres, semi-skimmed"
+    toggle 0
+    edit 0 "Buy oat milk" "One litre"
+    remove 0
+    append "Buy bread" "Wholemeal" true
+    replace 1 "Buy rye bread" "Sliced" false
+    schedule 1 2 2026-11-01
+
+`schedule` sets an item's priority and due date, either of which can be "" for none.
+
+The bulk operations change every item picked out by a selection (see `selection()`) in one pass:
+
+    mark_many 3-10 true
+    edit_many title:^buy "" "From the corner shop"
+    remove_many completed
+
+Blank lines and lines starting with `#` are ignored.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from functools import reduce
+
+from itertools import islice
+
+from re import IGNORECASE
+from re import Pattern
+from re import compile as compile_pattern
+from re import error as PatternError
+
+from shlex import split
+
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+from types import NoneType
+
+# Local Imports
+from src.item import Item
+from src.item import as_items
+from src.item import schedule_of
+from src.pvector import PVector
+from src.schedule import parse_due
+from src.schedule import parse_priority
+
+
+def position_of(todo_list: PVector[Item], item_id: int) -> (int | NoneType):
+    """
+    Find the position of the item with the given ID.
+
+    A TODO list is always sorted by ID (see `src/item.py`), so this is a binary search over the
+    `PVector` and takes O(log n) in whichever version of the TODO list it's asked about.
+
+    :param todo_list: The TODO list to search.
+    :type todo_list: PVector[Item]
+
+    :param item_id: The ID of the item to find.
+    :type item_id: int
+
+    :returns: The position of the item, or None if there is no item with that ID.
+    :rtype: (int | NoneType)
+    """
+
+    position: int = todo_list.bisect_left(item_id, key=lambda item: item.id)
+
+    return position if position < len(todo_list) and todo_list[position].id == item_id else None
+
+
+def next_id(todo_list: PVector[Item]) -> int:
+    """
+    Get the ID the next item added to the TODO list will be given.
+
+    :param todo_list: The TODO list the item is being added to.
+    :type todo_list: PVector[Item]
+
+    :returns: One more than the highest ID in the TODO list, or 0 if it is empty.
+    :rtype: int
+    """
+    return todo_list[-1].id + 1 if len(todo_list) > 0 else 0
+
+
+def add(
+            todo_list: PVector[Item],
+            title: str,
+            description: str,
+            priority: (int | NoneType) = None,
+            due: (str | NoneType) = None
+        ) -> PVector[Item]:
+    """
+    Add an incomplete item to the end of the TODO list.
+
+    :param todo_list: The TODO list to add an item to.
+    :type todo_list: PVector[Item]
+
+    :param title: The title of the new item.
+    :type title: str
+
+    :param description: The description of the new item.
+    :type description: str
+
+    :param priority: The priority of the new item, 1 being the highest, if it has one.
+    :type priority: (int | NoneType) = None
+
+    :param due: When the new item is due, as `YYYY-MM-DD`, if it has a due date.
+    :type due: (str | NoneType) = None
+
+    :returns: The updated TODO list.
+    :rtype: PVector[Item]
+    """
+    return append(todo_list, title, description, False, None, priority, due)
+
+
+def remove(
+            todo_list: PVector[Item],
+            item_id: int
+        ) -> PVector[Item]:
+    """
+    Remove the item with the given ID from the TODO list.
+
+    Removing an item that isn't in the TODO list leaves the TODO list as it was, the same as
+    `remove_item()` does.
+
+    :param todo_list: The TODO list to remove an item from.
+    :type todo_list: PVector[Item]
+
+    :param item_id: The ID of the item to remove.
+    :type item_id: int
+
+    :returns: The updated TODO list.
+    :rtype: PVector[Item]
+    """
+
+    position: (int | NoneType) = position_of(todo_list, item_id)
+
+    return todo_list if position is None else todo_list.delete(position)
+
+
+def replace(
+            todo_list: PVector[Item],
+            item_id: int,
+            title: str,
+            description: str,
+            completed: bool,
+            priority: (int | NoneType) = None,
+            due: (str | NoneType) = None
+        ) -> PVector[Item]:
+    """
+    Replace every value of the item with the given ID, keeping its place in the TODO list.
+
+    Every other change to an existing item is made through this. Replacing an item that isn't in
+    the TODO list leaves the TODO list as it was.
+
+    :param todo_list: The TODO list to change an item in.
+    :type todo_list: PVector[Item]
+
+    :param item_id: The ID of the item to change.
+    :type item_id: int
+
+    :param title: The new title of the item.
+    :type title: str
+
+    :param description: The new description of the item.
+    :type description: str
+
+    :param completed: The new completed status of the item.
+    :type completed: bool
+
+    :param priority: The new priority of the item, if it has one.
+    :type priority: (int | NoneType) = None
+
+    :param due: The new due date of the item, if it has one.
+    :type due: (str | NoneType) = None
+
+    :returns: The updated TODO list.
+    :rtype: PVector[Item]
+    """
+
+    position: (int | NoneType) = position_of(todo_list, item_id)
+
+    return todo_list if position is None else todo_list.set(
+        position, Item(title, description, completed, item_id, priority, due)
+    )
+
+
+def edit(
+            todo_list: PVector[Item],
+            item_id: int,
+            title: str,
+            description: str
+        ) -> PVector[Item]:
+    """
+    Replace the title and description of the item with the given ID.
+
+    As with `edit_item()`, the edited item keeps its completed status, priority, due date and its
+    place in the TODO list.
+
+    :param todo_list: The TODO list to edit an item in.
+    :type todo_list: PVector[Item]
+
+    :param item_id: The ID of the item to edit.
+    :type item_id: int
+
+    :param title: The new title of the item.
+    :type title: str
+
+    :param description: The new description of the item.
+    :type description: str
+
+    :returns: The updated TODO list.
+    :rtype: PVector[Item]
+    """
+
+    position: (int | NoneType) = position_of(todo_list, item_id)
+
+    return todo_list if position is None else todo_list.set(
+        position, todo_list[position].replace(title=title, description=description)
+    )
+
+
+def schedule(
+            todo_list: PVector[Item],
+            item_id: int,
+            priority: (int | NoneType),
+            due: (str | NoneType)
+        ) -> PVector[Item]:
+    """
+    Set the priority and due date of the item with the given ID, keeping its place in the TODO list.
+
+    :param todo_list: The TODO list to change an item in.
+    :type todo_list: PVector[Item]
+
+    :param item_id: The ID of the item to change.
+    :type item_id: int
+
+    :param priority: The new priority of the item, 1 being the highest, or None for none.
+    :type priority: (int | NoneType)
+
+    :param due: The new due date of the item, as `YYYY-MM-DD`, or None for none.
+    :type due: (str | NoneType)
+
+    :returns: The updated TODO list.
+    :rtype: PVector[Item]
+    """
+
+    position: (int | NoneType) = position_of(todo_list, item_id)
+
+    return todo_list if position is None else todo_list.set(
+        position, todo_list[position].replace(priority=priority, due=due)
+    )
+
+
+def toggle(
+            todo_list: PVector[Item],
+            item_id: int
+        ) -> PVector[Item]:
+    """
+    Flip the completed status of the item with the given ID.
+
+    As with `checkoff_item()` and `uncheck_item()`, the toggled item keeps its place in the TODO
+    list.
+
+    :param todo_list: The TODO list to toggle an item in.
+    :type todo_list: PVector[Item]
+
+    :param item_id: The ID of the item to toggle.
+    :type item_id: int
+
+    :returns: The updated TODO list.
+    :rtype: PVector[Item]
+    """
+
+    position: (int | NoneType) = position_of(todo_list, item_id)
+
+    return todo_list if position is None else todo_list.set(
+        position, todo_list[position].replace(completed=not todo_list[position].completed)
+    )
+
+
+def append(
+            todo_list: PVector[Item],
+            title: str,
+            description: str,
+            completed: bool,
+            item_id: (int | NoneType) = None,
+            priority: (int | NoneType) = None,
+            due: (str | NoneType) = None
+        ) -> PVector[Item]:
+    """
+    Add an item with the given completed status to the end of the TODO list.
+
+    The item is given the next free ID unless `item_id` says otherwise, which the journal uses to
+    restore items with the IDs they had. An `item_id` must be higher than every ID already in the
+    TODO list.
+
+    :param todo_list: The TODO list to add an item to.
+    :type todo_list: PVector[Item]
+
+    :param title: The title of the new item.
+    :type title: str
+
+    :param description: The description of the new item.
+    :type description: str
+
+    :param completed: Whether the new item is completed.
+    :type completed: bool
+
+    :param item_id: The ID to give the new item, if not the next free one.
+    :type item_id: (int | NoneType) = None
+
+    :param priority: The priority of the new item, if it has one.
+    :type priority: (int | NoneType) = None
+
+    :param due: The due date of the new item, if it has one.
+    :type due: (str | NoneType) = None
+
+    :returns: The updated TODO list.
+    :rtype: PVector[Item]
+    """
+    return todo_list.append(Item(
+        title,
+        description,
+        completed,
+        next_id(todo_list) if item_id is None else item_id,
+        priority,
+        due
+    ))
+
+
+def selection(text: str) -> Callable[[Item], bool]:
+    """
+    Turn a description of some items into a test for whether an item is one of them.
+
+    The items can be described as:
+     - A range of IDs, for example `3-10`, which includes both ends.
+     - One or more IDs, for example `5` or `1,4,7`.
+     - `all`, `completed` or `incomplete`.
+     - `title:` followed by a regular expression, for example `title:^buy`, matching anywhere in
+       the title and ignoring case.
+
+    :param text: The description of the items.
+    :type text: str
+
+    :raises: ValueError when the description isn't one of the above.
+
+    :returns: A function that says whether an item is one of the described items.
+    :rtype: Callable[[Item], bool]
+    """
+
+    words: str = text.strip()
+
+    if words.lower() in ("all", "completed", "incomplete"):
+        return {
+            "all": lambda item: True,
+            "completed": lambda item: item.completed,
+            "incomplete": lambda item: not item.completed,
+        }[words.lower()]
+
+    if words.lower().startswith("title:"):
+        expression: str = words[len("title:"):]
+
+        try:
+            pattern: Pattern = compile_pattern(expression, IGNORECASE)
+        except PatternError as error:
+            raise ValueError(f"Invalid title pattern {expression!r}: {error}.") from error
+
+        return lambda item: item.title is not None and pattern.search(item.title) is not None
+
+    low, dash, high = words.partition("-")
+
+    if dash and low.strip().isdigit() and high.strip().isdigit():
+        first, last = int(low), int(high)
+        return lambda item: first <= item.id <= last
+
+    if words and all(map(lambda word: word.strip().isdigit(), words.split(","))):
+        item_ids: frozenset = frozenset(map(int, words.split(",")))
+        return lambda item: item.id in item_ids
+
+    raise ValueError(
+        f"Expected an ID range, IDs, all, completed, incomplete or title:PATTERN, got {text!r}."
+    )
+
+
+def _rebuild(
+            todo_list: PVector[Item],
+            selected: str,
+            change: Callable[[Item], (Item | NoneType)]
+        ) -> PVector[Item]:
+    """
+    Change every selected item in a single pass, giving one new version of the TODO list.
+
+    The pass finds the items that actually change. When there are only a few of them they're set or
+    deleted in the existing version, which shares everything else with it (and with the undo
+    history); once that would cost more than building the list afresh, a new one is built in O(n).
+
+    :param todo_list: The TODO list to change.
+    :type todo_list: PVector[Item]
+
+    :param selected: Which items to change, as described to `selection()`.
+    :type selected: str
+
+    :param change: Gives the changed item, the item itself to leave it alone, or None to remove it.
+    :type change: Callable[[Item], (Item | NoneType)]
+
+    :returns: The updated TODO list, or `todo_list` itself if nothing changed.
+    :rtype: PVector[Item]
+    """
+
+    matches: Callable[[Item], bool] = selection(text=selected)
+    changed: Dict[int, (Item | NoneType)] = {
+        position: new_item
+        for position, item in enumerate(todo_list)
+        if matches(item) and (new_item := change(item)) is not item
+    }
+
+    return todo_list if not changed else (
+        reduce(
+            lambda vector, edit: vector.delete(edit[0]) if edit[1] is None else vector.set(*edit),
+            reversed(changed.items()),
+            todo_list
+        )
+        if len(changed) * len(todo_list).bit_length() < len(todo_list)
+        else PVector(tuple(filter(
+            lambda item: item is not None,
+            map(lambda numbered: changed.get(*numbered), enumerate(todo_list))
+        )))
+    )
+
+
+def remove_many(todo_list: PVector[Item], selected: str) -> PVector[Item]:
+    """
+    Remove every selected item, for example every completed one, in a single pass.
+
+    :param todo_list: The TODO list to remove items from.
+    :type todo_list: PVector[Item]
+
+    :param selected: Which items to remove, as described to `selection()`.
+    :type selected: str
+
+    :returns: The updated TODO list.
+    :rtype: PVector[Item]
+    """
+    return _rebuild(todo_list, selected, lambda item: None)
+
+
+def mark_many(todo_list: PVector[Item], selected: str, completed: bool) -> PVector[Item]:
+    """
+    Set the completed status of every selected item in a single pass.
+
+    Items that already have that status are left as they are.
+
+    :param todo_list: The TODO list to change items in.
+    :type todo_list: PVector[Item]
+
+    :param selected: Which items to change, as described to `selection()`.
+    :type selected: str
+
+    :param completed: The completed status to give them.
+    :type completed: bool
+
+    :returns: The updated TODO list.
+    :rtype: PVector[Item]
+    """
+    return _rebuild(
+        todo_list,
+        selected,
+        lambda item: item if item.completed == completed else item.replace(completed=completed)
+    )
+
+
+def edit_many(
+            todo_list: PVector[Item],
+            selected: str,
+            title: str,
+            description: str
+        ) -> PVector[Item]:
+    """
+    Replace the title and description of every selected item in a single pass.
+
+    An empty title or description leaves that value as it was, so `edit_many(todo_list, "1-5", "",
+    "Moved to next week")` only changes the descriptions.
+
+    :param todo_list: The TODO list to edit items in.
+    :type todo_list: PVector[Item]
+
+    :param selected: Which items to edit, as described to `selection()`.
+    :type selected: str
+
+    :param title: The new title, or "" to keep each item's own.
+    :type title: str
+
+    :param description: The new description, or "" to keep each item's own.
+    :type description: str
+
+    :returns: The updated TODO list.
+    :rtype: PVector[Item]
+    """
+    return _rebuild(
+        todo_list,
+        selected,
+        lambda item: item.replace(
+            title=title or item.title, description=description or item.description
+        )
+    )
+
+
+def _boolean(word: str) -> bool:
+    """
+    Convert a script word such as `true` or `false` into a bool.
+
+    :param word: The word to convert.
+    :type word: str
+
+    :raises: ValueError when the word is neither `true` nor `false`.
+
+    :returns: The converted word.
+    :rtype: bool
+    """
+
+    if word.lower() not in ("true", "false"):
+        raise ValueError(f"Expected true or false, got {word!r}.")
+
+    return word.lower() == "true"
+
+
+def _selected(text: str) -> str:
+    """
+    Check a script word describes some items, as for `selection()`, so a bad one is found when the
+    script is read rather than part way through running it.
+
+    :param text: The description of the items.
+    :type text: str
+
+    :raises: ValueError when the description isn't one `selection()` understands.
+
+    :returns: The description, unchanged.
+    :rtype: str
+    """
+    return bool(selection(text)) and text
+
+
+# The operations by name, along with a converter for each of their arguments.
+OPERATIONS: Dict[str, Tuple[Callable, Tuple[Callable[[str], object], ...]]] = {
+    "add": (add, (str, str)),
+    "remove": (remove, (int,)),
+    "edit": (edit, (int, str, str)),
+    "toggle": (toggle, (int,)),
+    "schedule": (schedule, (int, parse_priority, parse_due)),
+    "append": (append, (str, str, _boolean)),
+    "replace": (replace, (int, str, str, _boolean)),
+    "remove_many": (remove_many, (_selected,)),
+    "mark_many": (mark_many, (_selected, _boolean)),
+    "edit_many": (edit_many, (_selected, str, str)),
+}
+
+
+def apply_operation(
+            todo_list: PVector[Item],
+            operation: Tuple
+        ) -> PVector[Item]:
+    """
+    Apply a single operation tuple, such as `("toggle", 3)`, to the TODO list.
+
+    :param todo_list: The TODO list to apply the operation to.
+    :type todo_list: PVector[Item]
+
+    :param operation: The name of the operation followed by its arguments.
+    :type operation: Tuple
+
+    :raises: KeyError when the operation name is not one of `OPERATIONS`.
+
+    :returns: The updated TODO list.
+    :rtype: PVector[Item]
+    """
+    return OPERATIONS[operation[0]][0](todo_list, *operation[1:])
+
+
+def apply_operations(
+            todo_list: List[Dict[str, (str | bool | NoneType)]],
+            operations: Iterable[Tuple],
+            step: Callable[[PVector, Tuple], PVector] = apply_operation
+        ) -> PVector[Item]:
+    """
+    Apply every operation in `operations`, in order, to the TODO list.
+
+    Only the latest version of the TODO list is kept while folding over the operations, so the
+    operations can be streamed in without holding every intermediate version in memory.
+
+    :param todo_list: The TODO list to apply the operations to.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]]
+
+    :param operations: The operations to apply.
+    :type operations: Iterable[Tuple]
+
+    :param step: Applies one operation; swapped out to also journal each operation, for instance.
+    :type step: Callable[[PVector, Tuple], PVector] = apply_operation
+
+    :returns: The updated TODO list.
+    :rtype: PVector[Item]
+    """
+    return reduce(
+        step,
+        operations,
+        todo_list if isinstance(todo_list, PVector) else PVector(as_items(todo_list))
+    )
+
+
+def _to_record(item: Item, operation: str) -> Tuple:
+    return (
+        (operation, item.id, item.title, item.description, item.completed, *schedule_of(item))
+        if operation == "replace"
+        else (operation, item.title, item.description, item.completed, item.id, *schedule_of(item))
+    )
+
+
+def _merge_records(before: Iterator[Item], after: Iterator[Item]) -> Iterator[Tuple]:
+    """
+    Walk two versions of the TODO list side by side by ID, giving a record for each difference.
+
+    Both versions are in ID order and new items always have higher IDs than the items they were
+    added after, so an ID only in `before` was removed, an ID only in `after` was appended and an
+    ID in both whose item isn't the same object was replaced.
+    """
+
+    old, new = next(before, None), next(after, None)
+
+    while old is not None or new is not None:
+        if new is None or (old is not None and old.id < new.id):
+            yield ("remove", old.id)
+            old = next(before, None)
+        elif old is None or new.id < old.id:
+            yield _to_record(item=new, operation="append")
+            new = next(after, None)
+        else:
+            if old is not new:
+                yield _to_record(item=new, operation="replace")
+
+            old, new = next(before, None), next(after, None)
+
+
+def changes(
+            before: PVector[Item],
+            after: PVector[Item]
+        ) -> Tuple[Tuple, ...]:
+    """
+    Work out the operations that turn one version of the TODO list into another.
+
+    Versions of the TODO list share the items they have in common, and the subtrees holding them,
+    so the unchanged items at the start and end are found by identity in about O(log² n) without
+    walking past them (see `PVector.shared_prefix()`). Only what's left between them is walked by
+    ID, giving one record per item that changed, so replacing, removing or appending a single item
+    comes out as a single `replace`, `remove` or `append`. Appended items are recorded with their
+    IDs so they're restored exactly, and items with a priority or a due date have both on the end of
+    their record.
+
+    :param before: The earlier version of the TODO list.
+    :type before: PVector[Item]
+
+    :param after: The later version of the TODO list.
+    :type after: PVector[Item]
+
+    :returns: The operations, in the order they need to be applied.
+    :rtype: Tuple[Tuple, ...]
+    """
+
+    prefix: int = before.shared_prefix(after)
+    suffix: int = min(before.shared_suffix(after), min(len(before), len(after)) - prefix)
+
+    return tuple(_merge_records(
+        before=islice(before.iterate_from(prefix), len(before) - prefix - suffix),
+        after=islice(after.iterate_from(prefix), len(after) - prefix - suffix)
+    ))
+
+
+def records_for(
+            before: PVector[Item],
+            after: PVector[Item],
+            operation: Tuple
+        ) -> Tuple[Tuple, ...]:
+    """
+    Work out the records, in the form `changes()` gives them, that one operation made.
+
+    Where `changes()` compares the two versions, this reads the change off the operation itself, so
+    it costs O(log n) however long the TODO list is. Bulk operations, which rebuild the TODO list in
+    O(n) anyway, are handed to `changes()`.
+
+    :param before: The TODO list before the operation.
+    :type before: PVector[Item]
+
+    :param after: The TODO list after the operation.
+    :type after: PVector[Item]
+
+    :param operation: The operation that turned `before` into `after`.
+    :type operation: Tuple
+
+    :returns: The `append`, `replace` or `remove` record, or none if nothing changed.
+    :rtype: Tuple[Tuple, ...]
+    """
+    return () if after is before else (
+        changes(before=before, after=after)
+        if operation[0] in ("remove_many", "mark_many", "edit_many")
+        else (
+            (("remove", operation[1]),)
+            if operation[0] == "remove"
+            else (
+                (_to_record(item=after[-1], operation="append"),)
+                if operation[0] in ("add", "append")
+                else (
+                    _to_record(item=after[position_of(after, operation[1])], operation="replace"),
+                )
+            )
+        )
+    )
+
+
+def parse_operation(line: str) -> Tuple:
+    """
+    Parse one line of a batch script into an operation tuple.
+
+    :param line: The line to parse, for example `add "Title" "Description"`.
+    :type line: str
+
+    :raises: ValueError when the line names an unknown operation or has the wrong arguments.
+
+    :returns: The name of the operation followed by its converted arguments.
+    :rtype: Tuple
+    """
+
+    try:
+        words: List[str] = split(line)
+    except ValueError as error:
+        raise ValueError(f"Can't read line {line!r}: {error}.") from None
+
+    if words[0] not in OPERATIONS:
+        raise ValueError(f"Unknown operation {words[0]!r} in line {line!r}.")
+
+    converters: Tuple[Callable[[str], object], ...] = OPERATIONS[words[0]][1]
+
+    if len(words) - 1 != len(converters):
+        raise ValueError(
+            f"Operation {words[0]!r} takes {len(converters)} arguments, got {len(words) - 1}"
+            + f" in line {line!r}."
+        )
+
+    try:
+        return (words[0], *map(lambda pair: pair[0](pair[1]), zip(converters, words[1:])))
+    except ValueError as error:
+        raise ValueError(f"Bad arguments to {words[0]!r} in line {line!r}: {error}") from None
+
+
+def _parse_numbered(numbered: Tuple[int, str]) -> Tuple:
+    """
+    Parse one numbered line of a batch script, as for `parse_operation()`.
+
+    :raises: ValueError, starting with the line number, when the line can't be parsed.
+    """
+
+    try:
+        return parse_operation(line=numbered[1])
+    except ValueError as error:
+        raise ValueError(f"Line {numbered[0]}: {error}") from None
+
+
+def parse_script(lines: Iterable[str]) -> Tuple[Tuple, ...]:
+    """
+    Parse every line of a batch script into operation tuples, skipping blank lines and comments.
+
+    :param lines: The lines of the batch script.
+    :type lines: Iterable[str]
+
+    :raises: ValueError, starting with the number of the first bad line, when a line can't be
+        parsed.
+
+    :returns: The operations, in order.
+    :rtype: Tuple[Tuple, ...]
+    """
+    return tuple(map(_parse_numbered, filter(
+        lambda numbered: numbered[1].strip() != "" and not numbered[1].lstrip().startswith("#"),
+        enumerate(lines, start=1)
+    )))
+
+
+def run_batch(
+            lines: Iterable[str],
+            todo_list: List[Dict[str, (str | bool | NoneType)]] = (),
+            step: Callable[[PVector, Tuple], PVector] = apply_operation
+        ) -> PVector[Item]:
+    """
+    Apply a batch script to the TODO list in a single pass.
+
+    The whole script is parsed before any of it is applied, so a bad line anywhere in it leaves the
+    TODO list (and anything `step` records it in) as it was.
+
+    :param lines: The lines of the batch script.
+    :type lines: Iterable[str]
+
+    :param todo_list: The TODO list to start from.
+    :type todo_list: List[Dict[str, (str | bool | NoneType)]] = ()
+
+    :param step: Applies one operation, as for `apply_operations()`.
+    :type step: Callable[[PVector, Tuple], PVector] = apply_operation
+
+    :raises: ValueError, starting with the number of the first bad line, when a line of the
+        script can't be parsed.
+
+    :returns: The TODO list after every operation in the script has been applied.
+    :rtype: PVector[Item]
+    """
+    return apply_operations(todo_list, parse_script(lines=lines), step)
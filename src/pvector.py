@@ -0,0 +1,740 @@
+"""
+Persistent, structure-sharing sequence used to hold the TODO list.
+
+Every "update" on a `PVector` returns a new `PVector` and leaves the original untouched. The parts
+of the tree that did not change are shared between the old and the new version, so an update only
+allocates the O(log n) nodes on the path to the changed position instead of copying the whole list
+the way `deepcopy` does.
+
+Under the hood this is an AVL tree keyed implicitly by position. Every node records the size of
+its subtree, which is what lets us find, insert, replace and delete the item at any position in
+O(log n) time.
+
+Every node also counts the values in its subtree that are completed (that have a true `completed`
+attribute, as an `Item` does). The counts are kept up to date by the same O(log n) node rebuilds
+that every update already does, so how many items are completed or still to do is known in O(1)
+at the root, and the completed or outstanding items can be walked without visiting any subtree
+that has none of them (see `iterate_completed()`).
+
+A vector can also be made lazily over values that are stored elsewhere (see `PVector.lazy()`).
+Its nodes are unpacked, and its values fetched, only as they're reached, so opening one costs the
+same however many values it has, and only what's been looked at or changed is ever held.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from collections.abc import Sequence
+
+from functools import cached_property
+
+from itertools import islice
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import NamedTuple
+from typing import Set
+from typing import Tuple
+
+from types import NoneType
+
+
+# Roughly what each node of the tree costs in memory, on top of the value it holds.
+NODE_BYTES: int = 104
+
+
+class _Node(NamedTuple):
+    """
+    A single immutable node of the tree.
+
+    `size` is the number of values in the subtree rooted at this node, `height` is the AVL height
+    of that subtree and `completed` is how many of its values are completed.
+    """
+
+    left: "(_Node | NoneType)"
+    value: Any
+    right: "(_Node | NoneType)"
+    size: int
+    height: int
+    completed: int
+
+
+class _LazyNode:
+    """
+    A node of a perfectly balanced tree over stored values, the same shape `_build()` makes, whose
+    children, value and completed count are only worked out the first time they're asked for.
+
+    It has the same fields as a `_Node`, so every function here works on either. Each lazy node
+    keeps its children and value once they're asked for, so a subtree nobody has changed stays the
+    same object. Walks over the whole tree read them with `peek()` instead, which keeps nothing new.
+    """
+
+    def __init__(
+                self,
+                low: int,
+                high: int,
+                value_at: Callable[[int], Any],
+                completed_between: Callable[[int, int], int]
+            ) -> NoneType:
+        self.low: int = low
+        self.high: int = high
+        self.size: int = high - low
+        self.height: int = (high - low).bit_length()
+        self._value_at: Callable[[int], Any] = value_at
+        self._completed_between: Callable[[int, int], int] = completed_between
+
+    def _child(self, low: int, high: int) -> "(_LazyNode | NoneType)":
+        return (
+            _LazyNode(low, high, self._value_at, self._completed_between) if low < high else None
+        )
+
+    def _left(self) -> "(_LazyNode | NoneType)":
+        return self._child(self.low, (self.low + self.high) // 2)
+
+    def _right(self) -> "(_LazyNode | NoneType)":
+        return self._child((self.low + self.high) // 2 + 1, self.high)
+
+    def _value(self) -> Any:
+        return self._value_at((self.low + self.high) // 2)
+
+    @cached_property
+    def left(self) -> "(_LazyNode | NoneType)":
+        return self._left()
+
+    @cached_property
+    def right(self) -> "(_LazyNode | NoneType)":
+        return self._right()
+
+    @cached_property
+    def value(self) -> Any:
+        return self._value()
+
+    def peek(self, field: str) -> Any:
+        """
+        Get the `left`, `right` or `value` field, keeping it only if it was already kept.
+        """
+        return self.__dict__[field] if field in self.__dict__ else getattr(self, f"_{field}")()
+
+    @cached_property
+    def completed(self) -> int:
+        return self._completed_between(self.low, self.high)
+
+
+def _size(node: (_Node | NoneType)) -> int:
+    return 0 if node is None else node.size
+
+
+def _height(node: (_Node | NoneType)) -> int:
+    return 0 if node is None else node.height
+
+
+def _completed(node: (_Node | NoneType)) -> int:
+    return 0 if node is None else node.completed
+
+
+def _peek(node: _Node, field: str) -> Any:
+    """
+    Get a field of a node for a walk over the tree, which a lazy node works out without keeping.
+    """
+    return node.peek(field) if isinstance(node, _LazyNode) else getattr(node, field)
+
+
+def _flag(value: Any) -> int:
+    return 1 if getattr(value, "completed", False) else 0
+
+
+def _matching(node: (_Node | NoneType), completed: bool) -> int:
+    """
+    Count the values in a subtree that are completed, or if `completed` is False, that aren't.
+    """
+    return _completed(node) if completed else _size(node) - _completed(node)
+
+
+def _make(left: (_Node | NoneType), value: Any, right: (_Node | NoneType)) -> _Node:
+    return _Node(
+        left,
+        value,
+        right,
+        _size(left) + _size(right) + 1,
+        max(_height(left), _height(right)) + 1,
+        _completed(left) + _completed(right) + _flag(value)
+    )
+
+
+def _rotate_left(left: (_Node | NoneType), value: Any, right: _Node) -> _Node:
+    return _make(_make(left, value, right.left), right.value, right.right)
+
+
+def _rotate_right(left: _Node, value: Any, right: (_Node | NoneType)) -> _Node:
+    return _make(left.left, left.value, _make(left.right, value, right))
+
+
+def _balance(left: (_Node | NoneType), value: Any, right: (_Node | NoneType)) -> _Node:
+    """
+    Build a node from two subtrees whose heights differ by at most two, rotating as needed.
+
+    :returns: A node that satisfies the AVL invariant.
+    :rtype: _Node
+    """
+
+    difference: int = _height(left) - _height(right)
+
+    return (
+        _rotate_right(
+            (
+                left
+                if _height(left.left) >= _height(left.right)
+                else _rotate_left(left.left, left.value, left.right)
+            ),
+            value,
+            right
+        )
+        if difference > 1
+        else (
+            _rotate_left(
+                left,
+                value,
+                (
+                    right
+                    if _height(right.right) >= _height(right.left)
+                    else _rotate_right(right.left, right.value, right.right)
+                )
+            )
+            if difference < -1
+            else _make(left, value, right)
+        )
+    )
+
+
+def _build(values: Sequence, low: int, high: int) -> (_Node | NoneType):
+    """
+    Build a perfectly balanced tree of `values[low:high]` in O(n).
+
+    Splitting at the middle every time makes the height of a tree of n values exactly
+    `n.bit_length()`, so the node is made directly rather than through `_make()`.
+    """
+
+    if low >= high:
+        return None
+
+    middle: int = (low + high) // 2
+    left: (_Node | NoneType) = _build(values, low, middle)
+    right: (_Node | NoneType) = _build(values, middle + 1, high)
+
+    return _Node(
+        left,
+        values[middle],
+        right,
+        high - low,
+        (high - low).bit_length(),
+        _completed(left) + _completed(right) + _flag(values[middle])
+    )
+
+
+def _get(node: _Node, index: int) -> Any:
+    left_size: int = _size(node.left)
+
+    return (
+        _get(node.left, index)
+        if index < left_size
+        else (node.value if index == left_size else _get(node.right, index - left_size - 1))
+    )
+
+
+def _fetch(node: _Node, index: int) -> Any:
+    """
+    Get the value at a position, along with the completed count of every subtree on the way to it.
+    """
+
+    # A lazy node works out its completed count the first time it's asked for, and keeps it.
+    _completed(node)
+    left_size: int = _size(node.left)
+
+    return (
+        _fetch(node.left, index)
+        if index < left_size
+        else (node.value if index == left_size else _fetch(node.right, index - left_size - 1))
+    )
+
+
+def _insert(node: (_Node | NoneType), index: int, value: Any) -> _Node:
+    left_size: int = _size(node.left) if node is not None else 0
+
+    return (
+        _make(None, value, None)
+        if node is None
+        else (
+            _balance(_insert(node.left, index, value), node.value, node.right)
+            if index <= left_size
+            else _balance(node.left, node.value, _insert(node.right, index - left_size - 1, value))
+        )
+    )
+
+
+def _set(node: _Node, index: int, value: Any) -> _Node:
+    left_size: int = _size(node.left)
+    left: (_Node | NoneType) = _set(node.left, index, value) if index < left_size else node.left
+    right: (_Node | NoneType) = (
+        _set(node.right, index - left_size - 1, value) if index > left_size else node.right
+    )
+    value = value if index == left_size else node.value
+
+    return _Node(
+        left,
+        value,
+        right,
+        node.size,
+        node.height,
+        _completed(left) + _completed(right) + _flag(value)
+    )
+
+
+def _join(left: (_Node | NoneType), right: (_Node | NoneType)) -> (_Node | NoneType):
+    """
+    Join the two children of a deleted node back into one balanced subtree.
+    """
+
+    return left if right is None else (
+        right if left is None else _balance(left, _get(right, 0), _delete(right, 0))
+    )
+
+
+def _delete(node: _Node, index: int) -> (_Node | NoneType):
+    left_size: int = _size(node.left)
+
+    return (
+        _balance(_delete(node.left, index), node.value, node.right)
+        if index < left_size
+        else (
+            _join(node.left, node.right)
+            if index == left_size
+            else _balance(node.left, node.value, _delete(node.right, index - left_size - 1))
+        )
+    )
+
+
+def _iterate(node: (_Node | NoneType), start: int) -> Iterator[Any]:
+    """
+    Walk the tree in order starting at position `start`.
+
+    Finding the starting position is O(log n) and every following value is amortised O(1), so
+    reading a window of k values costs O(log n + k) rather than O(n). Lazy nodes keep the path to
+    the start but nothing the walk reads after it, so walking the whole tree doesn't load it.
+    """
+
+    stack: list = []
+
+    while node is not None:
+        left_size: int = _size(node.left)
+
+        if start < left_size:
+            stack.append(node)
+            node = node.left
+        elif start == left_size:
+            stack.append(node)
+            node = None
+        else:
+            start -= left_size + 1
+            node = node.right
+
+    while stack:
+        node = stack.pop()
+        yield _peek(node, "value")
+
+        child: (_Node | NoneType) = _peek(node, "right")
+
+        while child is not None:
+            stack.append(child)
+            child = _peek(child, "left")
+
+
+def _iterate_completed(
+            node: (_Node | NoneType),
+            completed: bool,
+            skip: int
+        ) -> Iterator[Tuple[int, Any]]:
+    """
+    Walk the values that are completed (or, if `completed` is False, that aren't) in order, along
+    with their positions, skipping the first `skip` of them.
+
+    Subtrees with no matching values are never entered, and the first match to show is found by
+    its count alone in O(log n), so reading k matches doesn't depend on how many others there are.
+    As in `_iterate()`, lazy nodes keep nothing the walk reads after the first match.
+    """
+
+    # Each entry is a node and the position of the first value in its subtree.
+    stack: list = []
+    offset: int = 0
+
+    while node is not None:
+        before: int = _matching(node.left, completed)
+        here: bool = _flag(node.value) == completed
+
+        if skip < before:
+            stack.append((node, offset))
+            node = node.left
+        elif skip == before and here:
+            stack.append((node, offset))
+            node = None
+        else:
+            skip -= before + here
+            offset += _size(node.left) + 1
+            node = node.right
+
+    while stack:
+        node, offset = stack.pop()
+        left: (_Node | NoneType) = _peek(node, "left")
+        value: Any = _peek(node, "value")
+        position: int = offset + _size(left)
+
+        if _flag(value) == completed:
+            yield position, value
+
+        child: (_Node | NoneType) = _peek(node, "right")
+        offset = position + 1
+
+        while child is not None and _matching(child, completed) > 0:
+            stack.append((child, offset))
+            left = _peek(child, "left")
+            child = left if _matching(left, completed) > 0 else None
+
+
+def _shared(first: (_Node | NoneType), second: (_Node | NoneType), from_end: bool) -> int:
+    """
+    Count how many values at the start (or end) of two trees are the very same objects.
+
+    Both trees are unpacked from that edge one subtree at a time, always opening the bigger of the
+    two next subtrees, and a subtree that both trees share is skipped whole. Two versions made from
+    one another share every subtree away from the path to what changed, so this costs about
+    O(log² n) for them rather than O(n).
+    """
+
+    firsts: list = [] if first is None else [first]
+    seconds: list = [] if second is None else [second]
+    count: int = 0
+
+    while firsts and seconds:
+        this, that = firsts[-1], seconds[-1]
+
+        if this is that or (this.size == that.size == 1 and this.value is that.value):
+            count += this.size
+            firsts.pop()
+            seconds.pop()
+        elif this.size == that.size == 1:
+            break
+        else:
+            stack: list = firsts if this.size >= that.size and this.size > 1 else seconds
+            node: _Node = stack.pop()
+            near, far = (node.right, node.left) if from_end else (node.left, node.right)
+
+            stack.extend(filter(
+                lambda child: child is not None, (far, _make(None, node.value, None), near)
+            ))
+
+    return count
+
+
+def _unshared(first: (_Node | NoneType), second: (_Node | NoneType)) -> int:
+    """
+    Count the nodes of `first` that aren't also nodes of `second`.
+
+    A node shared by both trees has the same height in each, and so do the nodes either tree
+    reaches it through, which are taller. So both trees are unpacked a height at a time, tallest
+    first, and the nodes found at a height in both are skipped whole along with everything under
+    them. Only the nodes that differ and their children are ever looked at, which for two versions
+    made from one another is O(k log n) for k changed values.
+    """
+
+    levels: Dict[int, Tuple[list, list]] = {}
+    count: int = 0
+
+    def place(side: int, nodes: Iterable[(_Node | NoneType)]) -> NoneType:
+        for node in filter(lambda node: node is not None, nodes):
+            levels.setdefault(node.height, ([], []))[side].append(node)
+
+    place(side=0, nodes=(first,))
+    place(side=1, nodes=(second,))
+
+    for height in range(max(_height(first), _height(second)), 0, -1):
+        firsts, seconds = levels.pop(height, ([], []))
+        shared: Set[int] = set(map(id, firsts)) & set(map(id, seconds))
+
+        for side, nodes in enumerate((firsts, seconds)):
+            for node in filter(lambda node: id(node) not in shared, nodes):
+                count += side == 0
+                place(side=side, nodes=(node.left, node.right))
+
+    return count
+
+
+class PVector(Sequence):
+    """
+    An immutable, persistent sequence.
+
+    `append`, `insert`, `set` and `delete` return a new `PVector` that shares every untouched
+    subtree with the original, so keeping old versions around is cheap and no version is ever
+    mutated after it has been created.
+
+    A `PVector` compares equal to any other sequence (other than a string) holding equal values in
+    the same order, which keeps it interchangeable with plain lists in comparisons.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, values: Iterable = ()) -> NoneType:
+        values = values if isinstance(values, (list, tuple)) else tuple(values)
+        self._root: (_Node | NoneType) = _build(values, 0, len(values))
+
+    @classmethod
+    def _from_root(cls, root: (_Node | NoneType)) -> "PVector":
+        vector: PVector = cls.__new__(cls)
+        vector._root = root
+        return vector
+
+    @classmethod
+    def lazy(
+                cls,
+                size: int,
+                value_at: Callable[[int], Any],
+                completed_between: Callable[[int, int], int]
+            ) -> "PVector":
+        """
+        Make a vector of `size` values stored elsewhere, fetching each one only when it's reached.
+
+        The vector works like any other, and every version made from it shares the parts of it that
+        haven't been reached, so they're never fetched at all.
+
+        :param size: How many values there are.
+        :type size: int
+
+        :param value_at: Fetches the value at a position. It must give back the same value every
+            time, and is only called once per position that's reached.
+        :type value_at: Callable[[int], Any]
+
+        :param completed_between: Counts the completed values from one position up to, but not
+            including, another.
+        :type completed_between: Callable[[int, int], int]
+
+        :returns: The vector.
+        :rtype: PVector
+        """
+        return cls._from_root(
+            _LazyNode(0, size, value_at, completed_between) if size > 0 else None
+        )
+
+    def _position(self, index: int) -> int:
+        position: int = index + len(self) if index < 0 else index
+
+        if not 0 <= position < len(self):
+            raise IndexError("PVector index out of range")
+
+        return position
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def __getitem__(self, index: (int | slice)) -> Any:
+        start, stop, step = index.indices(len(self)) if isinstance(index, slice) else (0, 0, 0)
+
+        return (
+            (
+                PVector(islice(self.iterate_from(start), max(stop - start, 0)))
+                if step == 1
+                else PVector(tuple(self)[index])
+            )
+            if isinstance(index, slice)
+            else _get(self._root, self._position(index))
+        )
+
+    def __iter__(self) -> Iterator[Any]:
+        return _iterate(self._root, 0)
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Sequence)
+            and not isinstance(other, str)
+            and len(self) == len(other)
+            and all(map(lambda pair: pair[0] == pair[1], zip(self, other)))
+        )
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None
+
+    def __add__(self, other: Iterable) -> "PVector":
+        return self.extend(other)
+
+    def __repr__(self) -> str:
+        return f"PVector({list(self)!r})"
+
+    def iterate_from(self, start: int) -> Iterator[Any]:
+        """
+        Iterate over the values from position `start` onwards in O(log n) plus O(1) per value.
+
+        :param start: The position to start iterating from.
+        :type start: int
+
+        :returns: An iterator over the values from `start` to the end of the vector.
+        :rtype: Iterator[Any]
+        """
+        return _iterate(self._root, max(start, 0))
+
+    def count_completed(self, completed: bool = True) -> int:
+        """
+        Count the values that are completed (or, if `completed` is False, aren't) in O(1).
+        """
+        return _matching(self._root, completed)
+
+    def iterate_completed(
+                self,
+                completed: bool = True,
+                start: int = 0
+            ) -> Iterator[Tuple[int, Any]]:
+        """
+        Iterate over the values that are completed (or, if `completed` is False, aren't), from the
+        `start`th of them onwards, in O(log n) plus at most O(log n) per value.
+
+        :param completed: Whether to iterate over the completed values or the others.
+        :type completed: bool = True
+
+        :param start: How many of the matching values to skip.
+        :type start: int = 0
+
+        :returns: An iterator over the position and value of each matching value.
+        :rtype: Iterator[Tuple[int, Any]]
+        """
+        return _iterate_completed(self._root, bool(completed), max(start, 0))
+
+    def fetch(self, index: int) -> Any:
+        """
+        Get the value at a position, and for a lazy vector, fetch and keep everything that depends
+        on it - its value and the completed counts of the subtrees holding it - so that where it's
+        stored can change afterwards without changing this vector.
+        """
+        return _fetch(self._root, self._position(index))
+
+    def shared_prefix(self, other: "PVector") -> int:
+        """
+        Count how many values at the start of both vectors are the very same objects, skipping
+        the subtrees they share.
+        """
+        return _shared(self._root, other._root, from_end=False)
+
+    def shared_suffix(self, other: "PVector") -> int:
+        """
+        Count how many values at the end of both vectors are the very same objects, skipping the
+        subtrees they share.
+        """
+        return _shared(self._root, other._root, from_end=True)
+
+    def unshared_nodes(self, other: "PVector") -> int:
+        """
+        Count the nodes of this vector's tree that `other` doesn't share, which is about how much
+        memory holding on to this vector costs on top of holding on to `other`.
+        """
+        return _unshared(self._root, other._root)
+
+    def append(self, value: Any) -> "PVector":
+        """
+        Return a new vector with `value` added to the end.
+        """
+        return PVector._from_root(_insert(self._root, len(self), value))
+
+    def extend(self, values: Iterable) -> "PVector":
+        """
+        Return a new vector with every item in `values` added to the end.
+        """
+        return PVector._from_root(_extend(self._root, values))
+
+    def insert(self, index: int, value: Any) -> "PVector":
+        """
+        Return a new vector with `value` inserted before position `index`.
+        """
+        return PVector._from_root(
+            _insert(self._root, min(max(index + len(self) if index < 0 else index, 0), len(self)),
+            value)
+        )
+
+    def set(self, index: int, value: Any) -> "PVector":
+        """
+        Return a new vector with the value at position `index` replaced by `value`.
+        """
+        return PVector._from_root(_set(self._root, self._position(index), value))
+
+    def delete(self, index: int) -> "PVector":
+        """
+        Return a new vector without the value at position `index`.
+        """
+        return PVector._from_root(_delete(self._root, self._position(index)))
+
+    def bisect_left(self, target: Any, key: Callable[[Any], Any] = lambda value: value) -> int:
+        """
+        Find the leftmost position at which `target` could be inserted to keep the vector sorted.
+
+        The vector must already be sorted by `key`. This runs in O(log n).
+
+        :param target: The key being searched for.
+        :type target: Any
+
+        :param key: A function mapping a stored value to the key it is sorted by.
+        :type key: Callable[[Any], Any] = lambda value: value
+
+        :returns: The insertion position.
+        :rtype: int
+        """
+
+        node: (_Node | NoneType) = self._root
+        position: int = 0
+
+        while node is not None:
+            if key(node.value) < target:
+                position += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+
+        return position
+
+
+def _concatenate(left: (_Node | NoneType), value: Any, right: (_Node | NoneType)) -> _Node:
+    """
+    Join two trees of any heights with `value` between them, in O(log n).
+
+    The shorter tree is joined onto the edge of the taller one at the point where their heights
+    match, and the path back up is rebalanced.
+    """
+
+    return (
+        _balance(left.left, left.value, _concatenate(left.right, value, right))
+        if _height(left) > _height(right) + 1
+        else (
+            _balance(_concatenate(left, value, right.left), right.value, right.right)
+            if _height(right) > _height(left) + 1
+            else _make(left, value, right)
+        )
+    )
+
+
+def _extend(root: (_Node | NoneType), values: Iterable) -> (_Node | NoneType):
+    """
+    Add every value to the end of the tree.
+
+    The new values are built into a balanced tree of their own in O(k) and joined onto the end in
+    O(log n), rather than being inserted one at a time at O(log n) each.
+    """
+
+    values = values if isinstance(values, (list, tuple)) else tuple(values)
+
+    return root if not values else _concatenate(root, values[0], _build(values, 1, len(values)))
@@ -0,0 +1,234 @@
+"""
+Rendering of the TODO list to the console.
+
+Rows are printed one at a time rather than being joined into one string for the whole list first,
+and each row's JSON is cached against the item it was made from. Versions of the TODO list share
+every item that didn't change, so re-rendering after a command only serialises the rows that did.
+The cache holds a fixed number of the most recently rendered rows, however long the TODO list is,
+which is many pages of the viewport.
+
+The menu shows a viewport - one page of the TODO list along with a summary of how many items there
+are and how many are completed - instead of the whole TODO list before every prompt. The viewport
+can also show only the completed items or only the ones still to do. For a `PVector` the counts
+come from its root and the matching items are found without reading the others (see
+`PVector.iterate_completed()`), so neither costs a pass over the whole TODO list.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from collections import OrderedDict
+
+from itertools import islice
+
+from json import dumps
+
+from textwrap import indent
+
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+from types import NoneType
+
+# Local Imports
+from src.item import Item
+
+
+# How many rows the menu shows before each prompt.
+PAGE_SIZE: int = 20
+
+# How many rows the cache holds. The least recently rendered row is dropped to make room for a new
+# one, so rows for deleted and changed items don't build up and a long list can't fill memory.
+_ROW_CACHE_LIMIT: int = 4096
+
+# Serialised rows keyed by the `id()` of the item and whether the row is indented, least recently
+# rendered first. The item itself is kept alongside the row so its `id()` can't be reused by another
+# item while it's cached.
+_ROW_CACHE: OrderedDict[Tuple[int, bool], Tuple[Dict[str, (str | bool | NoneType)], str]] = (
+    OrderedDict()
+)
+
+
+def _serialise(item: Dict[str, (str | bool | NoneType)], indented: bool) -> str:
+    """
+    Serialise one item, as it appears inside `json.dumps(todo_list, indent=4)` or on one line.
+    """
+    return (
+        indent(dumps(item, indent=4, default=dict), "    ")
+        if indented
+        else dumps(item, default=dict)
+    )
+
+
+def render_row(item: Dict[str, (str | bool | NoneType)], indented: bool = False) -> str:
+    """
+    Get the JSON for one item of the TODO list, serialising it only if it hasn't been already.
+
+    :param item: The item to render.
+    :type item: Dict[str, (str | bool | NoneType)]
+
+    :param indented: Whether to render the item indented over several lines, or on one line.
+    :type indented: bool = False
+
+    :returns: The item as JSON.
+    :rtype: str
+    """
+
+    cached: (Tuple[Dict[str, (str | bool | NoneType)], str] | NoneType) = _ROW_CACHE.get(
+        (id(item), indented)
+    )
+
+    if cached is not None and cached[0] is item:
+        _ROW_CACHE.move_to_end((id(item), indented))
+        return cached[1]
+
+    _ROW_CACHE[(id(item), indented)] = (item, _serialise(item=item, indented=indented))
+    _ROW_CACHE.move_to_end((id(item), indented))
+
+    if len(_ROW_CACHE) > _ROW_CACHE_LIMIT:
+        _ROW_CACHE.popitem(last=False)
+
+    return _ROW_CACHE[(id(item), indented)][1]
+
+
+def stream_todo_list(todo_list: Sequence[Dict[str, (str | bool | NoneType)]]) -> bool:
+    """
+    Print the whole TODO list exactly as `json.dumps(todo_list, indent=4)` would, a row at a time.
+
+    :param todo_list: The TODO list to print.
+    :type todo_list: Sequence[Dict[str, (str | bool | NoneType)]]
+
+    :returns: False once the TODO list has been printed.
+    :rtype: bool
+    """
+
+    return (
+        bool(print("[]"))
+        if len(todo_list) == 0
+        else bool(
+            print("[")
+            or any(map(
+                lambda numbered: print(
+                    render_row(item=numbered[1], indented=True)
+                    + ("," if numbered[0] < len(todo_list) - 1 else "")
+                ),
+                enumerate(todo_list)
+            ))
+            or print("]")
+        )
+    )
+
+
+def _count_completed(todo_list: Sequence[Item], completed: bool = True) -> int:
+    """
+    Count the items that are completed (or, if `completed` is False, aren't), in O(1) for a
+    `PVector` and by reading every item otherwise.
+    """
+    return (
+        todo_list.count_completed(completed=completed)
+        if hasattr(todo_list, "count_completed")
+        else sum(map(lambda item: bool(item.get("completed", False)) == completed, todo_list))
+    )
+
+
+def _iterate_completed(
+            todo_list: Sequence[Item],
+            completed: bool,
+            start: int
+        ) -> Iterator[Tuple[int, Item]]:
+    """
+    Iterate over the positions and items that are completed (or, if `completed` is False, aren't)
+    from the `start`th of them onwards.
+    """
+    return (
+        todo_list.iterate_completed(completed=completed, start=start)
+        if hasattr(todo_list, "iterate_completed")
+        else islice(
+            filter(
+                lambda numbered: bool(numbered[1].get("completed", False)) == completed,
+                enumerate(todo_list)
+            ),
+            start,
+            None
+        )
+    )
+
+
+def render_viewport(
+            todo_list: Sequence[Item],
+            start: (int | NoneType) = None,
+            size: int = PAGE_SIZE,
+            completed: (bool | NoneType) = None
+        ) -> bool:
+    """
+    Print a summary of the TODO list followed by one page of its items.
+
+    Each item is shown against its position, for reference, and its ID, which is what the menu asks
+    for when picking an item. The summary numbers the items shown from 0, as positions are.
+
+    :param todo_list: The TODO list to print.
+    :type todo_list: Sequence[Item]
+
+    :param start: The number of the first item to show, or None to show the last page. When only
+        some of the items are shown, this counts only those items.
+    :type start: (int | NoneType) = None
+
+    :param size: The most items to show.
+    :type size: int = PAGE_SIZE
+
+    :param completed: Whether to show only the completed items (True), only the items still to do
+        (False) or every item (None).
+    :type completed: (bool | NoneType) = None
+
+    :returns: False once the page has been printed.
+    :rtype: bool
+    """
+
+    done: int = _count_completed(todo_list)
+    matching: int = len(todo_list) if completed is None else _count_completed(todo_list, completed)
+    first: int = max(matching - size, 0) if start is None else min(start, matching)
+    shown: List[Tuple[int, Item]] = list(islice(
+        (
+            enumerate(
+                todo_list.iterate_from(first)
+                if hasattr(todo_list, "iterate_from")
+                else todo_list[first:],
+                start=first
+            )
+            if completed is None
+            else _iterate_completed(todo_list=todo_list, completed=completed, start=first)
+        ),
+        size
+    ))
+
+    print(f"TODO - {len(todo_list)} items, {done} completed, {len(todo_list) - done} to do")
+    print(
+        "Nothing to show."
+        if not shown
+        else (
+            f"Showing items {first} to {first + len(shown) - 1}:"
+            if completed is None
+            else (
+                f"Showing {first} to {first + len(shown) - 1} of the {matching} "
+                + ("completed items:" if completed else "items to do:")
+            )
+        )
+    )
+
+    return any(map(
+        lambda numbered: print(
+            f"{numbered[0]} (ID {numbered[1].id}) = {render_row(item=numbered[1])}"
+        ),
+        shown
+    ))
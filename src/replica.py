@@ -0,0 +1,602 @@
+"""
+Replicated TODO lists that can be changed independently and merged without conflicts.
+
+Each copy of the TODO list - a replica - is a CRDT: an observed-remove set of items, each tagged
+by the stamp it was added with, where every item's title, description, completed status,
+priority and due date is a last-writer-wins register. A stamp is a Lamport clock paired with the ID
+of the replica that made the change, so every replica puts any two changes in the same order.
+Merging takes, field by field, whichever value has the later stamp, and a removed item stays
+removed even if it was edited elsewhere at the same time. Merging is commutative, associative and
+idempotent, so replicas that have seen the same changes hold the same items, whatever order the
+changes reached them in.
+
+Each replica numbers its items itself, in the order it first saw them, so an item's ID can differ
+between replicas even though its values don't.
+
+Replicas are kept in sync by exchanging deltas rather than whole lists. Every replica keeps a
+version vector - the latest stamp it has seen from each replica - and a log, per replica, of which
+items that replica's changes touched, in stamp order. A delta for a peer is found by looking up,
+in each log, the changes after the peer's version vector, so building it and merging it cost time
+in proportion to the number of changed items rather than to the length of the TODO list. A delta is
+one JSON document:
+
+    {"replica": "3f2a...", "versions": {"3f2a...": 12}, "entries": [{"key": [4, "3f2a..."],
+        "title": ["Buy milk", 4, "3f2a..."], "description": [null, 4, "3f2a..."],
+        "completed": [true, 9, "3f2a..."], "priority": [2, 4, "3f2a..."],
+        "due": [null, 4, "3f2a..."], "removed": null}]}
+
+A `Replica` stores a replicated list in a file of such documents, one per line - its own changes
+as they're made and the changes merged into it - and can be used anywhere a `Journal` can. Every
+`compact_every` lines, the file is rewritten as a single document holding every entry.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from bisect import bisect_right
+
+from itertools import chain
+from itertools import islice
+
+from json import JSONDecodeError
+from json import dump
+from json import dumps
+from json import load
+from json import loads
+
+from operator import itemgetter
+
+from os import fsync
+from os import replace
+
+from typing import BinaryIO
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import NamedTuple
+from typing import Tuple
+
+from types import NoneType
+
+from uuid import uuid4
+
+# Local Imports
+from src.item import FIELDS
+from src.item import Item
+from src.item import SCHEDULE_FIELDS
+from src.item import schedule_in
+from src.operations import apply_operation
+from src.operations import next_id
+from src.operations import position_of
+from src.operations import records_for
+from src.pvector import PVector
+
+
+# A Lamport clock and the ID of the replica that made the change; later stamps win.
+Stamp = Tuple[int, str]
+
+
+class _Entry(NamedTuple):
+    """
+    The replicated state of one item: each field's value alongside the stamp it was set with, and
+    the stamp it was removed with, if it has been.
+    """
+
+    title: Tuple[(str | NoneType), Stamp]
+    description: Tuple[(str | NoneType), Stamp]
+    completed: Tuple[bool, Stamp]
+    priority: Tuple[(int | NoneType), Stamp]
+    due: Tuple[(str | NoneType), Stamp]
+    removed: (Stamp | NoneType)
+
+
+# The replicated fields of an item, in the order they're kept in an `_Entry`.
+_FIELDS: Tuple[str, ...] = (*FIELDS, *SCHEDULE_FIELDS)
+
+# The value and stamp of a field a row was written without, which any real change wins over.
+_UNSET: Tuple[NoneType, Stamp] = (None, (0, ""))
+
+
+def _join(old: (_Entry | NoneType), new: _Entry) -> _Entry:
+    """
+    Merge two states of the same item, keeping the latest value of each field.
+    """
+    return new if old is None else _Entry(
+        *map(lambda pair: max(pair, key=itemgetter(1)), zip(old[:-1], new[:-1])),
+        max(filter(None, (old.removed, new.removed)), default=None)
+    )
+
+
+def _stamps(key: Stamp, entry: _Entry) -> Iterator[Stamp]:
+    return filter(None, (key, *map(itemgetter(1), entry[:-1]), entry.removed))
+
+
+def _as_item(entry: _Entry, item_id: int) -> Item:
+    title, description, completed, priority, due = map(itemgetter(0), entry[:-1])
+    return Item(title, description, completed, item_id, priority, due)
+
+
+def _from_row(row: Mapping) -> Tuple[Stamp, _Entry]:
+    return tuple(row["key"]), _Entry(
+        *map(
+            lambda field: (row[field][0], tuple(row[field][1:])) if field in row else _UNSET,
+            _FIELDS
+        ),
+        None if row.get("removed") is None else tuple(row["removed"])
+    )
+
+
+class ReplicatedList:
+    """
+    One replica of a TODO list, held in memory.
+
+    `todo_list` is the replica's current TODO list. Change it by handing the records that changed it
+    to `record()`, and bring in other replicas' changes with `merge()`.
+    """
+
+    def __init__(self, replica_id: (str | NoneType) = None) -> NoneType:
+        self.replica_id: str = uuid4().hex if replica_id is None else replica_id
+        self.todo_list: PVector[Item] = PVector()
+
+        self._clock: int = 0
+        self._entries: Dict[Stamp, _Entry] = {}
+        self._versions: Dict[str, int] = {}
+        # For each replica, the Lamport clock of each of its changes and the item it changed.
+        self._log: Dict[str, List[Tuple[int, Stamp]]] = {}
+        # Each visible item's key and local ID, both ways round.
+        self._ids: Dict[Stamp, int] = {}
+        self._keys: Dict[int, Stamp] = {}
+        self._new_items: List[Item] = []
+
+    def versions(self) -> Dict[str, int]:
+        """
+        Get the replica's version vector: the latest clock it has seen from each replica.
+        """
+        return dict(self._versions)
+
+    def _tick(self) -> Stamp:
+        self._clock += 1
+        self._versions[self.replica_id] = self._clock
+        return self._clock, self.replica_id
+
+    def _row(self, key: Stamp, with_id: bool = False) -> Dict[str, object]:
+        entry: _Entry = self._entries[key]
+
+        return {
+            "key": list(key),
+            **{field: [value, *stamp] for field, (value, stamp) in zip(_FIELDS, entry[:-1])},
+            "removed": None if entry.removed is None else list(entry.removed),
+            **({"id": self._ids[key]} if with_id and key in self._ids else {})
+        }
+
+    def rows(self, keys: Iterable[Stamp]) -> List[Dict[str, object]]:
+        """
+        Get entries as they're stored, along with the local IDs of the ones that have them.
+        """
+        return list(map(lambda key: self._row(key, with_id=True), keys))
+
+    def record(self, todo_list: PVector[Item], records: Iterable[Tuple]) -> Tuple[Stamp, ...]:
+        """
+        Record local changes, as produced by `changes()`, each under a new stamp.
+
+        Only the fields a `replace` record actually changes are stamped, so edits to different
+        fields of one item on different replicas both survive a merge.
+
+        :param todo_list: The TODO list after the records were applied.
+        :type todo_list: PVector[Item]
+
+        :param records: The `append`, `replace` and `remove` records.
+        :type records: Iterable[Tuple]
+
+        :raises: ValueError when given any other kind of record.
+
+        :returns: The keys of the items that were changed.
+        :rtype: Tuple[Stamp, ...]
+        """
+
+        records = tuple(records)
+        unknown: Tuple[str, ...] = tuple(filter(
+            lambda kind: kind not in ("append", "replace", "remove"),
+            map(itemgetter(0), records)
+        ))
+
+        if unknown:
+            raise ValueError(
+                f"Can only replicate append, replace and remove records, not {unknown[0]!r}."
+            )
+
+        touched: Dict[Stamp, NoneType] = {}
+
+        for record in records:
+            stamp: Stamp = self._tick()
+            key: Stamp = stamp if record[0] == "append" else self._keys[record[1]]
+
+            if record[0] == "append":
+                self._entries[key] = _Entry(
+                    *map(
+                        lambda value: (value, stamp), (*record[1:4], *schedule_in(record, 5))
+                    ),
+                    None
+                )
+                self._ids[key] = record[4]
+                self._keys[record[4]] = key
+            elif record[0] == "replace":
+                self._entries[key] = self._entries[key]._replace(**{
+                    field: (value, stamp)
+                    for field, value in zip(_FIELDS, (*record[2:5], *schedule_in(record, 5)))
+                    if getattr(self._entries[key], field)[0] != value
+                })
+            else:
+                self._entries[key] = self._entries[key]._replace(removed=stamp)
+                self._keys.pop(self._ids.pop(key))
+
+            self._log.setdefault(self.replica_id, []).append((stamp[0], key))
+            touched[key] = None
+
+        self.todo_list = todo_list
+        return tuple(touched)
+
+    def delta(self, since: (Mapping[str, int] | NoneType) = None) -> Dict[str, object]:
+        """
+        Get the changes a replica with the version vector `since` hasn't seen.
+
+        Each log is searched for the changes after `since` in O(log n), so this costs time in
+        proportion to the number of items changed since then.
+
+        :param since: The peer's version vector, or None for every item.
+        :type since: (Mapping[str, int] | NoneType) = None
+
+        :returns: The delta, ready to be written out as JSON.
+        :rtype: Dict[str, object]
+        """
+
+        since = {} if since is None else since
+        keys: Iterable[Stamp] = dict.fromkeys(chain.from_iterable(map(
+            lambda log: map(itemgetter(1), islice(
+                log[1], bisect_right(log[1], since.get(log[0], 0), key=itemgetter(0)), None
+            )),
+            self._log.items()
+        )))
+
+        return {
+            "replica": self.replica_id,
+            "versions": self.versions(),
+            "entries": list(map(self._row, keys))
+        }
+
+    def snapshot(self) -> Dict[str, object]:
+        """
+        Get every entry, visible items first in TODO list order, with the local IDs.
+        """
+        return {
+            "replica": self.replica_id,
+            "versions": self.versions(),
+            "entries": self.rows(chain(
+                map(lambda item: self._keys[item.id], self.todo_list),
+                filter(lambda key: self._entries[key].removed is not None, self._entries)
+            ))
+        }
+
+    def _flush(self) -> NoneType:
+        """
+        Add the items seen for the first time so far in a merge to the end of the TODO list.
+        """
+        self.todo_list = self.todo_list.extend(self._new_items)
+        self._new_items = []
+
+    def _show(self, key: Stamp, entry: _Entry, item_id: (int | NoneType)) -> NoneType:
+        """
+        Bring the TODO list up to date with a merged entry in O(log n).
+
+        An item seen for the first time is added to the end with the next free ID, unless the
+        entry says which ID to use. New items are gathered up and added in one go by `_flush()`.
+        """
+
+        if key in self._ids and self._new_items:
+            self._flush()
+
+        if entry.removed is not None and key in self._ids:
+            self.todo_list = self.todo_list.delete(position_of(self.todo_list, self._ids[key]))
+            self._keys.pop(self._ids.pop(key))
+        elif entry.removed is None and key in self._ids:
+            self.todo_list = self.todo_list.set(
+                position_of(self.todo_list, self._ids[key]),
+                _as_item(entry=entry, item_id=self._ids[key])
+            )
+        elif entry.removed is None:
+            free_id: int = (
+                self._new_items[-1].id + 1 if self._new_items else next_id(self.todo_list)
+            )
+            self._ids[key] = free_id if item_id is None else item_id
+            self._keys[self._ids[key]] = key
+
+            if self._ids[key] >= free_id:
+                self._new_items.append(_as_item(entry=entry, item_id=self._ids[key]))
+            else:
+                # An item put back where it was, by undoing its removal, goes back in ID order.
+                self._flush()
+                self.todo_list = self.todo_list.insert(
+                    self.todo_list.bisect_left(item_id, key=lambda item: item.id),
+                    _as_item(entry=entry, item_id=item_id)
+                )
+
+    def merge(self, delta: Mapping, keep_ids: bool = False) -> Tuple[Stamp, ...]:
+        """
+        Merge another replica's changes into this one.
+
+        :param delta: A delta from `delta()` or `snapshot()`.
+        :type delta: Mapping
+
+        :param keep_ids: Whether to give new items the IDs stored with them, as when reloading
+            this replica's own file, rather than the next free ones.
+        :type keep_ids: bool = False
+
+        :returns: The keys of the items the merge changed.
+        :rtype: Tuple[Stamp, ...]
+        """
+
+        changed: Dict[Stamp, NoneType] = {}
+        new_events: Dict[str, List[Tuple[int, Stamp]]] = {}
+
+        for row in delta.get("entries", ()):
+            key, entry = _from_row(row)
+
+            for stamp in _stamps(key, entry):
+                if stamp[0] > self._versions.get(stamp[1], 0):
+                    new_events.setdefault(stamp[1], []).append((stamp[0], key))
+
+                self._clock = max(self._clock, stamp[0])
+
+            joined: _Entry = _join(self._entries.get(key), entry)
+
+            if joined != self._entries.get(key):
+                self._entries[key] = joined
+                self._show(key=key, entry=joined, item_id=row.get("id") if keep_ids else None)
+                changed[key] = None
+
+        self._flush()
+
+        for origin, events in new_events.items():
+            self._log.setdefault(origin, []).extend(sorted(events))
+
+        self._versions = {
+            origin: max(
+                self._versions.get(origin, 0),
+                delta.get("versions", {}).get(origin, 0),
+                max(map(itemgetter(0), new_events.get(origin, ())), default=0)
+            )
+            for origin in {*self._versions, *delta.get("versions", {}), *new_events}
+        }
+
+        return tuple(changed)
+
+
+class Replica:
+    """
+    A replicated TODO list stored at `path`, one JSON document per line.
+
+    Use `load()` to read the replica back (or start a new one) before recording anything, and
+    `close()` (or a `with` block) to make sure every line has reached the disk. The first line only
+    names the replica.
+    """
+
+    def __init__(self, path: str, sync_every: int = 32, compact_every: int = 1024) -> NoneType:
+        self.path: str = path
+        self.sync_every: int = sync_every
+        self.compact_every: int = compact_every
+        self.replicated: ReplicatedList = ReplicatedList()
+
+        self._file: (BinaryIO | NoneType) = None
+        self._unsynced: int = 0
+        self._since_snapshot: int = 0
+
+    def __enter__(self) -> "Replica":
+        return self
+
+    def __exit__(self, *_: object) -> NoneType:
+        self.close()
+
+    def _read_documents(self) -> Iterator[Dict[str, object]]:
+        """
+        Read the documents in the file, cutting off one that was only partly written.
+        """
+
+        for line in iter(self._file.readline, b""):
+            try:
+                document: Dict[str, object] = loads(line) if line.endswith(b"\n") else None
+            except (JSONDecodeError, UnicodeDecodeError):
+                document = None
+
+            if document is None:
+                self._file.truncate(self._file.tell() - len(line))
+                return
+
+            yield document
+
+    def _write(self, document: Mapping) -> NoneType:
+        self._file.write((dumps(document) + "\n").encode("utf-8"))
+        self._unsynced += 1
+        self._since_snapshot += 1
+
+        if self._since_snapshot >= self.compact_every:
+            self.compact()
+        elif self._unsynced >= self.sync_every:
+            self.sync()
+
+    def load(self) -> PVector[Item]:
+        """
+        Read the replica back, or start a new one with a new ID if there's nothing at `path` yet.
+
+        :returns: The replica's TODO list.
+        :rtype: PVector[Item]
+        """
+
+        self._file = open(self.path, "a+b")
+        self._file.seek(0)
+
+        documents: Iterator[Dict[str, object]] = self._read_documents()
+        header: (Dict[str, object] | NoneType) = next(documents, None)
+
+        if header is not None:
+            self.replicated = ReplicatedList(replica_id=header["replica"])
+
+        for document in documents:
+            self.replicated.merge(delta=document, keep_ids=True)
+            self._since_snapshot += 1
+
+        self._file.seek(0, 2)
+
+        if header is None:
+            self._write(document={"replica": self.replicated.replica_id})
+            self.sync()
+
+        return self.replicated.todo_list
+
+    def record(
+                self,
+                todo_list: PVector[Item],
+                operations: Iterable[Tuple]
+            ) -> PVector[Item]:
+        """
+        Record local changes, as produced by `changes()`, and write them out as one line.
+
+        :param todo_list: The TODO list after the records were applied.
+        :type todo_list: PVector[Item]
+
+        :param operations: The `append`, `replace` and `remove` records.
+        :type operations: Iterable[Tuple]
+
+        :raises: ValueError when given any other kind of record.
+
+        :returns: `todo_list`, unchanged.
+        :rtype: PVector[Item]
+        """
+
+        touched: Tuple[Stamp, ...] = self.replicated.record(todo_list=todo_list, records=operations)
+
+        if touched:
+            self._write(document={
+                "versions": self.replicated.versions(), "entries": self.replicated.rows(touched)
+            })
+
+        return todo_list
+
+    def step(
+                self,
+                todo_list: PVector[Item],
+                operation: Tuple
+            ) -> PVector[Item]:
+        """
+        Apply a single operation and record it; a drop-in `step` for `apply_operations()`.
+
+        :param todo_list: The TODO list to apply the operation to.
+        :type todo_list: PVector[Item]
+
+        :param operation: The name of the operation followed by its arguments.
+        :type operation: Tuple
+
+        :returns: The updated TODO list.
+        :rtype: PVector[Item]
+        """
+
+        after: PVector[Item] = apply_operation(todo_list, operation)
+
+        return self.record(
+            todo_list=after,
+            operations=records_for(before=todo_list, after=after, operation=operation)
+        )
+
+    def export_delta(self, path: str, since: (str | NoneType) = None) -> int:
+        """
+        Write the changes a peer hasn't seen to a file, for the peer to `merge_delta()`.
+
+        :param path: The file to write the delta to.
+        :type path: str
+
+        :param since: A delta the peer exported earlier, whose version vector says what the peer
+            had seen, or None to export every item.
+        :type since: (str | NoneType) = None
+
+        :returns: How many items the delta holds.
+        :rtype: int
+        """
+
+        if since is None:
+            versions: Dict[str, int] = {}
+        else:
+            with open(since, encoding="utf-8") as peer:
+                versions = load(peer)["versions"]
+
+        delta: Dict[str, object] = self.replicated.delta(since=versions)
+
+        with open(path, "w", encoding="utf-8") as exported:
+            dump(delta, exported)
+
+        return len(delta["entries"])
+
+    def merge_delta(self, path: str) -> int:
+        """
+        Merge a delta from another replica into this one and store what it changed.
+
+        :param path: The file the other replica exported the delta to.
+        :type path: str
+
+        :returns: How many items the merge changed.
+        :rtype: int
+        """
+
+        with open(path, encoding="utf-8") as imported:
+            changed: Tuple[Stamp, ...] = self.replicated.merge(delta=load(imported))
+
+        self._write(document={
+            "versions": self.replicated.versions(), "entries": self.replicated.rows(changed)
+        })
+        self.sync()
+
+        return len(changed)
+
+    def sync(self) -> NoneType:
+        """
+        Flush every line written so far to the disk.
+        """
+
+        self._file.flush()
+        fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def compact(self) -> NoneType:
+        """
+        Rewrite the file as the replica's name followed by a single document holding every entry.
+        """
+
+        with open(f"{self.path}.tmp", "w", encoding="utf-8") as snapshot:
+            snapshot.write(dumps({"replica": self.replicated.replica_id}) + "\n")
+            snapshot.write(dumps(self.replicated.snapshot()) + "\n")
+            snapshot.flush()
+            fsync(snapshot.fileno())
+
+        self._file.close()
+        replace(f"{self.path}.tmp", self.path)
+
+        self._file = open(self.path, "a+b")
+        self._unsynced = 0
+        self._since_snapshot = 1
+
+    def close(self) -> NoneType:
+        """
+        Flush any lines still waiting to be written and close the file.
+        """
+
+        if self._file is not None and not self._file.closed:
+            self.sync()
+            self._file.close()
@@ -0,0 +1,293 @@
+"""
+Indexes of the incomplete items by priority and by due date, for the Next Up and Overdue Items
+commands.
+
+Sorting the TODO list every time one of these views is shown costs O(n log n) however few items are
+shown, so `ScheduleIndex` keeps two binary heaps instead, one of the incomplete items ordered by
+priority and one of those with a due date ordered by due date, and keeps them up to date from the
+operations that turn one version of the TODO list into the next (see `changes()` in
+`src/operations.py`), the same as the search index.
+
+An item whose place changes is pushed onto the heap again rather than moved, and its old entry is
+left behind: each item's current place is kept in a dictionary, and an entry that doesn't match it
+is skipped when the heap is read. Once more than half of a heap is left behind entries it's rebuilt
+from the dictionary, so the heaps stay within a constant factor of the number of scheduled items.
+
+The first k items are read off a heap without popping anything: the heap is walked as the binary
+tree it is, from the root, always taking the smallest entry seen so far whose parent has already
+been taken. Only the entries taken and their children are ever looked at, so the walk costs
+O(k log k), plus any left behind entries on the way.
+
+As with the search index, the TODO list isn't read until the first view, or until more changes are
+waiting than it has items.
+
+Items are ordered by priority first, 1 being the highest and items without one last, then by the
+earliest due date and then by ID. Overdue items are ordered by due date first and then the same way.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from datetime import date
+
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+from types import NoneType
+
+# Local Imports
+from src.item import Item
+
+
+# An item's place in a heap; it ends with the item's ID, so no two items have the same place.
+Rank = Tuple[(bool | int | str), ...]
+
+# Roughly what each entry of a heap costs (its rank and its slot in the list), what each item's
+# current place costs in its dictionary, and what each change waiting to be applied costs.
+_ENTRY_BYTES: int = 96
+_PLACE_BYTES: int = 104
+_PENDING_BYTES: int = 88
+
+
+def parse_priority(text: str) -> (int | NoneType):
+    """
+    Read a priority entered by the user: a whole number of 1 or more, or nothing for none.
+
+    :param text: What the user entered.
+    :type text: str
+
+    :raises: ValueError when it's neither.
+
+    :returns: The priority, or None.
+    :rtype: (int | NoneType)
+    """
+
+    if text.strip() == "":
+        return None
+
+    if not text.strip().isdigit() or int(text) < 1:
+        raise ValueError(f"A priority is a whole number of 1 or more, not {text!r}.")
+
+    return int(text)
+
+
+def parse_due(text: str) -> (str | NoneType):
+    """
+    Read a due date entered by the user, as `YYYY-MM-DD`, or nothing for none.
+
+    :param text: What the user entered.
+    :type text: str
+
+    :raises: ValueError when it's neither.
+
+    :returns: The date as `YYYY-MM-DD`, or None.
+    :rtype: (str | NoneType)
+    """
+
+    if text.strip() == "":
+        return None
+
+    try:
+        return date.fromisoformat(text.strip()).isoformat()
+    except ValueError:
+        raise ValueError(f"A due date is written as YYYY-MM-DD, not {text!r}.") from None
+
+
+def _priority_rank(item_id: int, priority: (int | NoneType), due: (str | NoneType)) -> Rank:
+    return (priority is None, priority or 0, due is None, due or "", item_id)
+
+
+def _due_rank(item_id: int, priority: (int | NoneType), due: str) -> Rank:
+    return (due, priority is None, priority or 0, item_id)
+
+
+def _smallest(
+            heap: List[Rank],
+            ranks: Dict[int, Rank],
+            until: Callable[[Rank], bool]
+        ) -> Iterator[int]:
+    """
+    Walk a heap in order, giving the ID of each entry that's still current until `until` is true.
+    """
+
+    candidates: List[Tuple[Rank, int]] = [(heap[0], 0)] if heap else []
+
+    while candidates and not until(candidates[0][0]):
+        rank, at = heappop(candidates)
+
+        if ranks.get(rank[-1]) == rank:
+            yield rank[-1]
+
+        for child in filter(lambda child: child < len(heap), (2 * at + 1, 2 * at + 2)):
+            heappush(candidates, (heap[child], child))
+
+
+class ScheduleIndex:
+    """
+    Heaps of the incomplete items by priority and by due date.
+    """
+
+    def __init__(self, todo_list: Sequence[Item] = ()) -> NoneType:
+        self._by_priority: List[Rank] = []
+        self._by_due: List[Rank] = []
+        self._priority_ranks: Dict[int, Rank] = {}
+        self._due_ranks: Dict[int, Rank] = {}
+
+        # The TODO list still to be indexed, and the changes made since, until the first view.
+        self._unindexed: (Sequence[Item] | NoneType) = todo_list
+        self._pending: List[Tuple] = []
+
+    def memory_used(self) -> int:
+        """
+        The estimated bytes the index holds, worked out from the sizes of its heaps in O(1).
+        """
+        return (
+            (len(self._by_priority) + len(self._by_due)) * _ENTRY_BYTES
+            + (len(self._priority_ranks) + len(self._due_ranks)) * _PLACE_BYTES
+            + len(self._pending) * _PENDING_BYTES
+        )
+
+    def _build(self) -> NoneType:
+        if self._unindexed is not None:
+            todo_list, self._unindexed = self._unindexed, None
+
+            any(map(
+                lambda item: self._index(
+                    item_id=item.id, completed=item.completed, priority=item.priority, due=item.due
+                ),
+                todo_list
+            ))
+            self._apply(records=self._pending)
+            self._pending = []
+
+    def _place(
+                self,
+                heap: List[Rank],
+                ranks: Dict[int, Rank],
+                item_id: int,
+                rank: (Rank | NoneType)
+            ) -> NoneType:
+        if rank is None:
+            ranks.pop(item_id, None)
+        elif ranks.get(item_id) != rank:
+            ranks[item_id] = rank
+            heappush(heap, rank)
+
+        # Rebuilt once most of it is left behind entries, which keeps it O(scheduled items).
+        if len(heap) > 2 * len(ranks) + 64:
+            heap[:] = ranks.values()
+            heapify(heap)
+
+    def _index(
+                self,
+                item_id: int,
+                completed: bool = True,
+                priority: (int | NoneType) = None,
+                due: (str | NoneType) = None
+            ) -> NoneType:
+        scheduled: bool = not completed and (priority is not None or due is not None)
+
+        self._place(
+            heap=self._by_priority,
+            ranks=self._priority_ranks,
+            item_id=item_id,
+            rank=_priority_rank(item_id, priority, due) if scheduled else None
+        )
+        self._place(
+            heap=self._by_due,
+            ranks=self._due_ranks,
+            item_id=item_id,
+            rank=_due_rank(item_id, priority, due) if scheduled and due is not None else None
+        )
+
+    def apply(self, records: Iterable[Tuple]) -> NoneType:
+        """
+        Update the index with operation records, as produced by `changes()`.
+
+        :param records: The `append`, `replace` and `remove` records to apply.
+        :type records: Iterable[Tuple]
+        """
+
+        if self._unindexed is None:
+            self._apply(records=records)
+        else:
+            self._pending.extend(records)
+
+            # Once more changes are waiting than there are items, indexing costs no more than
+            # keeping them does, so the changes kept never outgrow the TODO list.
+            if len(self._pending) > len(self._unindexed):
+                self._build()
+
+    def _apply(self, records: Iterable[Tuple]) -> NoneType:
+        any(map(
+            lambda record: (
+                self._index(item_id=record[1])
+                if record[0] == "remove"
+                else (
+                    self._index(record[1], record[4], *record[5:])
+                    if record[0] == "replace"
+                    else self._index(record[4], record[3], *record[5:])
+                )
+            ),
+            records
+        ))
+
+    def next_up(self, count: int) -> Tuple[int, ...]:
+        """
+        Find the incomplete items with a priority or a due date that should be done first.
+
+        :param count: How many items to find, at most.
+        :type count: int
+
+        :returns: The IDs of the items, highest priority first.
+        :rtype: Tuple[int, ...]
+        """
+
+        self._build()
+
+        return tuple(map(
+            lambda numbered: numbered[1],
+            zip(range(count), _smallest(
+                heap=self._by_priority, ranks=self._priority_ranks, until=lambda rank: False
+            ))
+        ))
+
+    def overdue(self, today: str, count: int) -> Tuple[int, ...]:
+        """
+        Find the incomplete items that were due before `today`.
+
+        :param today: Today's date, as `YYYY-MM-DD`.
+        :type today: str
+
+        :param count: How many items to find, at most.
+        :type count: int
+
+        :returns: The IDs of the items, the longest overdue first.
+        :rtype: Tuple[int, ...]
+        """
+
+        self._build()
+
+        return tuple(map(
+            lambda numbered: numbered[1],
+            zip(range(count), _smallest(
+                heap=self._by_due, ranks=self._due_ranks, until=lambda rank: rank[0] >= today
+            ))
+        ))
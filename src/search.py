@@ -0,0 +1,224 @@
+"""
+Inverted index for searching the titles and descriptions of TODO list items.
+
+Titles and descriptions are split into lower case words, and the index maps each word to the IDs of
+the items that use it. The distinct words are also kept in a sorted `PVector`, so every word that
+starts with a given prefix is found with one binary search followed by a walk over just the matching
+words. A query never looks at items that don't match, so it doesn't get slower as the TODO list
+grows.
+
+The index is kept up to date from the operations that turn one version of the TODO list into the
+next (see `changes()` in `src/operations.py`), so each change only re-indexes the items it touched.
+
+The TODO list isn't indexed until the first search, and changes made before then are kept to be
+applied straight after it, so a list that's never searched is never read in full (which matters
+for an archive, where reading an item means decoding it, see `src/archive.py`). Once more changes
+are waiting than the TODO list has items, it's indexed there and then, so a long running session or
+server that never searches doesn't keep every change it ever made.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from functools import reduce
+
+from itertools import takewhile
+
+from re import findall
+
+from sys import getsizeof
+
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import List
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+
+from types import NoneType
+
+# Local Imports
+from src.item import Item
+from src.pvector import NODE_BYTES
+from src.pvector import PVector
+
+
+# Roughly what the index holds for each distinct word, besides the word itself: its set of IDs, its
+# dictionary entry and its node in the sorted words.
+_WORD_BYTES: int = 280 + NODE_BYTES
+
+# Roughly what the index holds for each item (its set of words and their dictionary entry), for
+# each word an item uses (the ID in the word's set and the word in the item's set) and for each
+# change waiting to be applied.
+_ITEM_BYTES: int = 280
+_USE_BYTES: int = 40
+_PENDING_BYTES: int = 88
+
+
+def tokenise(text: (str | NoneType)) -> FrozenSet[str]:
+    """
+    Split text into the distinct lower case words it contains.
+
+    :param text: The text to split.
+    :type text: (str | NoneType)
+
+    :returns: The words in the text.
+    :rtype: FrozenSet[str]
+    """
+    return frozenset(findall(r"\w+", (text or "").lower()))
+
+
+class SearchIndex:
+    """
+    An inverted index from words to the IDs of the items whose title or description use them.
+    """
+
+    def __init__(self, todo_list: Sequence[Item] = ()) -> NoneType:
+        self._postings: Dict[str, Set[int]] = {}
+        self._words: PVector[str] = PVector()
+        self._item_words: Dict[int, FrozenSet[str]] = {}
+
+        # The TODO list still to be indexed, and the changes made since, until the first search.
+        self._unindexed: (Sequence[Item] | NoneType) = todo_list
+        self._pending: List[Tuple] = []
+        self._bytes: int = 0
+
+    def memory_used(self) -> int:
+        """
+        The estimated bytes the index holds, kept up to date as items are indexed, so it's O(1).
+        """
+        return self._bytes + len(self._pending) * _PENDING_BYTES
+
+    def _build(self) -> NoneType:
+        if self._unindexed is not None:
+            todo_list, self._unindexed = self._unindexed, None
+
+            self._apply(records=map(
+                lambda item: ("append", item.title, item.description, item.completed, item.id),
+                todo_list
+            ))
+            self._apply(records=self._pending)
+            self._pending = []
+
+    def _add_word(self, word: str, item_id: int) -> NoneType:
+        if word not in self._postings:
+            self._postings[word] = set()
+            self._words = self._words.insert(self._words.bisect_left(word), word)
+            self._bytes += getsizeof(word) + _WORD_BYTES
+
+        self._postings[word].add(item_id)
+        self._bytes += _USE_BYTES
+
+    def _remove_word(self, word: str, item_id: int) -> NoneType:
+        self._postings[word].discard(item_id)
+        self._bytes -= _USE_BYTES
+
+        if not self._postings[word]:
+            del self._postings[word]
+            self._words = self._words.delete(self._words.bisect_left(word))
+            self._bytes -= getsizeof(word) + _WORD_BYTES
+
+    def _unindex(self, item_id: int) -> NoneType:
+        self._bytes -= _ITEM_BYTES if item_id in self._item_words else 0
+
+        any(map(
+            lambda word: self._remove_word(word=word, item_id=item_id),
+            self._item_words.pop(item_id, frozenset())
+        ))
+
+    def _index(
+                self,
+                item_id: int,
+                title: (str | NoneType),
+                description: (str | NoneType)
+            ) -> NoneType:
+        self._unindex(item_id=item_id)
+        self._item_words[item_id] = tokenise(title) | tokenise(description)
+        self._bytes += _ITEM_BYTES
+
+        any(map(
+            lambda word: self._add_word(word=word, item_id=item_id),
+            self._item_words[item_id]
+        ))
+
+    def apply(self, records: Iterable[Tuple]) -> NoneType:
+        """
+        Update the index with operation records, as produced by `changes()`.
+
+        :param records: The `append`, `replace` and `remove` records to apply.
+        :type records: Iterable[Tuple]
+        """
+
+        if self._unindexed is None:
+            self._apply(records=records)
+        else:
+            self._pending.extend(records)
+
+            # Once more changes are waiting than there are items, indexing costs no more than
+            # keeping them does, so the changes kept never outgrow the TODO list.
+            if len(self._pending) > len(self._unindexed):
+                self._build()
+
+    def _apply(self, records: Iterable[Tuple]) -> NoneType:
+        any(map(
+            lambda record: (
+                self._unindex(item_id=record[1])
+                if record[0] == "remove"
+                else (
+                    self._index(item_id=record[1], title=record[2], description=record[3])
+                    if record[0] == "replace"
+                    else self._index(item_id=record[4], title=record[1], description=record[2])
+                )
+            ),
+            records
+        ))
+
+    def words_starting_with(self, prefix: str) -> Tuple[str, ...]:
+        """
+        Find every indexed word that starts with `prefix`.
+
+        :param prefix: The start of the words to find.
+        :type prefix: str
+
+        :returns: The matching words, in sorted order.
+        :rtype: Tuple[str, ...]
+        """
+
+        self._build()
+
+        return tuple(takewhile(
+            lambda word: word.startswith(prefix),
+            self._words.iterate_from(self._words.bisect_left(prefix))
+        ))
+
+    def search(self, query: str) -> Tuple[int, ...]:
+        """
+        Find the items that match every word in `query`, each word matching as a prefix.
+
+        For example "buy mil" matches an item titled "Buy milk".
+
+        :param query: The words to search for.
+        :type query: str
+
+        :returns: The IDs of the matching items, in ascending order.
+        :rtype: Tuple[int, ...]
+        """
+
+        # Smallest first, so the intersection never grows past the rarest word's matches.
+        matches: Tuple[Set[int], ...] = tuple(sorted(map(
+            lambda prefix: set().union(*map(self._postings.get, self.words_starting_with(prefix))),
+            tokenise(query)
+        ), key=len))
+
+        return tuple(sorted(
+            reduce(lambda found, more: found & more, matches[1:], matches[0]) if matches else ()
+        ))
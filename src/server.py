@@ -0,0 +1,298 @@
+"""
+Local server that shares one TODO list between many clients.
+
+The server listens on a TCP port or a Unix socket, and clients talk to it a line at a time. Each
+request is one line, and each gets exactly one line back: a JSON object with `"ok": true` and the
+result, or `"ok": false` and an `"error"` saying what was wrong with the request.
+
+Changes to the TODO list are written the same way as a line of a batch script (see
+`src/operations.py`), and answered with the new version number and the `changes()` they made:
+
+    add "Buy milk" "Two litres, semi-skimmed"
+    -> {"ok": true, "version": 1, "changes": [["append", "Buy milk", "Two litres, ...", false, 0]]}
+
+Along with those, the TODO list can be read with:
+
+    list            -> {"ok": true, "version": 1, "items": [{"title": ..., "id": 0}, ...]}
+    get 0           -> {"ok": true, "version": 1, "item": {"title": ..., "id": 0}}
+    search buy mil  -> {"ok": true, "version": 1, "ids": [0]}
+    quit            (closes the connection)
+
+Every client is served by its own coroutine on a single `asyncio` event loop, so thousands of idle
+connections cost a little memory each rather than a thread each. A request is read, applied and
+answered without awaiting anything in between, so requests from different clients are applied one
+at a time in the order they arrive, and no client ever sees half of a change. Each client's replies
+are awaited (`drain()`) before its next request is read, so a client that stops reading slows down
+only itself.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from asyncio import AbstractServer
+from asyncio import StreamReader
+from asyncio import StreamWriter
+from asyncio import open_connection
+from asyncio import open_unix_connection
+from asyncio import start_server
+from asyncio import start_unix_server
+
+from json import dumps
+from json import loads
+
+from shlex import split
+
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+
+from types import NoneType
+
+# Local Imports
+from src.item import Item
+from src.item import as_items
+from src.item import serialise
+from src.journal import Journal
+from src.operations import apply_operation
+from src.operations import parse_operation
+from src.operations import position_of
+from src.operations import records_for
+from src.pvector import PVector
+from src.search import SearchIndex
+
+
+Response = Dict[str, object]
+
+
+def _address(address: str) -> Tuple[str, (int | NoneType)]:
+    """
+    Split an address into a host and port, or a Unix socket path and None.
+
+    Anything with a `/` in it is a Unix socket path; anything else is `HOST:PORT`.
+    """
+
+    if "/" in address:
+        return address, None
+
+    host, _, port = address.rpartition(":")
+
+    return host or "127.0.0.1", int(port)
+
+
+class TodoServer:
+    """
+    One shared TODO list and the requests that read and change it.
+
+    A journal has to have been `load()`ed already, with the TODO list it loaded passed in too.
+    """
+
+    def __init__(
+                self,
+                todo_list: Iterable[Item] = (),
+                journal: (Journal | NoneType) = None
+            ) -> NoneType:
+        self.todo_list: PVector[Item] = (
+            todo_list if isinstance(todo_list, PVector) else PVector(as_items(todo_list))
+        )
+        self.journal: (Journal | NoneType) = journal
+        self.version: int = 0
+
+        self._index: SearchIndex = SearchIndex(todo_list=self.todo_list)
+
+    def _read(self, words: List[str]) -> Response:
+        if words[0] == "list":
+            return {
+                "ok": True, "version": self.version, "items": list(map(serialise, self.todo_list))
+            }
+
+        if words[0] == "search":
+            return {
+                "ok": True,
+                "version": self.version,
+                "ids": list(self._index.search(query=" ".join(words[1:])))
+            }
+
+        if len(words) != 2:
+            raise ValueError(
+                f"Request 'get' takes 1 argument, the item's ID, got {len(words) - 1}."
+            )
+
+        position: (int | NoneType) = position_of(self.todo_list, int(words[1]))
+
+        return {
+            "ok": True,
+            "version": self.version,
+            "item": None if position is None else serialise(self.todo_list[position])
+        }
+
+    def _write(self, line: str) -> Response:
+        operation: Tuple = parse_operation(line=line)
+        before: PVector[Item] = self.todo_list
+        after: PVector[Item] = apply_operation(before, operation)
+        records: Tuple[Tuple, ...] = records_for(before=before, after=after, operation=operation)
+
+        if records:
+            self._index.apply(records=records)
+            self.version += 1
+            self.todo_list = (
+                after if self.journal is None
+                else self.journal.record(todo_list=after, operations=records)
+            )
+
+        return {"ok": True, "version": self.version, "changes": list(map(list, records))}
+
+    def handle(self, line: str) -> Response:
+        """
+        Answer one request, changing the TODO list if it asks to.
+
+        :param line: The request, for example `toggle 3` or `search milk`.
+        :type line: str
+
+        :returns: The response to send back.
+        :rtype: Response
+        """
+
+        try:
+            words: List[str] = split(line)
+
+            if not words:
+                raise ValueError("Empty request.")
+
+            return (
+                self._read(words=words)
+                if words[0] in ("list", "get", "search")
+                else self._write(line=line)
+            )
+        except ValueError as error:
+            return {"ok": False, "error": str(error)}
+
+    async def serve_client(self, reader: StreamReader, writer: StreamWriter) -> NoneType:
+        """
+        Answer one client's requests until it sends `quit` or disconnects.
+
+        :param reader: The stream the client's requests arrive on.
+        :type reader: StreamReader
+
+        :param writer: The stream to send the responses on.
+        :type writer: StreamWriter
+        """
+
+        try:
+            while True:
+                # A line too long for the reader's buffer, or one that isn't UTF-8, is answered
+                # with an error like any other bad request, and the next line is read after it.
+                try:
+                    line: str = (await reader.readline()).decode("utf-8").strip()
+                    response: (Response | NoneType) = None
+                except ValueError as error:
+                    line, response = "", {"ok": False, "error": f"Unreadable request: {error}"}
+
+                if line == "quit" or (response is None and not line and reader.at_eof()):
+                    break
+
+                writer.write(
+                    dumps(response or self.handle(line=line)).encode("utf-8") + b"\n"
+                )
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, address: str) -> AbstractServer:
+        """
+        Start listening for clients.
+
+        :param address: `HOST:PORT` (port 0 picks a free one) or the path of a Unix socket.
+        :type address: str
+
+        :returns: The listening server, for example to find the port it picked or to close it.
+        :rtype: AbstractServer
+        """
+
+        host, port = _address(address=address)
+
+        return await (
+            start_unix_server(self.serve_client, path=host)
+            if port is None
+            else start_server(self.serve_client, host=host, port=port)
+        )
+
+
+async def serve(
+            address: str,
+            todo_list: Iterable[Item] = (),
+            journal: (Journal | NoneType) = None
+        ) -> NoneType:
+    """
+    Serve a TODO list at `address` until the program is stopped.
+
+    :param address: `HOST:PORT` or the path of a Unix socket.
+    :type address: str
+
+    :param todo_list: The TODO list to start with.
+    :type todo_list: Iterable[Item] = ()
+
+    :param journal: The journal to record every change in, if any.
+    :type journal: (Journal | NoneType) = None
+    """
+
+    async with await TodoServer(todo_list=todo_list, journal=journal).start(address) as server:
+        print(f"Serving the TODO list on {address}.")
+        await server.serve_forever()
+
+
+class TodoClient:
+    """
+    A client for `TodoServer`, which sends one request at a time and waits for its response.
+    """
+
+    def __init__(self, reader: StreamReader, writer: StreamWriter) -> NoneType:
+        self._reader: StreamReader = reader
+        self._writer: StreamWriter = writer
+
+    @classmethod
+    async def connect(cls, address: str) -> "TodoClient":
+        """
+        Connect to a server at `HOST:PORT` or the path of a Unix socket.
+        """
+
+        host, port = _address(address=address)
+
+        return cls(*await (
+            open_unix_connection(path=host) if port is None else open_connection(host, port)
+        ))
+
+    async def request(self, line: str) -> Response:
+        """
+        Send one request and wait for the response.
+
+        :param line: The request, for example `add "Title" "Description"`.
+        :type line: str
+
+        :returns: The server's response.
+        :rtype: Response
+        """
+
+        self._writer.write(line.encode("utf-8") + b"\n")
+        await self._writer.drain()
+
+        return loads(await self._reader.readline())
+
+    async def close(self) -> NoneType:
+        """
+        Say goodbye to the server and close the connection.
+        """
+
+        self._writer.write(b"quit\n")
+        self._writer.close()
+        await self._writer.wait_closed()
@@ -0,0 +1,391 @@
+"""
+SQLite storage for the TODO list, as an alternative to the journal in `src/journal.py`.
+
+Each item is one row of the `items` table, keyed by its ID. The TODO list is always in ID order, so
+`ORDER BY id` gives it back in order. There are indexes on `completed` and `title`, so counting the
+completed items or finding items by title doesn't have to read the whole table. Items' priorities
+and due dates are kept in the `priority` and `due` columns, which are added to databases made before
+they existed when they're opened.
+
+A `SqliteStore` can be used anywhere a `Journal` can: `load()` the TODO list, then `record()` the
+`changes()` each command makes, or use `step()` with `apply_operations()`. The statements are fixed
+SQL with `?` placeholders, which sqlite3 compiles once and keeps in its statement cache, and runs of
+records of the same kind are sent with a single `executemany()`.
+
+Everything `record()`ed is committed straight away, in one transaction per call, however many
+records it writes. `step()` is meant for batches, and commits once every `commit_every` operations
+(and when the store is closed) rather than once per operation.
+
+The database is opened in WAL mode with `synchronous=NORMAL`. A commit appends to the write-ahead
+log without waiting for an `fsync`, and readers never block the writer. A crash can lose at most
+the last few commits, and never leaves the database corrupt.
+
+The TODO list `load()` gives back doesn't read the table into memory. It's a lazy `PVector` (see
+`PVector.lazy()`) over the IDs of the rows, the only column read up front. Rows are read as the list
+is looked at, a page of `page_size` at a time with a cursor on the ID (`WHERE id > ? ... LIMIT ?`),
+and how many items are completed in any run of them is counted by the index on `completed`, so the
+menu's summary and a page of the list cost a few indexed queries however big the table is. Before a
+row is overwritten, whatever the loaded list still needs from it is fetched and kept (see
+`PVector.fetch()`), so earlier versions of the list, in the undo history say, don't change.
+`count()`, `count_completed()` and `titles_starting_with()` answer straight from the indexes without
+loading anything.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from array import array
+
+from bisect import bisect_left
+
+from itertools import groupby
+from itertools import takewhile
+
+from sqlite3 import Connection
+from sqlite3 import connect
+
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Tuple
+
+from types import NoneType
+
+# Local Imports
+from src.item import Item
+from src.item import schedule_in
+from src.operations import apply_operation
+from src.operations import records_for
+from src.pvector import PVector
+
+
+_SCHEMA: Tuple[str, ...] = (
+    "CREATE TABLE IF NOT EXISTS items ("
+    + "id INTEGER PRIMARY KEY, title TEXT, description TEXT, completed INTEGER NOT NULL,"
+    + " priority INTEGER, due TEXT)",
+    "CREATE INDEX IF NOT EXISTS items_completed ON items (completed)",
+    "CREATE INDEX IF NOT EXISTS items_title ON items (title)",
+)
+
+# The columns added to the table since it was first made, to add to databases that don't have them.
+_ADDED_COLUMNS: Dict[str, str] = {"priority": "INTEGER", "due": "TEXT"}
+
+# The statement for each kind of record, and how to get its parameters from the record.
+_STATEMENTS: Dict[str, Tuple[str, Callable[[Tuple], Tuple]]] = {
+    "append": (
+        "INSERT INTO items (title, description, completed, id, priority, due)"
+        + " VALUES (?, ?, ?, ?, ?, ?)",
+        lambda record: (*record[1:5], *schedule_in(record, 5))
+    ),
+    "replace": (
+        "UPDATE items SET title = ?, description = ?, completed = ?, priority = ?, due = ?"
+        + " WHERE id = ?",
+        lambda record: (*record[2:5], *schedule_in(record, 5), record[1])
+    ),
+    "remove": (
+        "DELETE FROM items WHERE id = ?",
+        lambda record: record[1:2]
+    ),
+}
+
+_PAGE: str = (
+    "SELECT id, title, description, completed, priority, due FROM items WHERE id > ? ORDER BY id"
+    + " LIMIT ?"
+)
+
+_IDS: str = "SELECT id FROM items ORDER BY id"
+
+_COUNT: str = "SELECT COUNT(*) FROM items"
+
+_COUNT_COMPLETED: str = "SELECT COUNT(*) FROM items WHERE completed = ?"
+
+_COUNT_COMPLETED_BETWEEN: str = (
+    "SELECT COUNT(*) FROM items WHERE completed = 1 AND id BETWEEN ? AND ?"
+)
+
+_TITLES_FROM: str = (
+    "SELECT id, title, description, completed, priority, due FROM items"
+    + " WHERE title IS NOT NULL AND title >= ? ORDER BY title, id"
+)
+
+
+def _as_item(row: Tuple) -> Item:
+    return Item(row[1], row[2], bool(row[3]), row[0], row[4], row[5])
+
+
+class _Rows:
+    """
+    The rows of the table as they were when the TODO list was loaded, read a page at a time as
+    they're reached.
+
+    They're read on a connection of their own, so the TODO list can still be read once the store
+    that loaded it is closed.
+    """
+
+    def __init__(self, path: str, page_size: int) -> NoneType:
+        self._connection: Connection = connect(path)
+        self._page_size: int = page_size
+        self._page: Dict[int, Item] = {}
+        self._next: int = 0
+
+        self.ids: array = array("q", map(lambda row: row[0], self._connection.execute(_IDS)))
+
+    def item(self, position: int) -> Item:
+        """
+        Read the item at a position. When the items are being read in order, the page of items
+        after it is read along with it.
+        """
+
+        if self.ids[position] not in self._page:
+            self._page = {
+                item.id: item for item in map(_as_item, self._connection.execute(
+                    _PAGE,
+                    (self.ids[position] - 1, self._page_size if position == self._next else 1)
+                ))
+            }
+
+        self._next = position + 1
+        return self._page[self.ids[position]]
+
+    def completed_between(self, low: int, high: int) -> int:
+        """
+        Count the completed items from position `low` up to, but not including, `high`.
+        """
+        return 0 if high <= low else self._connection.execute(
+            _COUNT_COMPLETED_BETWEEN, (self.ids[low], self.ids[high - 1])
+        ).fetchone()[0]
+
+
+class SqliteStore:
+    """
+    The TODO list stored in an SQLite database at `path`.
+
+    Use `load()` to open the database and read the stored TODO list back before recording anything,
+    and `close()` (or a `with` block) to commit anything still outstanding.
+    """
+
+    def __init__(self, path: str, commit_every: int = 1024, page_size: int = 1000) -> NoneType:
+        self.path: str = path
+        self.commit_every: int = commit_every
+        self.page_size: int = page_size
+
+        self._connection: (Connection | NoneType) = None
+        self._uncommitted: int = 0
+
+        # The rows and the lazy TODO list over them, as they were when the list was loaded.
+        self._rows: (_Rows | NoneType) = None
+        self._loaded: PVector[Item] = PVector()
+
+    def __enter__(self) -> "SqliteStore":
+        return self
+
+    def __exit__(self, *_: object) -> NoneType:
+        self.close()
+
+    def _open(self) -> Connection:
+        """
+        Open the database, creating it or adding any missing columns if need be, unless it's open.
+        """
+
+        if self._connection is not None:
+            return self._connection
+
+        # Transactions are started explicitly, so several records can share one.
+        self._connection = connect(self.path, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+
+        for statement in _SCHEMA:
+            self._connection.execute(statement)
+
+        columns: Tuple[str, ...] = tuple(map(
+            lambda column: column[1], self._connection.execute("PRAGMA table_info(items)")
+        ))
+
+        for column, kind in filter(lambda added: added[0] not in columns, _ADDED_COLUMNS.items()):
+            self._connection.execute(f"ALTER TABLE items ADD COLUMN {column} {kind}")
+
+        return self._connection
+
+    def load(self) -> PVector[Item]:
+        """
+        Open the database, creating it if need be, and get the stored TODO list.
+
+        Only the IDs are read now; the rows are read as they're reached.
+
+        :returns: The stored TODO list, or an empty one if nothing has been stored yet.
+        :rtype: PVector[Item]
+        """
+
+        self._open()
+        self._rows = _Rows(path=self.path, page_size=self.page_size)
+        self._loaded = PVector.lazy(
+            size=len(self._rows.ids),
+            value_at=self._rows.item,
+            completed_between=self._rows.completed_between
+        )
+
+        return self._loaded
+
+    def items(self) -> Iterator[Item]:
+        """
+        Read every stored item in order, a page of rows at a time.
+
+        :returns: The stored items.
+        :rtype: Iterator[Item]
+        """
+
+        last_id: int = -1
+
+        while page := self._open().execute(_PAGE, (last_id, self.page_size)).fetchall():
+            yield from map(_as_item, page)
+            last_id = page[-1][0]
+
+    def count(self) -> int:
+        """
+        Count the stored items.
+        """
+        return self._open().execute(_COUNT).fetchone()[0]
+
+    def count_completed(self, completed: bool = True) -> int:
+        """
+        Count the stored items that are (or, if `completed` is False, aren't) completed.
+        """
+        return self._open().execute(_COUNT_COMPLETED, (completed,)).fetchone()[0]
+
+    def titles_starting_with(self, prefix: str) -> Iterator[Item]:
+        """
+        Find the stored items whose titles start with `prefix`, in title order. Items without a
+        title are never found.
+        """
+        return map(_as_item, takewhile(
+            lambda row: isinstance(row[1], str) and row[1].startswith(prefix),
+            self._open().execute(_TITLES_FROM, (prefix,))
+        ))
+
+    def _keep(self, item_id: int) -> NoneType:
+        """
+        Fetch and keep whatever the loaded TODO list needs from an item's row before it changes.
+        """
+
+        position: int = bisect_left(self._rows.ids, item_id) if self._rows is not None else 0
+
+        if self._rows is not None and position < len(self._rows.ids) and (
+            self._rows.ids[position] == item_id
+        ):
+            self._loaded.fetch(position)
+
+    def _write(self, records: Iterable[Tuple]) -> NoneType:
+        """
+        Write records inside the current transaction, starting one if need be.
+
+        Every record is checked before anything is written, so a bad one doesn't leave the others
+        half written.
+
+        :raises: ValueError when a record isn't an `append`, `replace` or `remove` record.
+        """
+
+        records = tuple(records)
+        unknown: Tuple[str, ...] = tuple(filter(
+            lambda kind: kind not in _STATEMENTS, map(lambda record: record[0], records)
+        ))
+
+        if unknown:
+            raise ValueError(
+                f"Can only store append, replace and remove records, not {unknown[0]!r}."
+            )
+
+        any(map(
+            lambda record: self._keep(item_id=record[1]),
+            filter(lambda record: record[0] != "append", records)
+        ))
+
+        if not self._connection.in_transaction:
+            self._connection.execute("BEGIN")
+
+        for kind, run in groupby(records, key=lambda record: record[0]):
+            self._connection.executemany(_STATEMENTS[kind][0], map(_STATEMENTS[kind][1], run))
+
+    def record(
+                self,
+                todo_list: PVector[Item],
+                operations: Iterable[Tuple]
+            ) -> PVector[Item]:
+        """
+        Write records, as produced by `changes()`, and commit them in one transaction.
+
+        :param todo_list: The TODO list after the records were applied.
+        :type todo_list: PVector[Item]
+
+        :param operations: The `append`, `replace` and `remove` records to write.
+        :type operations: Iterable[Tuple]
+
+        :raises: ValueError when given any other kind of operation.
+
+        :returns: `todo_list`, unchanged.
+        :rtype: PVector[Item]
+        """
+
+        self._write(records=operations)
+        self.sync()
+
+        return todo_list
+
+    def step(
+                self,
+                todo_list: PVector[Item],
+                operation: Tuple
+            ) -> PVector[Item]:
+        """
+        Apply a single operation and store it; a drop-in `step` for `apply_operations()`.
+
+        The operation is committed along with up to `commit_every` others.
+
+        :param todo_list: The TODO list to apply the operation to.
+        :type todo_list: PVector[Item]
+
+        :param operation: The name of the operation followed by its arguments.
+        :type operation: Tuple
+
+        :returns: The updated TODO list.
+        :rtype: PVector[Item]
+        """
+
+        after: PVector[Item] = apply_operation(todo_list, operation)
+
+        self._write(records=records_for(before=todo_list, after=after, operation=operation))
+        self._uncommitted += 1
+
+        if self._uncommitted >= self.commit_every:
+            self.sync()
+
+        return after
+
+    def sync(self) -> NoneType:
+        """
+        Commit everything written so far.
+        """
+
+        if self._connection.in_transaction:
+            self._connection.execute("COMMIT")
+
+        self._uncommitted = 0
+
+    def close(self) -> NoneType:
+        """
+        Commit anything still outstanding and close the database.
+        """
+
+        if self._connection is not None:
+            self.sync()
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,205 @@
+"""
+Shared and compressed storage for the titles and descriptions of TODO list items.
+
+TODO lists repeat themselves: the same chore is added every week and descriptions are often the
+same boilerplate. Every `Item` hands its title to `share()` and its description to `store()` when
+it's made, which keep just one copy of each:
+
+ - Strings shorter than `compress_over` characters are interned with `sys.intern()`, so equal
+   titles and descriptions across every item, and every version of the TODO list, are the same
+   string object. The duplicate is dropped as soon as the item is made.
+ - Longer descriptions are compressed with `zlib` into a `CompressedText`, and equal ones share
+   a single `CompressedText`, found by a digest of their text. They're only decompressed when
+   they're read, which in practice means when the item is rendered, edited or exported (see
+   `Item.description`). Text that doesn't get smaller when compressed is kept as it is.
+
+`CompressedText`s are held weakly, so text that's no longer in any item is freed like any other
+string. The store counts how many strings it shared or compressed and roughly how many bytes that
+saved, which the Stats command prints.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from hashlib import blake2b
+
+from sys import getsizeof
+from sys import intern
+
+from typing import Dict
+
+from types import NoneType
+
+from weakref import WeakValueDictionary
+
+from zlib import compress
+from zlib import decompress
+
+
+class CompressedText:
+    """
+    A string kept compressed with `zlib`, decompressed each time it's read with `text()`.
+    """
+
+    __slots__ = ("data", "length", "__weakref__")
+
+    def __init__(self, data: bytes, length: int) -> NoneType:
+        self.data: bytes = data
+        self.length: int = length
+
+    def __repr__(self) -> str:
+        return f"CompressedText({self.length} characters in {len(self.data)} bytes)"
+
+    def text(self) -> str:
+        """
+        Decompress the string.
+        """
+        return decompress(self.data).decode("utf-8")
+
+
+class StringStore:
+    """
+    Hands back a shared, and if it's long enough compressed, copy of every string given to it.
+    """
+
+    def __init__(self, compress_over: int = 256, level: int = 6) -> NoneType:
+        self.compress_over: int = compress_over
+        self.level: int = level
+
+        self.shared: int = 0
+        self.shared_bytes: int = 0
+        self.compressed: int = 0
+        self.compressed_bytes: int = 0
+
+        self._compressed: WeakValueDictionary = WeakValueDictionary()
+
+    def share(self, text: (str | NoneType)) -> (str | NoneType):
+        """
+        Get the one shared copy of a string, without compressing it.
+
+        :param text: The string to share.
+        :type text: (str | NoneType)
+
+        :returns: The interned string, or `text` itself if it isn't exactly a string.
+        :rtype: (str | NoneType)
+        """
+
+        if type(text) is not str: # pylint: disable=unidiomatic-typecheck
+            return text
+
+        kept: str = intern(text)
+
+        if kept is not text:
+            self.shared += 1
+            self.shared_bytes += getsizeof(text)
+
+        return kept
+
+    def store(self, text: (str | CompressedText | NoneType)) -> (str | CompressedText | NoneType):
+        """
+        Get the one copy of `text` to keep, compressing it if it's long.
+
+        :param text: The string to keep, or something `store()` already handed back.
+        :type text: (str | CompressedText | NoneType)
+
+        :returns: An interned string, a shared `CompressedText`, or `text` itself if it isn't a
+            string.
+        :rtype: (str | CompressedText | NoneType)
+        """
+
+        if not isinstance(text, str) or len(text) < self.compress_over:
+            return self.share(text)
+
+        encoded: bytes = text.encode("utf-8")
+        digest: bytes = blake2b(encoded, digest_size=16).digest()
+        kept: (CompressedText | NoneType) = self._compressed.get(digest)
+
+        if kept is not None:
+            self.shared += 1
+            self.shared_bytes += getsizeof(text)
+            return kept
+
+        data: bytes = compress(encoded, self.level)
+
+        if len(data) >= len(encoded):
+            return text
+
+        kept = self._compressed[digest] = CompressedText(data=data, length=len(text))
+        self.compressed += 1
+        self.compressed_bytes += getsizeof(text) - getsizeof(data)
+
+        return kept
+
+    def as_dict(self) -> Dict[str, int]:
+        """
+        Get the counts of what's been shared and compressed so far.
+        """
+        return {
+            "shared": self.shared,
+            "shared_bytes": self.shared_bytes,
+            "compressed": self.compressed,
+            "compressed_bytes": self.compressed_bytes,
+        }
+
+    def report(self) -> bool:
+        """
+        Print how many strings were shared and compressed, and how many bytes each saved.
+
+        :returns: False, so it can be returned from a menu command.
+        :rtype: bool
+        """
+        return bool(print(
+            f"Strings: {self.shared} duplicates shared, saving {self.shared_bytes} bytes, and"
+            + f" {self.compressed} long strings compressed, saving {self.compressed_bytes} bytes."
+        ))
+
+
+# The store every item's title and description is kept in.
+STRINGS: StringStore = StringStore()
+
+
+def store(text: (str | CompressedText | NoneType)) -> (str | CompressedText | NoneType):
+    """
+    Get the one copy of `text` to keep from the shared `STRINGS` store.
+
+    :param text: The string to keep.
+    :type text: (str | CompressedText | NoneType)
+
+    :returns: An interned string, a shared `CompressedText`, or `text` itself if it isn't a string.
+    :rtype: (str | CompressedText | NoneType)
+    """
+    return STRINGS.store(text)
+
+
+def share(text: (str | NoneType)) -> (str | NoneType):
+    """
+    Get the one shared copy of a string from the shared `STRINGS` store, without compressing it.
+
+    :param text: The string to share.
+    :type text: (str | NoneType)
+
+    :returns: The interned string, or `text` itself if it isn't exactly a string.
+    :rtype: (str | NoneType)
+    """
+    return STRINGS.share(text)
+
+
+def text_of(value: (str | CompressedText | NoneType)) -> (str | NoneType):
+    """
+    Get the string back from something `store()` handed back, decompressing it if need be.
+
+    :param value: What `store()` handed back.
+    :type value: (str | CompressedText | NoneType)
+
+    :returns: The string.
+    :rtype: (str | NoneType)
+    """
+    return value.text() if isinstance(value, CompressedText) else value
@@ -0,0 +1,137 @@
+"""
+Recording what's typed into the interactive menu, so a session can be replayed later.
+
+While a `TraceRecorder` is active (see `TraceRecorder.activate()`), every answer given to a prompt
+through `recorded()` is kept, and each pass of the menu is written out as one JSON line holding the
+answers given during it - the number of the command chosen, followed by whatever the command asked
+for:
+
+    ["0", "Buy milk", "Semi-skimmed"]
+    ["1", "0"]
+    ["3"]
+
+`read_trace()` reads the passes back. `benchmarks/bench_replay.py` feeds them through the menu
+again, and can also make up traces of its own.
+
+When no recorder is active, `recorded()` and `end_pass()` hand back what they're given and do
+nothing else.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from contextlib import contextmanager
+
+from contextvars import ContextVar
+
+from json import dumps
+from json import loads
+
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import TextIO
+from typing import TypeVar
+
+from types import NoneType
+
+
+Result = TypeVar("Result")
+
+
+class TraceRecorder:
+    """
+    Writes the answers given in each pass of the menu to a file, one pass per line.
+    """
+
+    def __init__(self) -> NoneType:
+        self.answers: List[str] = []
+        self._file: (TextIO | NoneType) = None
+
+    @contextmanager
+    def activate(self, path: str) -> Iterator["TraceRecorder"]:
+        """
+        Make this the active recorder, writing to `path`, for the duration of a `with`.
+        """
+
+        token = _ACTIVE.set(self)
+
+        try:
+            with open(path, "w", encoding="utf-8") as self._file:
+                yield self
+                self.end_pass()
+        finally:
+            _ACTIVE.reset(token)
+            self._file = None
+
+    def end_pass(self) -> NoneType:
+        """
+        Write out the answers given since the last pass, if there were any.
+        """
+
+        if self.answers:
+            self._file.write(dumps(self.answers) + "\n")
+            self._file.flush()
+            self.answers = []
+
+
+_ACTIVE: ContextVar[(TraceRecorder | NoneType)] = ContextVar("trace_recorder", default=None)
+
+
+def recorded(answer: str) -> str:
+    """
+    Keep an answer given to a prompt in the active recorder's trace, if there is one.
+
+    :param answer: What the user entered.
+    :type answer: str
+
+    :returns: `answer`, unchanged.
+    :rtype: str
+    """
+
+    recorder: (TraceRecorder | NoneType) = _ACTIVE.get()
+
+    if recorder is not None:
+        recorder.answers.append(answer)
+
+    return answer
+
+
+def end_pass(state: Result) -> Result:
+    """
+    Mark the end of a pass of the menu in the active recorder's trace, if there is one.
+
+    :param state: Whatever the pass returned.
+    :type state: Result
+
+    :returns: `state`, unchanged.
+    :rtype: Result
+    """
+
+    recorder: (TraceRecorder | NoneType) = _ACTIVE.get()
+
+    if recorder is not None:
+        recorder.end_pass()
+
+    return state
+
+
+def read_trace(lines: Iterable[str]) -> Iterator[List[str]]:
+    """
+    Read the passes of a trace, skipping blank lines.
+
+    :param lines: The lines of the trace.
+    :type lines: Iterable[str]
+
+    :returns: The answers given in each pass.
+    :rtype: Iterator[List[str]]
+    """
+    return map(lambda line: list(map(str, loads(line))), filter(lambda line: line.strip(), lines))
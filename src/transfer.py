@@ -0,0 +1,321 @@
+"""
+Streaming import and export of TODO lists as JSON Lines or CSV.
+
+Exporting turns the TODO list into lines of text one item at a time, and the lines are written out
+as they're made, so exporting a million items never holds more than one of them as text. Every
+line includes the item's ID:
+
+    {"title": "Buy milk", "description": "Semi-skimmed", "completed": false, "id": 0}
+
+    title,description,completed,id
+    Buy milk,Semi-skimmed,false,0
+
+Importing reads the lines back one at a time and builds the new items into the TODO list in one go
+(see `PVector.extend()`), rather than adding them one after another. Imported items are added to
+the end of the TODO list and given new IDs after the ones already in it, so importing a file
+twice, or into a list that already has items, never gives two items the same ID.
+
+The format is picked from the file's extension: `.csv` is CSV and anything else is JSON Lines.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from csv import DictReader
+from csv import writer
+
+from io import StringIO
+
+from itertools import chain
+from itertools import count
+
+from json import dumps
+from json import loads
+
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Mapping
+from typing import Tuple
+
+from types import NoneType
+
+# Local Imports
+from src.item import FIELDS
+from src.item import Item
+from src.item import SCHEDULE_FIELDS
+from src.item import serialise
+from src.operations import next_id
+from src.pvector import PVector
+from src.schedule import parse_due
+from src.schedule import parse_priority
+
+
+# The columns of an exported CSV file, in order.
+CSV_COLUMNS: Tuple[str, ...] = (*FIELDS, "id", *SCHEDULE_FIELDS)
+
+
+def _completed(value: (str | bool | NoneType)) -> bool:
+    """
+    Read a completed value, which is a JSON boolean or, in CSV, "true" or "false". A missing value,
+    JSON null or an empty CSV cell is false.
+
+    :raises: ValueError when the value is none of these.
+    """
+
+    if isinstance(value, bool):
+        return value
+
+    if value is None or value == "":
+        return False
+
+    if not isinstance(value, str) or value.strip().lower() not in ("true", "false"):
+        raise ValueError(f"Expected true or false for completed, got {value!r}.")
+
+    return value.strip().lower() == "true"
+
+
+def _priority(value: (str | int | NoneType)) -> (int | NoneType):
+    """
+    Read a priority, which is a JSON number or null or, in CSV, digits or nothing. As when it's
+    entered (see `parse_priority()`), it must be a whole number of 1 or more.
+
+    :raises: ValueError when the value is neither.
+    """
+
+    if value is None or isinstance(value, str):
+        return None if value is None else parse_priority(text=value)
+
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError(f"A priority is a whole number of 1 or more, not {value!r}.")
+
+    return value
+
+
+def _due(value: (str | NoneType)) -> (str | NoneType):
+    """
+    Read a due date, which is `YYYY-MM-DD` or, in JSON, null or, in CSV, nothing.
+
+    :raises: ValueError when the value is neither.
+    """
+
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"Expected a date for due, got {value!r}.")
+
+    return None if value is None else parse_due(text=value)
+
+
+def _text(name: str, value: (str | NoneType)) -> (str | NoneType):
+    """
+    Check a title or description, which is a string or, in JSON, null.
+
+    :raises: ValueError when the value is neither.
+    """
+
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"Expected text for {name}, got {value!r}.")
+
+    return value
+
+
+def _item(item_id: int, line: int, values: Mapping) -> Item:
+    """
+    Make an imported item from its values, read from the given line of the file.
+
+    :raises: ValueError, naming the line, when the values aren't an object or one can't be read.
+    """
+
+    try:
+        if not isinstance(values, Mapping):
+            raise ValueError(f"Expected an object, got {values!r}.")
+
+        return Item(
+            _text("title", values.get("title")),
+            _text("description", values.get("description")),
+            _completed(values.get("completed")),
+            item_id,
+            _priority(values.get("priority")),
+            _due(values.get("due"))
+        )
+    except ValueError as error:
+        raise ValueError(f"Line {line}: {error}") from error
+
+
+def export_jsonl(todo_list: Iterable[Item]) -> Iterator[str]:
+    """
+    Turn the TODO list into JSON Lines, one line per item.
+
+    :param todo_list: The TODO list to export.
+    :type todo_list: Iterable[Item]
+
+    :returns: The lines, each ending in a newline.
+    :rtype: Iterator[str]
+    """
+    return map(lambda item: dumps(serialise(item)) + "\n", todo_list)
+
+
+def export_csv(todo_list: Iterable[Item]) -> Iterator[str]:
+    """
+    Turn the TODO list into CSV, a header line followed by one line per item.
+
+    :param todo_list: The TODO list to export.
+    :type todo_list: Iterable[Item]
+
+    :returns: The lines, each ending in a newline.
+    :rtype: Iterator[str]
+    """
+
+    # One small buffer is reused for every line, so the csv module does the quoting.
+    line: StringIO = StringIO()
+    rows = writer(line, lineterminator="\n")
+
+    def as_line(values: Iterable[object]) -> str:
+        line.seek(0)
+        line.truncate()
+        rows.writerow(values)
+        return line.getvalue()
+
+    return map(as_line, chain(
+        (CSV_COLUMNS,),
+        map(
+            lambda item: (
+                item.title, item.description, "true" if item.completed else "false", item.id,
+                "" if item.priority is None else item.priority, item.due or ""
+            ),
+            todo_list
+        )
+    ))
+
+
+def _loads(line: int, text: str) -> Tuple[int, Mapping]:
+    """
+    Read one line of JSON Lines, along with its line number.
+
+    :raises: ValueError, naming the line, when it isn't JSON.
+    """
+
+    try:
+        return line, loads(text)
+    except ValueError as error:
+        raise ValueError(f"Line {line}: {error}") from error
+
+
+def import_jsonl(lines: Iterable[str]) -> Iterator[Tuple[int, Mapping]]:
+    """
+    Read items from JSON Lines, skipping blank lines.
+
+    :param lines: The lines to read.
+    :type lines: Iterable[str]
+
+    :raises: ValueError, naming the line, when a line isn't JSON.
+
+    :returns: Each item's line number and values.
+    :rtype: Iterator[Tuple[int, Mapping]]
+    """
+    return map(
+        lambda numbered: _loads(*numbered),
+        filter(lambda numbered: numbered[1].strip(), enumerate(lines, start=1))
+    )
+
+
+def import_csv(lines: Iterable[str]) -> Iterator[Tuple[int, Mapping]]:
+    """
+    Read items from CSV with a header line naming the columns. Only a title column is required.
+
+    :param lines: The lines to read.
+    :type lines: Iterable[str]
+
+    :returns: Each item's line number and values.
+    :rtype: Iterator[Tuple[int, Mapping]]
+    """
+
+    # The reader's line number is read after each row, so it's the row's last line.
+    rows: DictReader = DictReader(lines)
+    return map(lambda row: (rows.line_num, row), rows)
+
+
+# The exporter and importer for each format, by name.
+FORMATS: Dict[str, Tuple[Callable, Callable]] = {
+    "jsonl": (export_jsonl, import_jsonl),
+    "csv": (export_csv, import_csv),
+}
+
+
+def format_of(path: str) -> str:
+    """
+    Get the format for a file from its extension: "csv" for `.csv`, otherwise "jsonl".
+    """
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def extend_from(
+            todo_list: PVector[Item], values: Iterable[Tuple[int, Mapping]]
+        ) -> PVector[Item]:
+    """
+    Add imported items to the end of the TODO list in one go, numbering them after its last ID.
+
+    :param todo_list: The TODO list to add the items to.
+    :type todo_list: PVector[Item]
+
+    :param values: Each item's line number and values, as read by `import_jsonl()` or
+        `import_csv()`.
+    :type values: Iterable[Tuple[int, Mapping]]
+
+    :raises: ValueError, naming the line, when an item isn't an object, its title or description
+        isn't text, its completed value isn't true or false, or its priority or due date can't be
+        read.
+
+    :returns: The updated TODO list.
+    :rtype: PVector[Item]
+    """
+    return todo_list.extend(map(
+        lambda numbered: _item(numbered[0], *numbered[1]),
+        zip(count(next_id(todo_list)), values)
+    ))
+
+
+def export_to(todo_list: Iterable[Item], path: str) -> int:
+    """
+    Export the TODO list to a file, a line at a time.
+
+    :param todo_list: The TODO list to export.
+    :type todo_list: Iterable[Item]
+
+    :param path: The file to write, in the format picked by `format_of()`.
+    :type path: str
+
+    :returns: How many lines were written, including any header.
+    :rtype: int
+    """
+    with open(path, "w", encoding="utf-8", newline="") as exported:
+        return sum(map(
+            lambda line: bool(exported.write(line)), FORMATS[format_of(path)][0](todo_list)
+        ))
+
+
+def import_from(todo_list: PVector[Item], path: str) -> PVector[Item]:
+    """
+    Import the items in a file onto the end of the TODO list.
+
+    :param todo_list: The TODO list to add the items to.
+    :type todo_list: PVector[Item]
+
+    :param path: The file to read, in the format picked by `format_of()`.
+    :type path: str
+
+    :raises: ValueError when the file can't be read as that format.
+
+    :returns: The updated TODO list.
+    :rtype: PVector[Item]
+    """
+    with open(path, encoding="utf-8", newline="") as imported:
+        return extend_from(todo_list=todo_list, values=FORMATS[format_of(path)][1](imported))
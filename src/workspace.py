@@ -0,0 +1,317 @@
+"""
+A workspace of named TODO lists kept in one directory, with the recently used ones kept loaded.
+
+Each list is stored in the directory as `NAME.json`, with its journal next to it (see
+`src/journal.py`), so every change is on disk as soon as it's made. Start the program with
+`--workspace DIR` and the Switch List, New List and List Lists commands move between the lists.
+
+Loading a list means reading its snapshot and replaying its journal, so the lists used recently are
+kept loaded, most recently used last, along with their indexes and undo histories. Switching
+back to one of them is then a dictionary lookup with no I/O at all, and its undo history carries on
+where it left off. Every loaded list's size in memory is estimated when it's loaded (see
+`footprint()`) and brought up to date each time it's switched away from, looking at only the items
+that changed (see `footprint_change()`), while its undo history and indexes keep their own
+estimates up to date as they change. Once all of that adds up to more than the memory budget, the
+least recently used lists are closed and dropped until it fits again. The list in use is never
+dropped. A dropped list is loaded from disk again the next time it's switched to.
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# First Party Imports
+from collections import OrderedDict
+
+from contextlib import contextmanager
+
+from contextvars import ContextVar
+
+from os import listdir
+from os import makedirs
+from os.path import exists
+from os.path import join
+
+from re import fullmatch
+
+from sys import getsizeof
+
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import NamedTuple
+from typing import Tuple
+
+from types import NoneType
+
+# Local Imports
+from src.history import DEFAULT_BUDGET
+from src.history import DEFAULT_LIMIT
+from src.history import History
+from src.item import Item
+from src.journal import Journal
+from src.operations import changes
+from src.operations import position_of
+from src.pvector import NODE_BYTES
+from src.pvector import PVector
+from src.schedule import ScheduleIndex
+from src.search import SearchIndex
+
+
+class ListSession(NamedTuple):
+    """
+    A loaded list, with everything the menu keeps alongside it.
+    """
+
+    name: str
+    todo_list: PVector[Item]
+    journal: Journal
+    search_index: SearchIndex
+    history: History
+    schedule_index: ScheduleIndex
+
+
+def _item_bytes(item: Item) -> int:
+    return NODE_BYTES + getsizeof(item) + getsizeof(item.title) + getsizeof(item._description)
+
+
+def footprint(todo_list: Iterable[Item]) -> int:
+    """
+    Estimate how many bytes a TODO list takes up in memory.
+
+    Strings shared with other items are counted once per item, so this errs on the high side.
+
+    :param todo_list: The TODO list.
+    :type todo_list: Iterable[Item]
+
+    :returns: The estimated number of bytes.
+    :rtype: int
+    """
+    return sum(map(_item_bytes, todo_list))
+
+
+def footprint_change(before: PVector[Item], after: PVector[Item]) -> int:
+    """
+    Work out how much `footprint()` changes by from one version of a TODO list to another.
+
+    Only the items that changed are looked at (see `changes()`), so this costs O(k log n) for k
+    changed items rather than a pass over the whole TODO list.
+
+    :param before: The earlier version of the TODO list.
+    :type before: PVector[Item]
+
+    :param after: The later version of the TODO list.
+    :type after: PVector[Item]
+
+    :returns: The estimated number of bytes gained, or lost if it's negative.
+    :rtype: int
+    """
+
+    records: Tuple[Tuple, ...] = changes(before=before, after=after)
+
+    return sum(map(
+        lambda item_id: _item_bytes(after[position_of(after, item_id)]),
+        map(lambda record: record[4 if record[0] == "append" else 1], filter(
+            lambda record: record[0] != "remove", records
+        ))
+    )) - sum(map(
+        lambda item_id: _item_bytes(before[position_of(before, item_id)]),
+        map(lambda record: record[1], filter(lambda record: record[0] != "append", records))
+    ))
+
+
+class Workspace:
+    """
+    Named TODO lists in a directory, the recently used ones kept loaded within a memory budget.
+
+    Use it in a `with` block (or call `close()`) so every loaded list's journal is closed.
+    """
+
+    def __init__(
+                self,
+                directory: str,
+                budget: int = 64 * 1024 * 1024,
+                history_limit: int = DEFAULT_LIMIT,
+                history_budget: int = DEFAULT_BUDGET
+            ) -> NoneType:
+        self.directory: str = directory
+        self.budget: int = budget
+        self.history_limit: int = history_limit
+        self.history_budget: int = history_budget
+        self.current: (str | NoneType) = None
+
+        self._loaded: OrderedDict[str, ListSession] = OrderedDict()
+        self._footprints: Dict[str, int] = {}
+
+        makedirs(directory, exist_ok=True)
+
+    def __enter__(self) -> "Workspace":
+        return self
+
+    def __exit__(self, *_: object) -> NoneType:
+        self.close()
+
+    @contextmanager
+    def activate(self) -> Iterator["Workspace"]:
+        """
+        Make this the active workspace, for the menu's commands, for the duration of a `with`.
+        """
+
+        token = _ACTIVE.set(self)
+
+        try:
+            yield self
+        finally:
+            _ACTIVE.reset(token)
+
+    def _path(self, name: str) -> str:
+        return join(self.directory, f"{name}.json")
+
+    def names(self) -> Tuple[str, ...]:
+        """
+        Get the name of every list in the workspace, in alphabetical order.
+        """
+        return tuple(sorted({
+            *map(
+                lambda file_name: file_name[:-len(".json")],
+                filter(lambda file_name: file_name.endswith(".json"), listdir(self.directory))
+            ),
+            *self._loaded
+        }))
+
+    def is_loaded(self, name: str) -> bool:
+        """
+        Whether a list is loaded, so switching to it needs no I/O.
+        """
+        return name in self._loaded
+
+    def memory_used(self) -> int:
+        """
+        The estimated bytes taken up by the loaded lists, along with their undo histories and
+        indexes. Each list is as of when it was last switched away from.
+        """
+        return sum(self._footprints.values()) + sum(map(
+            lambda session: (
+                session.history.memory_used()
+                + session.search_index.memory_used()
+                + session.schedule_index.memory_used()
+            ),
+            self._loaded.values()
+        ))
+
+    def open(self, name: str, create: bool = False) -> ListSession:
+        """
+        Make a list the one in use, loading it if it isn't loaded already.
+
+        :param name: The name of the list: letters, digits, underscores and hyphens.
+        :type name: str
+
+        :param create: Whether to make the list if it doesn't exist yet.
+        :type create: bool = False
+
+        :raises: ValueError when the name isn't valid, or the list doesn't exist and `create` is
+            False.
+
+        :returns: The list, with its journal, indexes and undo history.
+        :rtype: ListSession
+        """
+
+        if fullmatch(r"[\w-]+", name) is None:
+            raise ValueError(f"{name!r} isn't a valid list name.")
+
+        if name not in self._loaded and not create and not exists(self._path(name)):
+            raise ValueError(f"There is no list called {name}.")
+
+        if name not in self._loaded:
+            journal: Journal = Journal(path=self._path(name))
+            todo_list: PVector[Item] = journal.load()
+
+            # A new list gets an empty snapshot straight away, so it's listed from then on.
+            if not exists(self._path(name)):
+                journal.compact(todo_list=todo_list)
+
+            self._loaded[name] = ListSession(
+                name=name,
+                todo_list=todo_list,
+                journal=journal,
+                search_index=SearchIndex(todo_list=todo_list),
+                history=History(limit=self.history_limit, budget=self.history_budget),
+                schedule_index=ScheduleIndex(todo_list=todo_list)
+            )
+            self._footprints[name] = footprint(todo_list)
+
+        self._loaded.move_to_end(name)
+        self.current = name
+        self._evict()
+
+        return self._loaded[name]
+
+    def keep(
+                self,
+                todo_list: PVector[Item],
+                search_index: SearchIndex,
+                history: History,
+                schedule_index: ScheduleIndex
+            ) -> NoneType:
+        """
+        Keep the latest state of the list in use, to carry on with when it's switched back to.
+
+        :param todo_list: The list as it is now.
+        :type todo_list: PVector[Item]
+
+        :param search_index: The list's search index.
+        :type search_index: SearchIndex
+
+        :param history: The list's undo history.
+        :type history: History
+
+        :param schedule_index: The list's index of items by priority and due date.
+        :type schedule_index: ScheduleIndex
+        """
+
+        if self.current in self._loaded:
+            self._footprints[self.current] += footprint_change(
+                before=self._loaded[self.current].todo_list, after=todo_list
+            )
+            self._loaded[self.current] = self._loaded[self.current]._replace(
+                todo_list=todo_list,
+                search_index=search_index,
+                history=history,
+                schedule_index=schedule_index
+            )
+
+    def _evict(self) -> NoneType:
+        """
+        Close and drop the least recently used lists until the loaded ones fit in the budget.
+        """
+
+        while self.memory_used() > self.budget and next(iter(self._loaded)) != self.current:
+            name, session = self._loaded.popitem(last=False)
+            session.journal.close()
+            del self._footprints[name]
+
+    def close(self) -> NoneType:
+        """
+        Close the journal of every loaded list.
+        """
+
+        while self._loaded:
+            name, session = self._loaded.popitem()
+            session.journal.close()
+            del self._footprints[name]
+
+
+_ACTIVE: ContextVar[(Workspace | NoneType)] = ContextVar("workspace", default=None)
+
+
+def active() -> (Workspace | NoneType):
+    """
+    Get the active workspace, if there is one.
+    """
+    return _ACTIVE.get()
@@ -0,0 +1,176 @@
+"""
+Unit tests for the binary archive format.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from gc import collect
+
+from os import replace
+
+from pathlib import Path
+
+from typing import List
+from typing import NoReturn
+
+from unittest.mock import patch
+
+from pytest import raises
+
+from src.archive import Archive
+from src.archive import write_archive
+from src.item import Item
+from src.operations import changes
+from src.pvector import PVector
+
+
+SAMPLE_ITEMS: List[Item] = [
+    Item("Buy milk", "Semi-skimmed", False, 0),
+    Item("Café", None, True, 3),
+    Item(None, "", True, 7),
+    *map(lambda number: Item(f"Title {number}", "", number % 3 == 0, number), range(8, 40)),
+]
+
+
+def test__archive__reads_back_what_was_written__success(tmp_path: Path) -> NoReturn:
+
+    write_archive(path=str(tmp_path / "todo.archive"), todo_list=SAMPLE_ITEMS)
+
+    with Archive(path=str(tmp_path / "todo.archive")) as archive:
+        todo_list: PVector = archive.load()
+
+    expected_result: List = [(item, item.id) for item in SAMPLE_ITEMS]
+    actual_result: List = [(item, item.id) for item in todo_list]
+
+    assert expected_result == actual_result, "Items were not read back as written."
+    assert 13 == todo_list.count_completed(), "Completed items were not counted from the bits."
+    assert [7, 9] == [item.id for _, item in todo_list.iterate_completed(start=1)][:2], (
+        "Completed items were not found in order."
+    )
+
+
+def test__archive__only_decodes_what_is_reached__success(tmp_path: Path) -> NoReturn:
+
+    write_archive(
+        path=str(tmp_path / "todo.archive"),
+        todo_list=map(lambda number: Item(f"Title {number}", "", False, number), range(10000))
+    )
+
+    with patch(target="src.archive.Item", wraps=Item) as mock_item:
+        with Archive(path=str(tmp_path / "todo.archive")) as archive:
+            todo_list: PVector = archive.load()
+            toggled: PVector = archive.step(todo_list=todo_list, operation=("toggle", 5000))
+            records: tuple = changes(before=todo_list, after=toggled)
+            last_page: List[Item] = list(toggled.iterate_from(len(toggled) - 10))
+
+    assert (("replace", 5000, "Title 5000", "", True),) == records, "Change was not found."
+    assert 9999 == last_page[-1].id, "Last page was not read."
+    assert mock_item.call_count < 100, "More of the archive was decoded than was reached."
+
+
+def test__archive__walking_the_list_keeps_nothing_it_decodes__success(
+        tmp_path: Path
+    ) -> NoReturn:
+
+    write_archive(
+        path=str(tmp_path / "todo.archive"),
+        todo_list=map(lambda number: Item(f"Title {number}", "", False, number), range(1000))
+    )
+
+    with patch(target="src.archive.Item", wraps=Item) as mock_item:
+        with Archive(path=str(tmp_path / "todo.archive")) as archive:
+            todo_list: PVector = archive.load()
+            walked: int = len(list(todo_list)) + len(list(todo_list))
+            walks: int = mock_item.call_count
+            reached: List[Item] = [todo_list[500], todo_list[500]]
+
+    assert (2000, 2000) == (walked, walks), "Walking the list did not decode every item each time."
+    assert walks + 1 == mock_item.call_count, "An item reached by position was not kept."
+    assert reached[0] is reached[1], "An item reached by position was decoded again."
+
+
+def test__archive__keeps_changes_through_compaction__success(tmp_path: Path) -> NoReturn:
+
+    write_archive(path=str(tmp_path / "todo.archive"), todo_list=SAMPLE_ITEMS)
+
+    with Archive(path=str(tmp_path / "todo.archive"), compact_every=2) as archive:
+        todo_list: PVector = archive.load()
+
+        for operation in (("toggle", 0), ("remove", 3), ("add", "New", "Item")):
+            todo_list = archive.step(todo_list=todo_list, operation=operation)
+
+    with Archive(path=str(tmp_path / "todo.archive")) as archive:
+        reloaded: PVector = archive.load()
+
+    assert todo_list == reloaded, "Reloaded TODO list was not as expected."
+    assert [item.id for item in todo_list] == [item.id for item in reloaded], "IDs were not kept."
+    assert "" != (tmp_path / "todo.archive.journal").read_text(), "Last change was not journalled."
+
+
+def test__archive__unmaps_the_archive_before_replacing_it__success(tmp_path: Path) -> NoReturn:
+
+    path: str = str(tmp_path / "todo.archive")
+    write_archive(path=path, todo_list=SAMPLE_ITEMS)
+    mapped_when_replaced: List[bool] = []
+
+    def checked_replace(source: str, target: str) -> None:
+        if path in (source, target):
+            mapped_when_replaced.append(mapped.path == path and not mapped._map.closed)
+
+        replace(source, target)
+
+    with Archive(path=path, compact_every=1) as archive:
+        original: PVector = archive.load()
+        mapped = archive._mapped
+
+        with patch(target="src.archive.replace", side_effect=checked_replace):
+            archive.step(todo_list=original, operation=("toggle", 0))
+
+        assert [False, False] == mapped_when_replaced, "The archive was replaced while mapped."
+        assert SAMPLE_ITEMS == list(original), "The version before compaction could not be read."
+
+        del original, mapped
+        collect()
+
+    expected_result: List[str] = ["todo.archive", "todo.archive.journal"]
+    actual_result: List[str] = sorted(child.name for child in tmp_path.iterdir())
+
+    assert expected_result == actual_result, "The replaced archive was not deleted."
+
+
+def test__archive__keeps_priorities_and_due_dates__success(tmp_path: Path) -> NoReturn:
+
+    scheduled: List[Item] = [
+        Item("Soon", "", False, 0, priority=1, due="2026-11-01"),
+        Item("Ranked", "", False, 1, priority=3),
+        Item("Dated", "", True, 2, due="1999-12-31"),
+        Item("Neither", "", False, 3),
+    ]
+    write_archive(path=str(tmp_path / "todo.archive"), todo_list=scheduled)
+
+    with Archive(path=str(tmp_path / "todo.archive")) as archive:
+        actual_result: List[Item] = list(archive.load())
+
+    assert scheduled == actual_result, "Priorities and due dates were not read back."
+
+
+def test__archive__rejects_other_files__failure(tmp_path: Path) -> NoReturn:
+
+    (tmp_path / "todo.archive").write_text('{"sequence": 0, "items": []}')
+
+    with raises(ValueError):
+        with Archive(path=str(tmp_path / "todo.archive")) as archive:
+            archive.load()
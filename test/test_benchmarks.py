@@ -0,0 +1,170 @@
+"""
+Unit tests for the operation benchmarks.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from pathlib import Path
+
+from typing import List
+from typing import NoReturn
+from typing import Tuple
+
+from unittest.mock import patch
+
+from pytest import raises
+
+from benchmarks.bench_operations import OPERATIONS
+from benchmarks.bench_operations import Result
+from benchmarks.bench_operations import main as benchmark_main
+from benchmarks.bench_operations import load_baseline
+from benchmarks.bench_operations import regressions
+from benchmarks.bench_operations import run
+from benchmarks.bench_replay import Result as ReplayResult
+from benchmarks.bench_replay import main as replay_main
+from benchmarks.bench_replay import parse_mix
+from benchmarks.bench_replay import replay
+from benchmarks.bench_replay import synthetic
+from benchmarks.bench_startup import Result as StartupResult
+from benchmarks.bench_startup import run as run_startup
+
+
+def test__run__measures_every_operation_at_every_size__success() -> NoReturn:
+
+    results: List[Result] = run(sizes=(1, 20), samples=3)
+
+    expected_result: List[Tuple[str, int]] = [
+        (name, size) for size in (1, 20) for name in OPERATIONS
+    ]
+    actual_result: List[Tuple[str, int]] = [(result.operation, result.size) for result in results]
+
+    assert expected_result == actual_result, "Not every operation and size was measured."
+    assert all(result.p50 <= result.p99 for result in results), "Percentiles were out of order."
+    assert all(result.peak_bytes > 0 for result in results), "Peak memory was not measured."
+
+
+def test__regressions__flags_only_slower_medians__success() -> NoReturn:
+
+    baseline: List[Result] = [
+        Result("add_item", 10, 5, 1000.0, 100.0, 110.0, 120.0, 10),
+        Result("remove_item", 10, 5, 1000.0, 100.0, 110.0, 120.0, 10),
+    ]
+    results: List[Result] = [
+        baseline[0]._replace(p50=200.0),
+        baseline[1]._replace(p50=110.0),
+    ]
+
+    expected_result: List[str] = ["add_item"]
+    actual_result: List[str] = [
+        pair[0].operation for pair in regressions(results, baseline, tolerance=0.25)
+    ]
+
+    assert expected_result == actual_result, "Regressions were not as expected."
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__main__saves_a_baseline_that_can_be_compared__success(
+        mock_stdout: StringIO, tmp_path: Path
+    ) -> NoReturn:
+
+    arguments: List[str] = ["--sizes", "5", "--samples", "2", "--operations", "add_item"]
+
+    benchmark_main(arguments=[*arguments, "--save", str(tmp_path / "baseline.json")])
+    exit_code: int = benchmark_main(
+        arguments=[*arguments, "--compare", str(tmp_path / "baseline.json"), "--tolerance", "1e9"]
+    )
+
+    assert 0 == exit_code, "Comparing against the baseline reported a regression."
+    assert 1 == len(load_baseline(str(tmp_path / "baseline.json"))), "Baseline was not saved."
+
+
+def test__bench_startup__times_a_one_shot_command__success() -> NoReturn:
+
+    results: List[StartupResult] = run_startup(samples=1, commands=("count",))
+
+    expected_result: List[str] = ["count"]
+    actual_result: List[str] = [result.command for result in results]
+
+    assert expected_result == actual_result, "The command was not timed."
+    assert results[0].p50 > 0, "The start up time was not measured."
+
+
+def test__replay__times_every_pass_of_a_synthetic_mix__success() -> NoReturn:
+
+    trace: List[List[str]] = list(synthetic(
+        mix=parse_mix(["add_item=80", "checkoff_item=20"]), passes=50, size=100
+    ))
+    results: List[ReplayResult] = replay(trace=[*trace, ["3"]], size=100)
+
+    expected_result: List[str] = ["add_item", "checkoff_item", "exit_the_program", "all"]
+    actual_result: List[str] = sorted(
+        (result.command for result in results), key=expected_result.index
+    )
+
+    assert expected_result == actual_result, "Passes were not timed by command."
+    assert 51 == results[-1].passes, "Not every pass was timed."
+    assert all(result.p50 <= result.p99 <= result.worst for result in results), (
+        "Percentiles were out of order."
+    )
+
+
+def test__replay__times_the_schedule_commands__success() -> NoReturn:
+
+    trace: List[List[str]] = list(synthetic(
+        mix=parse_mix(["add_item=1", "schedule_item=1", "next_up=1", "overdue_items=1"]),
+        passes=40,
+        size=10
+    ))
+    results: List[ReplayResult] = replay(trace=trace, size=10)
+
+    expected_result: int = 40
+    actual_result: int = results[-1].passes
+
+    assert expected_result == actual_result, "Not every pass was timed."
+
+
+def test__replay__stops_a_pass_without_enough_answers__failure() -> NoReturn:
+
+    with raises(ValueError):
+        replay(trace=[["0", "Title", "Description"]], size=10)
+
+
+def test__parse_mix__rejects_commands_it_cannot_make_up__failure() -> NoReturn:
+
+    with raises(ValueError):
+        parse_mix(["add_item=80", "export_items=20"])
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__bench_replay__replays_a_saved_trace__success(
+        mock_stdout: StringIO, tmp_path: Path
+    ) -> NoReturn:
+
+    arguments: List[str] = ["--size", "10", "--passes", "5"]
+
+    replay_main(arguments=[
+        *arguments, "--mix", "edit_item=1", "--save-trace", str(tmp_path / "trace.jsonl")
+    ])
+    replay_main(arguments=[*arguments, "--trace", str(tmp_path / "trace.jsonl")])
+
+    expected_result: int = 2
+    actual_result: int = sum(map(
+        lambda line: line.split()[:2] == ["edit_item", "5"], mock_stdout.getvalue().splitlines()
+    ))
+
+    assert expected_result == actual_result, "Saved trace did not replay the same passes."
@@ -0,0 +1,157 @@
+"""
+Unit tests for the one-shot commands.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from pathlib import Path
+
+from sqlite3 import connect
+
+from subprocess import run as run_process
+
+from sys import executable
+
+from typing import List
+from typing import NoReturn
+
+from unittest.mock import patch
+
+from pytest import mark
+from pytest import raises
+
+from src.cli import run
+
+
+@mark.parametrize("file_name", ("todo.json", "todo.db", "todo.replica", "todo.archive"))
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__run__add_done_ls_and_count__success(
+        mock_stdout: StringIO, file_name: str, tmp_path: Path
+    ) -> NoReturn:
+
+    file: List[str] = ["--file", str(tmp_path / file_name)]
+
+    run(arguments=["add", "Buy milk", "Semi-skimmed", *file])
+    run(arguments=["add", "Walk the dog", *file])
+    run(arguments=["done", "1", *file])
+    run(arguments=["count", "--incomplete", *file])
+    run(arguments=["ls", "--completed", *file])
+
+    expected_result: List[str] = [
+        "Added item 0.",
+        "Added item 1.",
+        "Item 1 is done.",
+        "1",
+        '{"title": "Walk the dog", "description": "", "completed": true, "id": 1}',
+    ]
+    actual_result: List[str] = mock_stdout.getvalue().splitlines()
+
+    assert expected_result == actual_result, "One-shot commands did not give the expected output."
+
+
+@mark.parametrize("file_name", ("todo.json", "todo.db"))
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__run__ls_by_title_prefix__success(
+        mock_stdout: StringIO, file_name: str, tmp_path: Path
+    ) -> NoReturn:
+
+    file: List[str] = ["--file", str(tmp_path / file_name)]
+
+    for title in ("Buy milk", "Walk the dog", "Buy bread"):
+        run(arguments=["add", title, *file])
+
+    mock_stdout.truncate(0)
+    mock_stdout.seek(0)
+    run(arguments=["ls", "--title", "Buy", *file])
+
+    expected_result: List[str] = ["Buy bread", "Buy milk"]
+    actual_result: List[str] = sorted(map(
+        lambda line: line.split('"')[3], mock_stdout.getvalue().splitlines()
+    ))
+
+    assert expected_result == actual_result, "Items were not found by title."
+
+
+@patch(target="src.store.SqliteStore.load")
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__run__count_a_database_without_loading_it__success(
+        mock_stdout: StringIO, mock_load, tmp_path: Path
+    ) -> NoReturn:
+
+    database: Path = tmp_path / "todo.db"
+    connection = connect(str(database))
+    connection.execute(
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, title TEXT, description TEXT,"
+        + " completed INTEGER NOT NULL)"
+    )
+    connection.executemany("INSERT INTO items VALUES (?, ?, '', ?)", [
+        (0, "One", 1), (1, None, 0), (2, "Three", 0)
+    ])
+    connection.commit()
+    connection.close()
+
+    run(arguments=["count", "--file", str(database)])
+    run(arguments=["count", "--incomplete", "--file", str(database)])
+    run(arguments=["ls", "--title", "", "--file", str(database)])
+
+    expected_result: List[str] = ["3", "2", "One", "Three"]
+    actual_result: List[str] = [
+        *mock_stdout.getvalue().splitlines()[:2],
+        *map(lambda line: line.split('"')[3], mock_stdout.getvalue().splitlines()[2:])
+    ]
+
+    assert expected_result == actual_result, "The database was not counted."
+    assert not mock_load.called, "The TODO list was loaded to count it."
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__run__done_unknown_id__failure(mock_stdout: StringIO, tmp_path: Path) -> NoReturn:
+
+    expected_result: int = 1
+    actual_result: int = run(arguments=["done", "7", "--file", str(tmp_path / "todo.json")])
+
+    assert expected_result == actual_result, "Checking off a missing item did not fail."
+    assert "There is no item with ID 7." in mock_stdout.getvalue(), "The failure was not reported."
+
+
+def test__run__needs_a_file__failure(monkeypatch) -> NoReturn:
+
+    monkeypatch.delenv("TODO_FILE", raising=False)
+
+    with raises(SystemExit):
+        run(arguments=["count"])
+
+
+def test__python_m_src__skips_the_interactive_program__success(tmp_path: Path) -> NoReturn:
+
+    output: str = run_process(
+        (
+            executable, "-c",
+            "import runpy, sys; sys.argv = ['src', 'count', '--file', sys.argv[1]]\n"
+            + "try: runpy.run_module('src', run_name='__main__')\n"
+            + "except SystemExit:\n"
+            + "    print(sorted({'funcs', 'asyncio', 'src.main'} & set(sys.modules)))",
+            str(tmp_path / "todo.json")
+        ),
+        capture_output=True, text=True, check=True
+    ).stdout
+
+    expected_result: List[str] = ["0", "[]"]
+    actual_result: List[str] = output.splitlines()
+
+    assert expected_result == actual_result, "The interactive program's imports were loaded."
@@ -0,0 +1,100 @@
+"""
+Unit tests for the change event stream.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from typing import Callable
+from typing import List
+from typing import NoReturn
+from typing import Tuple
+
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from pytest import mark
+
+from src.events import Change
+from src.events import ChangeStream
+from src.events import INSERTED
+from src.events import REMOVED
+from src.events import UPDATED
+from src.events import from_record
+from src.events import subscribe
+from src.item import Item
+from src.main import changes
+from src.main import main
+from src.pvector import PVector
+
+
+@patch(target="src.main.changes", wraps=changes)
+@patch(target="sys.stdout", new_callable=StringIO)
+@patch(target="builtins.input", side_effect=[
+    "0", "Buy milk", "", "", "", "0", "Buy bread", "", "", "", "1", "0", "2", "1", "Buy rye",
+    "Seeded", "12", "0", "3"
+])
+def test__main__publishes_each_change_without_comparing_lists__success(
+        _: MagicMock, __: StringIO, mock_changes: MagicMock
+    ) -> NoReturn:
+
+    published: List[Tuple[Change, ...]] = []
+    unsubscribe: Callable = subscribe(published.append)
+
+    try:
+        main(start=False, todo_list=[])
+    finally:
+        unsubscribe()
+
+    expected_result: List[Tuple[Change, ...]] = [
+        (Change(INSERTED, 0, Item("Buy milk", "", False, 0)),),
+        (Change(INSERTED, 1, Item("Buy bread", "", False, 1)),),
+        (Change(UPDATED, 0, Item("Buy milk", "", True, 0)),),
+        (Change(UPDATED, 1, Item("Buy rye", "Seeded", False, 1)),),
+        (Change(REMOVED, 0),),
+    ]
+
+    assert expected_result == published, "Published changes were not as expected."
+    assert 0 == mock_changes.call_count, "The versions were compared to find the changes."
+
+
+def test__change_stream__only_takes_changes_between_the_same_versions__success() -> NoReturn:
+
+    stream: ChangeStream = ChangeStream()
+    before: PVector = PVector([Item("Title", "", False, 0)])
+    after: PVector = before.append(Item("More", "", False, 1))
+    change: Change = Change(INSERTED, 1, after[1])
+
+    stream.emit(before=before, after=after, changes=(change,))
+    stream.emit(before=before, after=before.append(Item("Thrown away")), changes=(change,))
+
+    assert stream.take(before=before, after=after) is None, "Thrown away changes were taken."
+
+    stream.emit(before=before, after=after, changes=(change,))
+
+    assert (change,) == stream.take(before=before, after=after), "Changes were not taken."
+    assert stream.take(before=before, after=after) is None, "Changes were taken twice."
+
+
+@mark.parametrize("record", [
+    ("append", "Title", "Description", True, 4),
+    ("replace", 4, "Title", "Description", False),
+    ("remove", 4),
+])
+def test__from_record__round_trips_records__success(record: Tuple) -> NoReturn:
+
+    assert record == from_record(record).as_record(), "Record did not round trip."
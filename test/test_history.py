@@ -0,0 +1,131 @@
+"""
+Unit tests for undo and redo.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from typing import List
+from typing import NoReturn
+
+from unittest.mock import MagicMock, patch
+
+from src.history import History
+from src.main import main as main_function
+from src.item import Item
+from src.operations import add
+from src.operations import mark_many
+from src.pvector import NODE_BYTES
+from src.pvector import PVector
+
+
+def test__history__undoes_and_redoes_versions__success() -> NoReturn:
+
+    history: History = History()
+    versions: List[PVector] = [PVector()]
+
+    for number in range(3):
+        versions.append(add(versions[-1], f"Title {number}", "Description"))
+        history.record(before=versions[-2], after=versions[-1])
+
+    undone: PVector = history.undo(todo_list=history.undo(todo_list=versions[-1]))
+    history.record(before=versions[2], after=undone)
+    redone: PVector = history.redo(todo_list=undone)
+    history.record(before=undone, after=redone)
+
+    assert versions[1] is undone, "Undo did not go back two versions."
+    assert versions[2] is redone, "Redo did not go forward one version."
+    assert history.can_redo(), "Redo history was lost by undo or redo."
+
+
+def test__history__drops_the_oldest_version_past_the_limit__success() -> NoReturn:
+
+    history: History = History(limit=2)
+    versions: List[PVector] = [PVector()]
+
+    for number in range(5):
+        versions.append(add(versions[-1], f"Title {number}", "Description"))
+        history.record(before=versions[-2], after=versions[-1])
+
+    expected_result: PVector = versions[3]
+    actual_result: PVector = history.undo(todo_list=history.undo(todo_list=versions[-1]))
+
+    assert expected_result is actual_result, "Did not undo as far as the limit."
+    assert not history.can_undo(), "Kept more versions than the limit."
+
+
+def test__history__drops_the_oldest_versions_past_the_budget__success() -> NoReturn:
+
+    history: History = History(budget=100 * NODE_BYTES)
+    versions: List[PVector] = [PVector(map(
+        lambda number: Item(f"Title {number}", "", False, number), range(1000)
+    ))]
+
+    for number in range(3):
+        versions.append(add(versions[-1], f"Title {number}", "Description"))
+        history.record(before=versions[-2], after=versions[-1])
+
+    small_changes: int = history.memory_used()
+    versions.append(mark_many(versions[-1], "all", True))
+    history.record(before=versions[-2], after=versions[-1])
+
+    expected_result: PVector = versions[-2]
+    actual_result: PVector = history.undo(todo_list=versions[-1])
+
+    assert small_changes < 3 * 20 * NODE_BYTES, "Small changes were charged the whole list."
+    assert expected_result is actual_result, "The latest change could not be undone."
+    assert not history.can_undo(), "Kept more versions than the budget."
+    assert history.can_redo(), "The undone change could not be redone."
+
+
+def test__history__new_change_clears_redo__success() -> NoReturn:
+
+    history: History = History()
+    first: PVector = add(PVector(), "First", "Description")
+    history.record(before=PVector(), after=first)
+
+    undone: PVector = history.undo(todo_list=first)
+    history.record(before=first, after=undone)
+    history.record(before=undone, after=add(undone, "Second", "Description"))
+
+    assert not history.can_redo(), "A new change did not clear the redo history."
+
+
+@patch(
+    target="builtins.input",
+    side_effect=[
+        "0", "First", "One", "", "", "0", "Second", "Two", "", "", "19", "11", "19", "3"
+    ]
+)
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__main__undo_and_redo_commands__success(
+        mock_stdout: StringIO, mock_input: MagicMock
+    ) -> NoReturn:
+
+    main_function(start=True, todo_list=[])
+
+    summaries: List[str] = [
+        line for line in mock_stdout.getvalue().splitlines() if " items, " in line
+    ]
+
+    expected_result: List[str] = [
+        "TODO - 0 items", "TODO - 1 items", "TODO - 2 items", "TODO - 1 items", "TODO - 2 items",
+        "TODO - 1 items"
+    ]
+    actual_result: List[str] = [summary.split(",")[0] for summary in summaries]
+
+    assert expected_result == actual_result, "Undo and redo did not move between versions."
@@ -0,0 +1,98 @@
+"""
+Unit tests for the per-command timing and allocation instrumentation.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from json import load
+
+from pathlib import Path
+
+from typing import Dict
+from typing import List
+from typing import NoReturn
+
+from unittest.mock import MagicMock, patch
+
+from src.instrumentation import Instrumentation
+from src.instrumentation import active
+from src.instrumentation import measured
+from src.main import _run
+from src.main import stats
+
+
+def test__measured__without_instrumentation_just_calls__success() -> NoReturn:
+
+    expected_result: int = 3
+    actual_result: int = measured("sum", sum, [1, 2])
+
+    assert expected_result == actual_result, "Did not return what the function returned."
+    assert active() is None, "Instrumentation was active without being switched on."
+
+
+def test__instrumentation__nests_phases_and_counts_allocations__success() -> NoReturn:
+
+    instrumentation: Instrumentation = Instrumentation()
+
+    with instrumentation.activate():
+        for _ in range(3):
+            measured("outer", lambda: len(measured("inner", lambda: bytearray(10 ** 6))))
+
+    expected_result: Dict[str, int] = {"outer": 3, "outer/inner": 3}
+    actual_result: Dict[str, int] = {
+        key: stats["calls"] for key, stats in instrumentation.as_dict().items()
+    }
+
+    assert expected_result == actual_result, "Phases were not recorded under their parents."
+    assert instrumentation.phases["outer"].peak_bytes >= 10 ** 6, "Inner allocation was lost."
+    assert instrumentation.phases["outer/inner"].wall_ns <= (
+        instrumentation.phases["outer"].wall_ns
+    ), "The inner phase took longer than the phase it ran in."
+    assert active() is None, "Instrumentation stayed active after the with block."
+
+
+@patch(target="builtins.input", side_effect=["0", "Title", "Description", "", "", "16", "3"])
+@patch(target="sys.stdout", new_callable=StringIO)
+def test___run__instrument_reports_and_saves_phases__success(
+        mock_stdout: StringIO, mock_input: MagicMock, tmp_path: Path
+    ) -> NoReturn:
+
+    _run(arguments=["--instrument", str(tmp_path / "stats.json")])
+
+    with open(tmp_path / "stats.json", encoding="utf-8") as stats_file:
+        saved: Dict[str, Dict] = load(stats_file)
+
+    expected_result: List[str] = [
+        "add_item", "add_item/prompt", "choose", "choose/prompt", "exit_the_program", "record",
+        "render", "stats"
+    ]
+    actual_result: List[str] = list(saved)
+
+    assert expected_result == actual_result, "Did not save every phase of the session."
+    assert 4 == saved["add_item/prompt"]["calls"], "Did not count all four of add's prompts."
+    assert "add_item/prompt" in mock_stdout.getvalue(), "Stats command did not show the phases."
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__stats__without_instrumentation__success(mock_stdout: StringIO) -> NoReturn:
+
+    expected_result: bool = False
+    actual_result: bool = stats()
+
+    assert expected_result == actual_result, "Stats did not return False."
+    assert "Instrumentation is off" in mock_stdout.getvalue(), "Did not say how to switch it on."
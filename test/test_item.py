@@ -0,0 +1,67 @@
+"""
+Unit tests for the compact TODO list item.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from json import dumps
+
+from sys import getsizeof
+
+from typing import Dict
+from typing import NoReturn
+
+from types import NoneType
+
+from pytest import raises
+
+from src.item import Item
+from src.item import as_item
+
+
+SAMPLE_UNCOMPLETED_LIST_ITEM: Dict[str, (str | bool)] = {
+    "title": "Sample Title",
+    "description": "Sample Description",
+    "completed": False
+}
+
+
+def test__item__behaves_like_the_dictionary_it_replaces__success() -> NoReturn:
+
+    item: Item = as_item(SAMPLE_UNCOMPLETED_LIST_ITEM)
+
+    expected_result: Dict[str, (str | bool | NoneType)] = SAMPLE_UNCOMPLETED_LIST_ITEM
+    actual_result: Item = item
+
+    assert expected_result == actual_result, "Item did not compare equal to its dictionary."
+    assert "Sample Title" == item.get("title"), "get() did not return the title."
+    assert dumps(SAMPLE_UNCOMPLETED_LIST_ITEM) == dumps(item, default=dict), "JSON differed."
+    assert {**SAMPLE_UNCOMPLETED_LIST_ITEM, "completed": True} == item.replace(completed=True), (
+        "replace() did not change the completed status."
+    )
+
+
+def test__item__is_immutable__raises_attribute_error() -> NoReturn:
+
+    with raises(AttributeError):
+        Item("Sample Title", "Sample Description").completed = True
+
+
+def test__item__is_smaller_than_a_dictionary__success() -> NoReturn:
+
+    assert getsizeof(Item()) < getsizeof(dict(SAMPLE_UNCOMPLETED_LIST_ITEM)) / 2, (
+        "Item was not much smaller than the dictionary it replaces."
+    )
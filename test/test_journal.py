@@ -0,0 +1,139 @@
+"""
+Unit tests for the operation journal and snapshot compaction.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from pathlib import Path
+
+from typing import Dict
+from typing import List
+from typing import NoReturn
+from typing import Tuple
+
+from types import NoneType
+
+from unittest.mock import patch
+
+from pytest import mark
+
+from src.item import as_items
+from src.journal import Journal
+from src.main import _run
+from src.operations import apply_operations
+from src.operations import changes
+from src.pvector import PVector
+
+
+SAMPLE_ITEMS: PVector = PVector(as_items([
+    {"title": "First", "description": "One", "completed": False},
+    {"title": "Second", "description": "Two", "completed": True},
+    {"title": "Third", "description": "Three", "completed": False},
+]))
+
+
+@mark.parametrize("operations", (
+    (("add", "Fourth", "Four"),),
+    (("remove", 1),),
+    (("toggle", 0),),
+    (("edit", 2, "New Title", "New Description"),),
+    (("remove", 0), ("remove", 0), ("add", "Only", "Item")),
+))
+def test__changes__replays_to_the_same_list__success(operations: Tuple[Tuple, ...]) -> NoReturn:
+
+    after: PVector = apply_operations(todo_list=SAMPLE_ITEMS, operations=operations)
+
+    expected_result: List[Dict[str, (str | bool | NoneType)]] = list(after)
+    actual_result: PVector = apply_operations(
+        todo_list=SAMPLE_ITEMS, operations=changes(before=SAMPLE_ITEMS, after=after)
+    )
+
+    assert expected_result == actual_result, "Replaying the changes did not give the same list."
+
+
+def test__changes__toggle_is_one_replace__success() -> NoReturn:
+
+    expected_result: Tuple[Tuple, ...] = (("replace", 0, "First", "One", True),)
+    actual_result: Tuple[Tuple, ...] = changes(
+        before=SAMPLE_ITEMS,
+        after=apply_operations(todo_list=SAMPLE_ITEMS, operations=[("toggle", 0)])
+    )
+
+    assert expected_result == actual_result, "Changes were not as small as expected."
+
+
+def test__journal__reloads_after_compaction_and_replays_only_the_tail__success(
+        tmp_path: Path
+    ) -> NoReturn:
+
+    operations: List[Tuple] = [("add", f"Item {number}", "Description") for number in range(7)]
+
+    with Journal(path=str(tmp_path / "todo.json"), sync_every=2, compact_every=5) as journal:
+        expected_result: PVector = apply_operations(
+            todo_list=journal.load(), operations=operations, step=journal.step
+        )
+
+    with Journal(path=str(tmp_path / "todo.json")) as journal:
+        actual_result: PVector = journal.load()
+
+    assert expected_result == actual_result, "Reloaded TODO list was not as expected."
+    assert 2 == len((tmp_path / "todo.json.journal").read_text().splitlines()), "Not compacted."
+
+
+def test__journal__cuts_off_a_partly_written_record__success(tmp_path: Path) -> NoReturn:
+
+    with Journal(path=str(tmp_path / "todo.json")) as journal:
+        apply_operations(
+            todo_list=journal.load(), operations=[("add", "Kept", "Item")], step=journal.step
+        )
+
+    with open(tmp_path / "todo.json.journal", "ab") as torn_journal:
+        torn_journal.write(b'{"sequence": 2, "operation": ["add", "Lo')
+
+    with Journal(path=str(tmp_path / "todo.json")) as journal:
+        apply_operations(
+            todo_list=journal.load(), operations=[("add", "Also", "Kept")], step=journal.step
+        )
+
+    expected_result: List[str] = ["Kept", "Also"]
+
+    with Journal(path=str(tmp_path / "todo.json")) as journal:
+        actual_result: List[str] = [item["title"] for item in journal.load()]
+
+    assert expected_result == actual_result, "Partly written record was not cut off."
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+def test___run__file_keeps_the_list_between_runs__success(
+        mock_stdout: StringIO, tmp_path: Path
+    ) -> NoReturn:
+
+    (tmp_path / "first.txt").write_text('add "Sample Title" "Sample Description"\n')
+    (tmp_path / "second.txt").write_text("toggle 0\n")
+
+    _run(arguments=["--file", str(tmp_path / "todo.json"), "--batch", str(tmp_path / "first.txt")])
+    _run(arguments=["--file", str(tmp_path / "todo.json"), "--batch", str(tmp_path / "second.txt")])
+
+    expected_result: List[Dict[str, (str | bool | NoneType)]] = [
+        {"title": "Sample Title", "description": "Sample Description", "completed": True}
+    ]
+
+    with Journal(path=str(tmp_path / "todo.json")) as journal:
+        actual_result: PVector = journal.load()
+
+    assert expected_result == actual_result, "TODO list was not kept between runs."
@@ -46,6 +46,8 @@ from src.main import render_todo_list
 from src.main import exit_the_program
 from src.main import main as main_function
 from src.main import _get_item_number
+from src.main import _COMMANDS
+from src.main import _DISPATCH_TABLE
 
 
 SAMPLE_UNCOMPLETED_LIST_ITEM: Dict[str, (str | bool)] = {
@@ -62,6 +64,9 @@ SAMPLE_COMPLETED_LIST_ITEM: Dict[str, (str | bool)] = {
 
 SAMPLE_TITLE_DESCRIPTION: List = ["Sample Title", "Sample Description"]
 
+# The answers to every prompt for adding an item: no priority and no due date.
+SAMPLE_ADD_ANSWERS: List = [*SAMPLE_TITLE_DESCRIPTION, "", ""]
+
 
 def function_one() -> NoReturn:
     pass
@@ -90,7 +95,21 @@ def test__list_help__list_all_functions_no_start__success(
     assert expected_result == actual_result, "Printed text was not as expected."
 
 
-@patch(target="builtins.input", side_effect=deepcopy(SAMPLE_TITLE_DESCRIPTION))
+@patch(target='sys.stdout', new_callable=StringIO)
+def test__list_help__list_functions_from_help_item__success(
+        mock_stdout: StringIO
+    ) -> NoReturn:
+
+    false_value: bool = list_help(help_list=iter(FUNCTIONS_LIST), help_item=1)
+
+    expected_result: str = "1 = Function Two\n"
+    actual_result: str = mock_stdout.getvalue()
+
+    assert false_value is False, "Did not return false as expected."
+    assert expected_result == actual_result, "Printed text was not as expected."
+
+
+@patch(target="builtins.input", side_effect=deepcopy(SAMPLE_ADD_ANSWERS))
 def test__add_item__adds_item_to_list__success(mock_input) -> NoReturn:
 
     expected_result: List[Dict[str, (str | bool | NoneType)]] = [
@@ -110,7 +129,6 @@ def test__add_item__toggles_completed_to_true__success(
     ) -> NoReturn:
 
     expected_result: List[Dict[str, (str | bool | NoneType)]] = [
-        deepcopy(SAMPLE_UNCOMPLETED_LIST_ITEM),
         deepcopy(SAMPLE_COMPLETED_LIST_ITEM)
     ]
 
@@ -129,7 +147,6 @@ def test__add_item__toggles_completed_to_false__success(
     ) -> NoReturn:
 
     expected_result:  List[Dict[str, (str | bool | NoneType)]] = [
-        deepcopy(SAMPLE_COMPLETED_LIST_ITEM),
         deepcopy(SAMPLE_UNCOMPLETED_LIST_ITEM)
     ]
 
@@ -186,6 +203,18 @@ def test___get_item_number__returns_an_item_number_after_failure_with_prompt__su
     assert expected_return_value is actual_return_value, "_get_item_number() did not return 1"
 
 
+@patch(target="builtins.input", side_effect=["Null"] * 5000 + ["1"])
+@patch(target='sys.stdout', new_callable=StringIO)
+def test___get_item_number__survives_more_retries_than_the_recursion_limit__success(
+        mock_stdout: StringIO, mock_input: MagicMock
+    ) -> NoReturn:
+
+    expected_return_value = 1
+    actual_return_value = _get_item_number(operation="remove")
+
+    assert expected_return_value is actual_return_value, "_get_item_number() did not return 1"
+
+
 @patch(target="src.main._get_item_number", return_value=0)
 def test__remove_item__removes_item_from_list_when_passed_no_item__success(
         mock__get_item_number: int
@@ -334,6 +363,57 @@ def test__render_todo_list__renders_todo_list__success(mock_stdout: StringIO) ->
     assert expected_result == actual_result, "Printed text was not as expected."
 
 
+@patch(target="src.main._main_step")
+def test__main__runs_more_passes_than_the_recursion_limit__success(
+        mock__main_step: MagicMock
+    ) -> NoReturn:
+
+    mock__main_step.side_effect = [(False, [])] * 5000 + [0]
+
+    expected_result: int = 0
+    actual_result: int = main_function(start=True, todo_list=[])
+
+    assert expected_result == actual_result, "Main did not return 0."
+    assert 5001 == mock__main_step.call_count, "Main did not run every pass."
+
+
+def test___commands__registry_lists_public_functions_in_menu_order__success() -> NoReturn:
+
+    expected_result: List[str] = [
+        "add_item", "checkoff_item", "edit_item", "exit_the_program", "export_items",
+        "import_items", "list_help", "list_lists", "new_list", "next_up", "overdue_items", "redo",
+        "remove_item", "render_todo_list", "schedule_item", "search_items", "stats",
+        "switch_list", "uncheck_item", "undo", "update_many_items", "view_items"
+    ]
+
+    actual_result: List[str] = [command.name for command in _COMMANDS]
+
+    assert expected_result == actual_result, "Registry did not hold the expected commands."
+    assert _DISPATCH_TABLE[0] is _DISPATCH_TABLE["add_item"], "Number and name lookups differ."
+    assert ("todo_list",) == _DISPATCH_TABLE["add_item"].arguments, "Arguments were not bound."
+
+
+@patch(target="src.main.signature")
+@patch(target="src.main.getmembers")
+@patch(target="builtins.input", side_effect=["0", *SAMPLE_ADD_ANSWERS, "99", "3"])
+@patch(target='sys.stdout', new_callable=StringIO)
+def test__main__adds_an_item_then_exits_without_introspection__success(
+        mock_stdout: StringIO,
+        mock_input: MagicMock,
+        mock_getmembers: MagicMock,
+        mock_signature: MagicMock
+    ) -> NoReturn:
+
+    expected_result: int = 0
+    actual_result: int = main_function(start=True, todo_list=[])
+
+    assert expected_result == actual_result, "Main did not return 0."
+    assert '"title": "Sample Title"' in mock_stdout.getvalue(), "Added item was not rendered."
+    assert "That is not an option." in mock_stdout.getvalue(), "Bad option was not reported."
+    assert not mock_getmembers.called, "Main introspected the module while dispatching."
+    assert not mock_signature.called, "Main introspected a command while dispatching."
+
+
 # @mark.parametrize("functions_to_be_called, parameters", [
 #     (list_help, exit_the_program), (add_item, exit_the_program),
 #     (remove_item, exit_the_program), (edit_item, exit_the_program),
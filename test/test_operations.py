@@ -0,0 +1,251 @@
+"""
+Unit tests for the pure TODO list operations and batch mode.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from pathlib import Path
+
+from typing import Dict
+from typing import List
+from typing import NoReturn
+from typing import Tuple
+
+from types import NoneType
+
+from unittest.mock import MagicMock, patch
+
+from pytest import mark
+from pytest import raises
+
+from src.main import _run
+from src.main import update_many_items
+from src.operations import apply_operations
+from src.operations import changes
+from src.operations import parse_operation
+from src.operations import run_batch
+from src.pvector import PVector
+
+
+SAMPLE_UNCOMPLETED_LIST_ITEM: Dict[str, (str | bool)] = {
+    "title": "Sample Title",
+    "description": "Sample Description",
+    "completed": False
+}
+
+SAMPLE_COMPLETED_LIST_ITEM: Dict[str, (str | bool)] = {
+    "title": "Sample Title",
+    "description": "Sample Description",
+    "completed": True
+}
+
+
+@mark.parametrize("line, operation", (
+    ('add "Sample Title" "Sample Description"', ("add", "Sample Title", "Sample Description")),
+    ("remove 3", ("remove", 3)),
+    ("edit 1 Title Description", ("edit", 1, "Title", "Description")),
+    ("toggle 0", ("toggle", 0)),
+))
+def test__parse_operation__parses_each_operation__success(line: str, operation: tuple) -> NoReturn:
+
+    expected_result: tuple = operation
+    actual_result: tuple = parse_operation(line=line)
+
+    assert expected_result == actual_result, "Parsed operation was not as expected."
+
+
+@mark.parametrize("line", (
+    "frobnicate 1", "remove", "toggle one", 'add "Unclosed', "mark_many nothing true"
+))
+def test__parse_operation__bad_line__raises_value_error(line: str) -> NoReturn:
+
+    with raises(ValueError):
+        parse_operation(line=line)
+
+
+def test__apply_operations__toggle_and_edit_keep_original_untouched__success() -> NoReturn:
+
+    original: List[Dict[str, (str | bool | NoneType)]] = [SAMPLE_UNCOMPLETED_LIST_ITEM]
+
+    expected_result: List[Dict[str, (str | bool | NoneType)]] = [{
+        "title": "New Title", "description": "New Description", "completed": True
+    }]
+
+    actual_result: List[Dict[str, (str | bool | NoneType)]] = apply_operations(
+        todo_list=original,
+        operations=[("toggle", 0), ("edit", 0, "New Title", "New Description")]
+    )
+
+    assert expected_result == actual_result, "Updated TODO list was not as expected."
+    assert [SAMPLE_UNCOMPLETED_LIST_ITEM] == original, "Original TODO list was modified."
+
+
+def test__apply_operations__ids_stay_put_and_edits_keep_the_order__success() -> NoReturn:
+
+    expected_result: List[Tuple[int, str]] = [(0, "Zero"), (2, "New Two"), (3, "Three")]
+
+    actual_result: List[Tuple[int, str]] = [(item.id, item.title) for item in apply_operations(
+        todo_list=[],
+        operations=[
+            ("add", "Zero", ""), ("add", "One", ""), ("add", "Two", ""), ("remove", 1),
+            ("add", "Three", ""), ("edit", 2, "New Two", ""), ("toggle", 0), ("remove", 7)
+        ]
+    )]
+
+    assert expected_result == actual_result, "IDs or order were not as expected."
+
+
+def test__run_batch__skips_comments_and_blank_lines__success() -> NoReturn:
+
+    expected_result: List[Dict[str, (str | bool | NoneType)]] = [SAMPLE_COMPLETED_LIST_ITEM]
+
+    actual_result: List[Dict[str, (str | bool | NoneType)]] = run_batch(lines=[
+        "# A comment", "", 'add "Sample Title" "Sample Description"', "add Other Item",
+        "remove 1", "toggle 0"
+    ])
+
+    assert expected_result == actual_result, "Batch result was not as expected."
+
+
+@patch(target="src.main.stdin", new=StringIO('add "Sample Title" "Sample Description"\n'))
+@patch(target="builtins.input")
+@patch(target="sys.stdout", new_callable=StringIO)
+def test___run__batch_mode_prints_final_list_once_without_prompting__success(
+        mock_stdout: StringIO, mock_input
+    ) -> NoReturn:
+
+    exit_code: int = _run(arguments=["--batch", "-"])
+
+    assert 0 == exit_code, "Batch mode did not exit with 0."
+    assert 1 == mock_stdout.getvalue().count('"title": "Sample Title"'), "List not printed once."
+    assert not mock_input.called, "Batch mode prompted for input."
+
+
+@mark.parametrize("line", ("bogus", "toggle x", 'add "Unclosed Description'))
+@patch(target="sys.stdout", new_callable=StringIO)
+def test___run__batch_mode_bad_line_applies_nothing__failure(
+        mock_stdout: StringIO, line: str, tmp_path: Path
+    ) -> NoReturn:
+
+    (tmp_path / "script.txt").write_text(f'add "Sample Title" "Sample Description"\n\n{line}\n')
+
+    exit_code: int = _run(arguments=[
+        "--file", str(tmp_path / "todo.json"), "--batch", str(tmp_path / "script.txt")
+    ])
+
+    expected_result: str = "Line 3: "
+    actual_result: str = mock_stdout.getvalue()[:len("Line 3: ")]
+
+    assert 1 == exit_code, "Batch mode did not exit with 1."
+    assert expected_result == actual_result, "The bad line was not reported."
+    assert not (tmp_path / "todo.json.journal").exists() or "" == (
+        tmp_path / "todo.json.journal"
+    ).read_text(), "Lines before the bad one were applied."
+
+
+BULK_LIST: PVector = apply_operations(todo_list=[], operations=[
+    ("append", "Buy milk", "Semi-skimmed", True),
+    ("append", "Walk the dog", "Park", False),
+    ("append", "Buy bread", "Wholemeal", True),
+    ("append", "Post letter", "First class", False),
+    ("append", "Buy stamps", "Second class", False),
+])
+
+
+@mark.parametrize("operation, expected_items", (
+    (("remove_many", "completed"), [(1, "Walk the dog", False), (3, "Post letter", False),
+        (4, "Buy stamps", False)]),
+    (("remove_many", "1-3"), [(0, "Buy milk", True), (4, "Buy stamps", False)]),
+    (("mark_many", "0,3,4", True), [(0, "Buy milk", True), (1, "Walk the dog", False),
+        (2, "Buy bread", True), (3, "Post letter", True), (4, "Buy stamps", True)]),
+    (("mark_many", "title:^BUY", False), [(0, "Buy milk", False), (1, "Walk the dog", False),
+        (2, "Buy bread", False), (3, "Post letter", False), (4, "Buy stamps", False)]),
+    (("edit_many", "incomplete", "Later", ""), [(0, "Buy milk", True), (1, "Later", False),
+        (2, "Buy bread", True), (3, "Later", False), (4, "Later", False)]),
+))
+def test__bulk_operations__change_every_selected_item__success(
+        operation: Tuple, expected_items: List[Tuple]
+    ) -> NoReturn:
+
+    after: PVector = apply_operations(todo_list=BULK_LIST, operations=[operation])
+
+    expected_result: List[Tuple] = expected_items
+    actual_result: List[Tuple] = [(item.id, item.title, item.completed) for item in after]
+
+    assert expected_result == actual_result, "Bulk operation did not change the selected items."
+    assert after == apply_operations(
+        todo_list=BULK_LIST, operations=changes(before=BULK_LIST, after=after)
+    ), "Replaying the changes did not give the same list."
+
+
+def test__bulk_operations__no_match_keeps_the_same_version__success() -> NoReturn:
+
+    expected_result: PVector = BULK_LIST
+    actual_result: PVector = apply_operations(
+        todo_list=BULK_LIST, operations=[("mark_many", "title:xyz", True), ("remove_many", "9-12")]
+    )
+
+    assert expected_result is actual_result, "A bulk change that matched nothing made a new list."
+
+
+@mark.parametrize("selected", ("", "3-", "a,b", "title:(", "some"))
+def test__bulk_operations__bad_selection__raises_value_error(selected: str) -> NoReturn:
+
+    with raises(ValueError):
+        apply_operations(todo_list=BULK_LIST, operations=[("remove_many", selected)])
+
+
+def test__changes__bulk_change_gives_one_record_per_changed_item__success() -> NoReturn:
+
+    expected_result: Tuple[Tuple, ...] = (
+        ("remove", 0), ("replace", 1, "Walk the dog", "Park", True), ("remove", 2),
+        ("append", "New", "Item", False, 5)
+    )
+    actual_result: Tuple[Tuple, ...] = changes(
+        before=BULK_LIST,
+        after=apply_operations(todo_list=BULK_LIST, operations=[
+            ("remove_many", "completed"), ("toggle", 1), ("add", "New", "Item")
+        ])
+    )
+
+    assert expected_result == actual_result, "Changes were not one record per changed item."
+
+
+@patch(target="builtins.input", side_effect=["completed", "remove"])
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__update_many_items__removes_the_selected_items__success(
+        mock_stdout: StringIO, mock_input: MagicMock
+    ) -> NoReturn:
+
+    expected_result: List[int] = [1, 3, 4]
+    actual_result: List[int] = [item.id for item in update_many_items(todo_list=BULK_LIST)]
+
+    assert expected_result == actual_result, "Update Many Items did not remove the completed items."
+    assert "2 items selected." in mock_stdout.getvalue(), "Did not say how many were selected."
+
+
+@patch(target="builtins.input", side_effect=["completed", "archive"])
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__update_many_items__unknown_action__failure(
+        mock_stdout: StringIO, mock_input: MagicMock
+    ) -> NoReturn:
+
+    expected_result: bool = False
+    actual_result: bool = update_many_items(todo_list=BULK_LIST)
+
+    assert expected_result == actual_result, "An unknown action changed the TODO list."
@@ -0,0 +1,176 @@
+"""
+Unit tests for the persistent vector.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from typing import List
+from typing import NoReturn
+
+from pytest import mark
+from pytest import raises
+
+from src.item import Item
+from src.pvector import PVector
+
+
+@mark.parametrize("size", (0, 1, 2, 7, 100))
+def test__pvector__matches_list_after_build__success(size: int) -> NoReturn:
+
+    expected_result: List[int] = list(range(size))
+    actual_result: List[int] = list(PVector(range(size)))
+
+    assert expected_result == actual_result, "PVector did not keep the order of its values."
+
+
+def test__pvector__append_leaves_original_untouched__success() -> NoReturn:
+
+    original: PVector = PVector([1, 2, 3])
+    updated: PVector = original.append(4)
+
+    assert [1, 2, 3] == original, "Original PVector was modified."
+    assert [1, 2, 3, 4] == updated, "Appended PVector was not as expected."
+
+
+@mark.parametrize("index", (0, 3, 6, -1))
+def test__pvector__delete_matches_list_delete__success(index: int) -> NoReturn:
+
+    expected_result: List[int] = list(range(7))
+    del expected_result[index]
+
+    actual_result: PVector = PVector(range(7)).delete(index)
+
+    assert expected_result == actual_result, "PVector.delete did not match list deletion."
+
+
+@mark.parametrize("index", (0, 2, 5))
+def test__pvector__insert_and_set_match_list__success(index: int) -> NoReturn:
+
+    expected_result: List[int] = list(range(5))
+    expected_result.insert(index, "inserted")
+    expected_result[0] = "set"
+
+    actual_result: PVector = PVector(range(5)).insert(index, "inserted").set(0, "set")
+
+    assert expected_result == actual_result, "PVector.insert/set did not match list behaviour."
+
+
+def test__pvector__stays_balanced_through_many_updates__success() -> NoReturn:
+
+    expected_result: List[int] = list(range(0, 2000, 2))
+
+    vector: PVector = PVector()
+
+    for value in range(2000):
+        vector = vector.append(value)
+
+    for index in range(1000):
+        vector = vector.delete(index + 1)
+
+    assert expected_result == vector, "PVector lost values after repeated updates."
+    assert vector._root.height <= 15, "PVector tree was not kept balanced."
+
+
+def test__pvector__delete_out_of_range__raises_index_error() -> NoReturn:
+
+    with raises(IndexError):
+        PVector([1]).delete(1)
+
+
+def test__pvector__slice_and_bisect__success() -> NoReturn:
+
+    vector: PVector = PVector(range(0, 100, 10))
+
+    assert [30, 40, 50] == vector[3:6], "Slice did not return the expected window."
+    assert 4 == vector.bisect_left(35), "bisect_left did not find the insertion point."
+
+
+@mark.parametrize("size, extra", ((0, 5), (5, 0), (1, 1000), (1000, 1), (300, 700)))
+def test__pvector__extend_joins_in_bulk_and_stays_balanced__success(
+        size: int, extra: int
+    ) -> NoReturn:
+
+    original: PVector = PVector(range(size))
+    extended: PVector = original.extend(range(size, size + extra))
+
+    expected_result: List[int] = list(range(size + extra))
+    actual_result: PVector = extended
+
+    assert expected_result == actual_result, "PVector.extend did not match list extension."
+    assert list(range(size)) == original, "Original PVector was modified."
+    assert extended._root is None or extended._root.height <= 15, "Extended tree was unbalanced."
+
+
+def test__pvector__completed_counts_follow_every_update__success() -> NoReturn:
+
+    vector: PVector = PVector(map(
+        lambda number: Item("Title", None, number % 3 == 0, number), range(30)
+    ))
+    vector = vector.delete(0).append(Item("Title", None, True, 30)).insert(5, Item("Title"))
+    vector = vector.set(2, vector[2].replace(completed=True)).extend([Item("Title", None, True)])
+
+    expected_result: List = [
+        (position, item) for position, item in enumerate(vector) if not item.completed
+    ][4:]
+    actual_result: List = list(vector.iterate_completed(completed=False, start=4))
+
+    assert sum(map(lambda item: item.completed, vector)) == vector.count_completed(), (
+        "Completed count was not kept up to date."
+    )
+    assert len(vector) - vector.count_completed() == vector.count_completed(completed=False), (
+        "Outstanding count did not match."
+    )
+    assert expected_result == actual_result, "Outstanding items were not iterated in order."
+
+
+@mark.parametrize("index", [0, 7, 99])
+def test__pvector__shared_prefix_and_suffix_around_a_change__success(index: int) -> NoReturn:
+
+    vector: PVector = PVector(map(lambda number: Item("Title", None, False, number), range(100)))
+
+    for changed, before, after in (
+                (vector.set(index, Item("Changed")), index, 99 - index),
+                (vector.delete(index), index, 99 - index),
+                (vector.insert(index, Item("New")), index, 100 - index),
+            ):
+        expected_result: List[int] = [before, after]
+        actual_result: List[int] = [vector.shared_prefix(changed), vector.shared_suffix(changed)]
+
+        assert expected_result == actual_result, "Shared values were not counted as expected."
+
+    assert [100, 100] == [vector.shared_prefix(vector), vector.shared_suffix(vector)], (
+        "A vector did not share every value with itself."
+    )
+
+
+def test__pvector__unshared_nodes_counts_only_what_a_change_added__success() -> NoReturn:
+
+    vector: PVector = PVector(map(lambda number: Item("Title", None, False, number), range(1000)))
+    changed: PVector = vector.set(500, Item("Changed"))
+    rebuilt: PVector = PVector(vector)
+
+    expected_result: List[int] = [0, changed.unshared_nodes(vector), 1000, 1000]
+    actual_result: List[int] = [
+        vector.unshared_nodes(vector),
+        vector.unshared_nodes(changed),
+        rebuilt.unshared_nodes(vector),
+        vector.unshared_nodes(PVector()),
+    ]
+
+    assert expected_result == actual_result, "Unshared nodes were not counted as expected."
+    assert 0 < changed.unshared_nodes(vector) <= 2 * (1000).bit_length(), (
+        "A single change was not charged only the path to it."
+    )
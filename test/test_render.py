@@ -0,0 +1,171 @@
+"""
+Unit tests for rendering the TODO list.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from json import dumps
+
+from typing import List
+from typing import NoReturn
+
+from unittest.mock import MagicMock, patch
+
+from pytest import mark
+
+from src.item import Item
+from src.item import as_items
+from src.main import view_items
+from src.pvector import PVector
+from src.render import _ROW_CACHE
+from src.render import _ROW_CACHE_LIMIT
+from src.render import render_viewport
+from src.render import stream_todo_list
+
+
+def sample_list(size: int) -> PVector:
+    return PVector(as_items([
+        {"title": f"Title {number}", "description": "Description", "completed": number % 2 == 0}
+        for number in range(size)
+    ]))
+
+
+@mark.parametrize("size", (0, 1, 3))
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__stream_todo_list__matches_json_dumps__success(
+        mock_stdout: StringIO, size: int
+    ) -> NoReturn:
+
+    false_value: bool = stream_todo_list(todo_list=sample_list(size))
+
+    expected_result: str = dumps(list(sample_list(size)), indent=4, default=dict) + "\n"
+    actual_result: str = mock_stdout.getvalue()
+
+    assert false_value is False, "Did not return false as expected."
+    assert expected_result == actual_result, "Streamed text did not match json.dumps."
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__render_viewport__shows_counts_and_the_last_page__success(
+        mock_stdout: StringIO
+    ) -> NoReturn:
+
+    render_viewport(todo_list=sample_list(5), size=2)
+
+    expected_result: List[str] = [
+        "TODO - 5 items, 3 completed, 2 to do",
+        "Showing items 3 to 4:",
+        '3 (ID 3) = {"title": "Title 3", "description": "Description", "completed": false}',
+        '4 (ID 4) = {"title": "Title 4", "description": "Description", "completed": true}',
+    ]
+
+    actual_result: List[str] = mock_stdout.getvalue().splitlines()
+
+    assert expected_result == actual_result, "Viewport was not as expected."
+
+
+@patch(target="src.render.dumps", side_effect=dumps)
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__render_viewport__only_serialises_changed_rows__success(
+        mock_stdout: StringIO, mock_dumps: MagicMock
+    ) -> NoReturn:
+
+    todo_list: PVector = sample_list(10)
+    render_viewport(todo_list=todo_list, start=0)
+
+    mock_dumps.reset_mock()
+    changed_item: Item = Item("Changed", "Description", False, id=4)
+    render_viewport(todo_list=todo_list.set(4, changed_item), start=0)
+
+    expected_result: int = 1
+    actual_result: int = mock_dumps.call_count
+
+    assert expected_result == actual_result, "Unchanged rows were serialised again."
+
+
+@patch(target="src.render.dumps", side_effect=dumps)
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__stream_todo_list__long_list_keeps_the_cache_bounded__success(
+        mock_stdout: StringIO, mock_dumps: MagicMock
+    ) -> NoReturn:
+
+    todo_list: PVector = sample_list(_ROW_CACHE_LIMIT + 1000)
+    stream_todo_list(todo_list=todo_list)
+    render_viewport(todo_list=todo_list)
+
+    assert len(_ROW_CACHE) <= _ROW_CACHE_LIMIT, "The cache grew with the TODO list."
+
+    mock_dumps.reset_mock()
+    changed_item: Item = Item("Changed", "Description", False, id=len(todo_list) - 1)
+    render_viewport(todo_list=todo_list.set(len(todo_list) - 1, changed_item))
+
+    expected_result: int = 1
+    actual_result: int = mock_dumps.call_count
+
+    assert expected_result == actual_result, "The viewport's unchanged rows were serialised again."
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__render_viewport__shows_only_the_items_to_do__success(mock_stdout: StringIO) -> NoReturn:
+
+    render_viewport(todo_list=sample_list(7), start=1, size=2, completed=False)
+
+    expected_result: List[str] = [
+        "TODO - 7 items, 4 completed, 3 to do",
+        "Showing 1 to 2 of the 3 items to do:",
+        '3 (ID 3) = {"title": "Title 3", "description": "Description", "completed": false}',
+        '5 (ID 5) = {"title": "Title 5", "description": "Description", "completed": false}',
+    ]
+
+    actual_result: List[str] = mock_stdout.getvalue().splitlines()
+
+    assert expected_result == actual_result, "Filtered viewport was not as expected."
+
+
+@patch(target="builtins.input", side_effect=["completed", ""])
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__view_items__shows_the_last_page_of_completed_items__success(
+        mock_stdout: StringIO, mock_input: MagicMock
+    ) -> NoReturn:
+
+    false_value: bool = view_items(
+        todo_list=[{"title": "One"}, {"title": "Two", "completed": True}]
+    )
+
+    expected_result: List[str] = [
+        "TODO - 2 items, 1 completed, 1 to do",
+        "Showing 0 to 0 of the 1 completed items:",
+        '1 (ID 1) = {"title": "Two", "description": null, "completed": true}',
+    ]
+    actual_result: List[str] = mock_stdout.getvalue().splitlines()
+
+    assert false_value is False, "Did not return false as expected."
+    assert expected_result == actual_result, "View Items did not show the completed items."
+
+
+@patch(target="builtins.input", side_effect=["pending", ""])
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__view_items__unknown_view__failure(
+        mock_stdout: StringIO, mock_input: MagicMock
+    ) -> NoReturn:
+
+    expected_result: bool = False
+    actual_result: bool = view_items(todo_list=sample_list(3))
+
+    assert expected_result == actual_result, "An unknown view did not return false."
+    assert "That is not an option." in mock_stdout.getvalue(), "The failure was not reported."
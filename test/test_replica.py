@@ -0,0 +1,201 @@
+"""
+Unit tests for replicated TODO lists.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from pathlib import Path
+
+from typing import Dict
+from typing import List
+from typing import NoReturn
+from typing import Tuple
+
+from unittest.mock import patch
+
+from pytest import raises
+
+from src.main import _run
+from src.operations import apply_operation
+from src.operations import records_for
+from src.pvector import PVector
+from src.replica import Replica
+from src.replica import ReplicatedList
+
+
+def step(replica: ReplicatedList, operation: Tuple) -> PVector:
+    after: PVector = apply_operation(replica.todo_list, operation)
+    replica.record(
+        todo_list=after,
+        records=records_for(before=replica.todo_list, after=after, operation=operation)
+    )
+    return after
+
+
+def values(replica: ReplicatedList) -> List[Tuple]:
+    return sorted((item.title, item.description, item.completed) for item in replica.todo_list)
+
+
+def synced_pair() -> Tuple[ReplicatedList, ReplicatedList]:
+    laptop: ReplicatedList = ReplicatedList(replica_id="laptop")
+    shared: ReplicatedList = ReplicatedList(replica_id="shared")
+
+    for number in range(4):
+        step(laptop, ("add", f"Title {number}", "Description"))
+
+    shared.merge(delta=laptop.delta())
+    return laptop, shared
+
+
+def test__replicated_list__concurrent_changes_converge__success() -> NoReturn:
+
+    laptop, shared = synced_pair()
+
+    step(laptop, ("toggle", 0))
+    step(shared, ("edit", 0, "Shared title", "Description"))
+    step(laptop, ("edit", 1, "Laptop title", "Laptop description"))
+    step(shared, ("remove", 1))
+    step(laptop, ("add", "From the laptop", ""))
+
+    laptop_delta: Dict = laptop.delta(since=shared.versions())
+    shared_delta: Dict = shared.delta(since=laptop.versions())
+    laptop.merge(delta=shared_delta)
+    shared.merge(delta=laptop_delta)
+
+    expected_result: List[Tuple] = [
+        ("From the laptop", "", False),
+        ("Shared title", "Description", True),
+        ("Title 2", "Description", False),
+        ("Title 3", "Description", False),
+    ]
+
+    assert expected_result == values(laptop), "Laptop did not end up with the merged items."
+    assert expected_result == values(shared), "Shared replica did not end up with the same items."
+    assert () == shared.merge(delta=laptop_delta), "Merging the same delta twice changed something."
+
+
+def test__replicated_list__delta_only_holds_changed_items__success() -> NoReturn:
+
+    laptop, shared = synced_pair()
+
+    step(laptop, ("toggle", 2))
+    step(laptop, ("toggle", 2))
+    step(laptop, ("remove", 3))
+
+    delta: Dict = laptop.delta(since=shared.versions())
+
+    expected_result: List[List] = [[4, "laptop"], [3, "laptop"]]
+    actual_result: List[List] = sorted(map(lambda row: row["key"], delta["entries"]), reverse=True)
+
+    assert expected_result == actual_result, "Delta did not hold just the changed items."
+    assert 2 == len(shared.merge(delta=delta)), "Merge did not change just those items."
+    assert values(laptop) == values(shared), "Replicas did not converge."
+
+
+def test__replicated_list__merges_priorities_and_due_dates__success(tmp_path: Path) -> NoReturn:
+
+    laptop, shared = synced_pair()
+
+    step(laptop, ("schedule", 0, 2, "2026-11-01"))
+    step(shared, ("schedule", 1, 1, None))
+    step(shared, ("toggle", 0))
+    laptop_delta: Dict = laptop.delta(since=shared.versions())
+    laptop.merge(delta=shared.delta(since=laptop.versions()))
+    shared.merge(delta=laptop_delta)
+
+    expected_result: List[Tuple] = [
+        (0, True, 2, "2026-11-01"), (1, False, 1, None), (2, False, None, None),
+        (3, False, None, None)
+    ]
+
+    assert expected_result == sorted(map(
+        lambda item: (item.id, item.completed, item.priority, item.due), laptop.todo_list
+    )), "Laptop did not end up with the merged schedules."
+    assert laptop.todo_list == shared.todo_list, "Replicas did not converge."
+
+    with Replica(path=str(tmp_path / "todo.replica")) as replica:
+        todo_list: PVector = replica.load()
+        todo_list = replica.step(todo_list=todo_list, operation=("add", "One", ""))
+        todo_list = replica.step(todo_list=todo_list, operation=("schedule", 0, 4, "2027-01-01"))
+
+    with Replica(path=str(tmp_path / "todo.replica")) as replica:
+        assert todo_list == replica.load(), "Schedule was not kept by the replica file."
+
+
+def test__replicated_list__rejects_bulk_records__failure() -> NoReturn:
+
+    with raises(ValueError):
+        ReplicatedList().record(todo_list=PVector(), records=[("toggle", 0)])
+
+
+def test__replica__reload_keeps_ids_through_compaction__success(tmp_path: Path) -> NoReturn:
+
+    with Replica(path=str(tmp_path / "todo.replica"), compact_every=3) as replica:
+        todo_list: PVector = replica.load()
+
+        for operation in (("add", "One", ""), ("add", "Two", ""), ("remove", 0), ("toggle", 1)):
+            todo_list = replica.step(todo_list=todo_list, operation=operation)
+
+        replica_id: str = replica.replicated.replica_id
+
+    with Replica(path=str(tmp_path / "todo.replica")) as replica:
+        reloaded: PVector = replica.load()
+
+        assert replica_id == replica.replicated.replica_id, "Replica ID was not kept."
+
+    assert todo_list == reloaded, "Reloaded TODO list was not as expected."
+    assert [1] == [item.id for item in reloaded], "Item IDs were not kept."
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+def test___run__sync_export_and_merge_between_replicas__success(
+        mock_stdout: StringIO, tmp_path: Path
+    ) -> NoReturn:
+
+    (tmp_path / "laptop.txt").write_text('add "Buy milk" ""\nadd "Buy bread" ""\n')
+    (tmp_path / "shared.txt").write_text("toggle 1\n")
+
+    laptop: List[str] = ["--file", str(tmp_path / "laptop.replica")]
+    shared: List[str] = ["--file", str(tmp_path / "shared.replica")]
+
+    _run(arguments=[*laptop, "--batch", str(tmp_path / "laptop.txt")])
+    _run(arguments=[*laptop, "--sync-export", str(tmp_path / "laptop.delta")])
+    _run(arguments=[*shared, "--sync-merge", str(tmp_path / "laptop.delta")])
+    _run(arguments=[*shared, "--batch", str(tmp_path / "shared.txt")])
+    _run(arguments=[
+        *shared, "--sync-export", str(tmp_path / "shared.delta"),
+        "--since", str(tmp_path / "laptop.delta")
+    ])
+    _run(arguments=[*laptop, "--sync-merge", str(tmp_path / "shared.delta")])
+
+    with Replica(path=str(tmp_path / "laptop.replica")) as replica:
+        actual_result: List = list(replica.load())
+
+    expected_result: List = [
+        {"title": "Buy milk", "description": "", "completed": False},
+        {"title": "Buy bread", "description": "", "completed": True},
+    ]
+
+    assert expected_result == actual_result, "Laptop did not get the shared replica's change."
+    assert "Exported 1 items to" in mock_stdout.getvalue(), "Only the change was not exported."
+
+
+def test___run__sync_needs_a_replica__failure(tmp_path: Path) -> NoReturn:
+
+    with raises(SystemExit):
+        _run(arguments=["--file", str(tmp_path / "todo.json"), "--sync-merge", "delta.json"])
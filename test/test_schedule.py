@@ -0,0 +1,298 @@
+"""
+Unit tests for scheduling TODO list items.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from pathlib import Path
+
+from sqlite3 import connect
+
+from typing import List
+from typing import NoReturn
+from typing import Tuple
+
+from types import NoneType
+
+from unittest.mock import MagicMock, patch
+
+from pytest import mark
+from pytest import raises
+
+from src.item import Item
+from src.main import next_up
+from src.main import overdue_items
+from src.main import schedule_item
+from src.operations import apply_operations
+from src.operations import changes
+from src.operations import run_batch
+from src.pvector import PVector
+from src.schedule import ScheduleIndex
+from src.schedule import parse_due
+from src.schedule import parse_priority
+from src.store import SqliteStore
+
+
+SAMPLE_LIST: PVector[Item] = PVector((
+    Item("Low", "", False, 0, priority=3),
+    Item("Done", "", True, 1, priority=1),
+    Item("Urgent", "", False, 2, priority=1, due="2026-10-20"),
+    Item("Late", "", False, 3, due="2026-10-01"),
+    Item("Plain", "", False, 4),
+    Item("Later", "", False, 5, priority=1, due="2026-12-01"),
+))
+
+
+@mark.parametrize("text, priority", (("", None), (" ", None), ("1", 1), ("12", 12)))
+def test__parse_priority__reads_a_priority_or_nothing__success(
+        text: str, priority: (int | NoneType)
+    ) -> NoReturn:
+
+    expected_result: (int | NoneType) = priority
+    actual_result: (int | NoneType) = parse_priority(text=text)
+
+    assert expected_result == actual_result, "Priority was not read as expected."
+
+
+@mark.parametrize("text", ("0", "-1", "high", "1.5"))
+def test__parse_priority__bad_priority__raises_value_error(text: str) -> NoReturn:
+
+    with raises(ValueError):
+        parse_priority(text=text)
+
+
+@mark.parametrize("text, due", (
+    ("", None), ("2026-11-01", "2026-11-01"), (" 2026-01-31 ", "2026-01-31")
+))
+def test__parse_due__reads_a_date_or_nothing__success(
+        text: str, due: (str | NoneType)
+    ) -> NoReturn:
+
+    expected_result: (str | NoneType) = due
+    actual_result: (str | NoneType) = parse_due(text=text)
+
+    assert expected_result == actual_result, "Due date was not read as expected."
+
+
+@mark.parametrize("text", ("tomorrow", "2026-02-30", "01/11/2026"))
+def test__parse_due__bad_date__raises_value_error(text: str) -> NoReturn:
+
+    with raises(ValueError):
+        parse_due(text=text)
+
+
+def test__schedule_index__orders_incomplete_scheduled_items__success() -> NoReturn:
+
+    index: ScheduleIndex = ScheduleIndex(todo_list=SAMPLE_LIST)
+
+    expected_result: Tuple[Tuple[int, ...], Tuple[int, ...]] = ((2, 5, 0, 3), (3, 2))
+    actual_result: Tuple[Tuple[int, ...], Tuple[int, ...]] = (
+        index.next_up(count=10), index.overdue(today="2026-11-01", count=10)
+    )
+
+    assert expected_result == actual_result, "Items were not in order."
+
+
+def test__schedule_index__skips_entries_left_behind_by_changes__success() -> NoReturn:
+
+    index: ScheduleIndex = ScheduleIndex(todo_list=SAMPLE_LIST)
+    index.next_up(count=1)
+    after: PVector[Item] = apply_operations(todo_list=SAMPLE_LIST, operations=[
+        ("schedule", 0, 1, "2026-10-02"),
+        ("toggle", 2),
+        ("remove", 3),
+        ("schedule", 5, None, None),
+    ])
+    index.apply(records=changes(before=SAMPLE_LIST, after=after))
+
+    expected_result: Tuple[Tuple[int, ...], Tuple[int, ...]] = ((0,), (0,))
+    actual_result: Tuple[Tuple[int, ...], Tuple[int, ...]] = (
+        index.next_up(count=10), index.overdue(today="2026-11-01", count=10)
+    )
+
+    assert expected_result == actual_result, "Left behind entries were not skipped."
+
+
+def test__schedule_index__rebuilds_heaps_full_of_left_behind_entries__success() -> NoReturn:
+
+    index: ScheduleIndex = ScheduleIndex()
+    index.apply(records=[("append", "Title", "", False, 0, 1, "2026-01-01")])
+    any(map(
+        lambda day: index.apply(records=[
+            ("replace", 0, "Title", "", False, 1, f"2026-01-{day % 28 + 1:02}")
+        ]),
+        range(1000)
+    ))
+
+    expected_result: Tuple[int, ...] = (0,)
+    actual_result: Tuple[int, ...] = index.overdue(today="2027-01-01", count=10)
+
+    assert expected_result == actual_result, "Item was not found once."
+    assert len(index._by_due) <= 2 * len(index._due_ranks) + 64, "Heap was not rebuilt."
+
+
+def test__schedule_index__indexes_once_more_changes_wait_than_items__success() -> NoReturn:
+
+    index: ScheduleIndex = ScheduleIndex(todo_list=SAMPLE_LIST)
+    any(map(
+        lambda priority: index.apply(records=[("replace", 4, "Plain", "", False, priority, None)]),
+        range(1, 11)
+    ))
+
+    expected_result: Tuple[int, ...] = (2, 5, 0, 4, 3)
+    actual_result: Tuple[int, ...] = index.next_up(count=10)
+
+    assert len(index._pending) <= len(SAMPLE_LIST), "Changes outgrew the TODO list."
+    assert expected_result == actual_result, "Index did not follow the changes."
+
+
+def test__schedule_index__overdue_stops_before_today__success() -> NoReturn:
+
+    index: ScheduleIndex = ScheduleIndex(todo_list=SAMPLE_LIST)
+
+    expected_result: Tuple[Tuple[int, ...], ...] = ((), (3,), (3, 2), (3,))
+    actual_result: Tuple[Tuple[int, ...], ...] = (
+        index.overdue(today="2026-10-01", count=10),
+        index.overdue(today="2026-10-20", count=10),
+        index.overdue(today="2026-10-21", count=10),
+        index.overdue(today="2027-01-01", count=1),
+    )
+
+    assert expected_result == actual_result, "Overdue items were not cut off at today."
+
+
+def test__run_batch__schedule_sets_and_clears_the_schedule__success() -> NoReturn:
+
+    todo_list: PVector[Item] = run_batch(lines=[
+        'add "First" ""',
+        'add "Second" ""',
+        "schedule 0 2 2026-11-01",
+        "schedule 1 1 2026-12-01",
+        'schedule 1 "" ""',
+        'edit 0 "Renamed" ""',
+    ])
+
+    expected_result: List[Tuple] = [("Renamed", 2, "2026-11-01"), ("Second", None, None)]
+    actual_result: List[Tuple] = [(item.title, item.priority, item.due) for item in todo_list]
+
+    assert expected_result == actual_result, "Schedules were not as expected."
+
+
+def test__run_batch__schedule_bad_date__raises_value_error() -> NoReturn:
+
+    with raises(ValueError):
+        run_batch(lines=['add "First" ""', "schedule 0 1 soon"])
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__next_up__prints_the_items_to_do_first__success(mock_stdout: StringIO) -> NoReturn:
+
+    next_up(todo_list=SAMPLE_LIST, schedule_index=ScheduleIndex(todo_list=SAMPLE_LIST))
+
+    expected_result: List[str] = [
+        "Next up, 4 items:", "2 (ID 2)", "5 (ID 5)", "0 (ID 0)", "3 (ID 3)"
+    ]
+    actual_result: List[str] = list(map(
+        lambda line: line.partition(" =")[0], mock_stdout.getvalue().splitlines()
+    ))
+
+    assert expected_result == actual_result, "Next up items were not printed in order."
+
+
+@patch(target="src.main.date")
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__overdue_items__prints_the_items_due_before_today__success(
+        mock_stdout: StringIO, mock_date: MagicMock
+    ) -> NoReturn:
+
+    mock_date.today.return_value.isoformat.return_value = "2026-11-01"
+
+    overdue_items(todo_list=SAMPLE_LIST, schedule_index=ScheduleIndex(todo_list=SAMPLE_LIST))
+
+    expected_result: List[str] = ["2 items are overdue:", "3 (ID 3)", "2 (ID 2)"]
+    actual_result: List[str] = list(map(
+        lambda line: line.partition(" =")[0], mock_stdout.getvalue().splitlines()
+    ))
+
+    assert expected_result == actual_result, "Overdue items were not printed in order."
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__overdue_items__nothing_overdue__success(mock_stdout: StringIO) -> NoReturn:
+
+    overdue_items(todo_list=SAMPLE_LIST, schedule_index=ScheduleIndex())
+
+    expected_result: str = "Nothing is overdue.\n"
+    actual_result: str = mock_stdout.getvalue()
+
+    assert expected_result == actual_result, "An empty view was not reported."
+
+
+@patch(target="builtins.input", side_effect=["4", "0", "2", "someday", "2026-11-05"])
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__schedule_item__asks_again_for_a_bad_answer__success(
+        mock_stdout: StringIO, mock_input: MagicMock
+    ) -> NoReturn:
+
+    todo_list: PVector[Item] = schedule_item(todo_list=SAMPLE_LIST)
+
+    expected_result: Item = Item("Plain", "", False, 4, priority=2, due="2026-11-05")
+    actual_result: Item = todo_list[4]
+
+    assert expected_result == actual_result, "Item was not scheduled."
+    assert 5 == mock_input.call_count, "Bad answers were not asked again."
+    assert [*SAMPLE_LIST[:4], *SAMPLE_LIST[5:]] == [*todo_list[:4], *todo_list[5:]], (
+        "Other items were changed."
+    )
+
+
+@patch(target="builtins.input", side_effect=["9"])
+def test__schedule_item__unknown_item__failure(mock_input: MagicMock) -> NoReturn:
+
+    expected_result: PVector[Item] = SAMPLE_LIST
+    actual_result: PVector[Item] = schedule_item(todo_list=SAMPLE_LIST)
+
+    assert expected_result is actual_result, "TODO list was changed."
+
+
+def test__sqlite_store__adds_the_schedule_columns_to_an_old_database__success(
+        tmp_path: Path
+    ) -> NoReturn:
+
+    database = connect(str(tmp_path / "todo.db"))
+    database.execute(
+        "CREATE TABLE items ("
+        + "id INTEGER PRIMARY KEY, title TEXT, description TEXT, completed INTEGER NOT NULL)"
+    )
+    database.execute("INSERT INTO items VALUES (0, 'Old', 'Item', 0)")
+    database.commit()
+    database.close()
+
+    with SqliteStore(path=str(tmp_path / "todo.db")) as store:
+        before: PVector[Item] = store.load()
+        after: PVector[Item] = apply_operations(
+            todo_list=before, operations=[("schedule", 0, 1, "2026-11-01")]
+        )
+        store.record(todo_list=after, operations=changes(before=before, after=after))
+
+    with SqliteStore(path=str(tmp_path / "todo.db")) as store:
+        expected_result: List[Item] = [Item("Old", "Item", False, 0, priority=1, due="2026-11-01")]
+        actual_result: List[Item] = list(store.load())
+
+    assert [Item("Old", "Item", False, 0)] == list(before), "Old rows were not read."
+    assert expected_result == actual_result, "Schedule was not kept in the added columns."
@@ -0,0 +1,105 @@
+"""
+Unit tests for the search index.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from typing import NoReturn
+from typing import Tuple
+
+from unittest.mock import MagicMock, patch
+
+from pytest import mark
+
+from src.main import main as main_function
+from src.operations import apply_operations
+from src.operations import changes
+from src.pvector import PVector
+from src.search import SearchIndex
+
+
+SAMPLE_LIST: PVector = apply_operations(todo_list=[], operations=[
+    ("add", "Buy milk", "Two litres, semi-skimmed"),
+    ("add", "Buy bread", "Wholemeal"),
+    ("add", "Walk the dog", "Around the park"),
+])
+
+
+@mark.parametrize("query, item_ids", (
+    ("buy", (0, 1)),
+    ("BUY MIL", (0,)),
+    ("wh", (1,)),
+    ("the", (2,)),
+    ("buy dog", ()),
+    ("", ()),
+))
+def test__search_index__finds_items_by_word_prefixes__success(
+        query: str, item_ids: Tuple[int, ...]
+    ) -> NoReturn:
+
+    expected_result: Tuple[int, ...] = item_ids
+    actual_result: Tuple[int, ...] = SearchIndex(todo_list=SAMPLE_LIST).search(query=query)
+
+    assert expected_result == actual_result, "Search results were not as expected."
+
+
+def test__search_index__follows_changes_to_the_list__success() -> NoReturn:
+
+    search_index: SearchIndex = SearchIndex(todo_list=SAMPLE_LIST)
+    after: PVector = apply_operations(todo_list=SAMPLE_LIST, operations=[
+        ("remove", 0), ("edit", 1, "Buy rolls", "White"), ("add", "Buy eggs", "A dozen")
+    ])
+
+    search_index.apply(records=changes(before=SAMPLE_LIST, after=after))
+
+    expected_result: Tuple[int, ...] = (1, 3)
+    actual_result: Tuple[int, ...] = search_index.search(query="buy")
+
+    assert expected_result == actual_result, "Index did not follow the changes."
+    assert () == search_index.search(query="wholemeal"), "Old words were left in the index."
+    assert () == search_index.words_starting_with(prefix="mil"), "Unused words were kept."
+
+
+def test__search_index__indexes_once_more_changes_wait_than_items__success() -> NoReturn:
+
+    search_index: SearchIndex = SearchIndex(todo_list=SAMPLE_LIST)
+    todo_list: PVector = SAMPLE_LIST
+
+    for _ in range(10):
+        after: PVector = apply_operations(todo_list=todo_list, operations=[("toggle", 2)])
+        search_index.apply(records=changes(before=todo_list, after=after))
+        todo_list = after
+
+    expected_result: Tuple[int, ...] = (2,)
+    actual_result: Tuple[int, ...] = search_index.search(query="dog")
+
+    assert len(search_index._pending) <= len(SAMPLE_LIST), "Changes outgrew the TODO list."
+    assert expected_result == actual_result, "Index did not follow the changes."
+
+
+@patch(target="builtins.input", side_effect=[
+    "0", "Buy milk", "Semi-skimmed", "", "", "15", "mil", "3"
+])
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__main__searches_items_added_in_the_session__success(
+        mock_stdout: StringIO, mock_input: MagicMock
+    ) -> NoReturn:
+
+    main_function(start=True, todo_list=[])
+
+    assert "Found 1 items:" in mock_stdout.getvalue(), "Added item was not found."
@@ -0,0 +1,176 @@
+"""
+Unit tests for the shared TODO list server.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from asyncio import AbstractServer
+from asyncio import gather
+from asyncio import open_connection
+from asyncio import run
+
+from json import loads
+
+from pathlib import Path
+
+from typing import Dict
+from typing import List
+from typing import NoReturn
+
+from pytest import mark
+
+from src.journal import Journal
+from src.server import TodoClient
+from src.server import TodoServer
+
+
+async def _session(server: TodoServer, clients: int, requests: int) -> List[Dict]:
+    """
+    Have several clients each send requests to the server at once, then list the TODO list.
+    """
+
+    listening: AbstractServer = await server.start(address="127.0.0.1:0")
+    address: str = "127.0.0.1:{}".format(listening.sockets[0].getsockname()[1])
+
+    async def client(number: int) -> NoReturn:
+        this_client: TodoClient = await TodoClient.connect(address=address)
+
+        for request in range(requests):
+            await this_client.request(line=f'add "Client {number}" "Request {request}"')
+
+        await this_client.close()
+
+    async with listening:
+        await gather(*map(client, range(clients)))
+
+        reader: TodoClient = await TodoClient.connect(address=address)
+        listed: Dict = await reader.request(line="list")
+        await reader.close()
+
+    return listed["items"]
+
+
+def test__todo_server__applies_every_concurrent_request__success() -> NoReturn:
+
+    items: List[Dict] = run(_session(server=TodoServer(), clients=20, requests=25))
+
+    expected_result: List[int] = list(range(500))
+    actual_result: List[int] = [item["id"] for item in items]
+
+    assert expected_result == actual_result, "Requests were lost or given clashing IDs."
+    assert all(map(
+        lambda number: [f"Request {request}" for request in range(25)] == [
+            item["description"] for item in items if item["title"] == f"Client {number}"
+        ],
+        range(20)
+    )), "A client's requests were not applied in the order it sent them."
+
+
+async def _raw_session(server: TodoServer, lines: List[bytes]) -> List[Dict]:
+    """
+    Send the server raw lines, as bytes, and read a response to each.
+    """
+
+    listening: AbstractServer = await server.start(address="127.0.0.1:0")
+
+    async with listening:
+        reader, writer = await open_connection(
+            host="127.0.0.1", port=listening.sockets[0].getsockname()[1]
+        )
+        writer.write(b"".join(lines))
+        await writer.drain()
+        responses: List[Dict] = [loads(await reader.readline()) for _ in lines]
+        writer.close()
+
+    return responses
+
+
+def test__todo_server__answers_unreadable_requests__failure() -> NoReturn:
+
+    responses: List[Dict] = run(_raw_session(
+        server=TodoServer(),
+        lines=[b'add "Caf\xe9" "Bad"\n', b"x" * 100000 + b"\n", b'add "Fine" "Good"\n']
+    ))
+
+    expected_result: List[bool] = [False, False, True]
+    actual_result: List[bool] = [response["ok"] for response in responses]
+
+    assert expected_result == actual_result, "Unreadable requests were not answered with errors."
+    assert all(map(
+        lambda response: response["error"].startswith("Unreadable request: "), responses[:2]
+    )), "The errors did not say the request was unreadable."
+    assert 1 == responses[2]["version"], "The client could not carry on after a bad request."
+
+
+@mark.parametrize("requests, expected_response", (
+    (
+        ['add "Buy milk" "Semi-skimmed"'],
+        {"ok": True, "version": 1, "changes": [["append", "Buy milk", "Semi-skimmed", False, 0]]}
+    ),
+    (
+        ['add "Buy milk" "Semi-skimmed"', "toggle 0"],
+        {"ok": True, "version": 2, "changes": [["replace", 0, "Buy milk", "Semi-skimmed", True]]}
+    ),
+    (
+        ['add "Buy milk" "Semi-skimmed"', "toggle 5"],
+        {"ok": True, "version": 1, "changes": []}
+    ),
+    (
+        ['add "Buy milk" "Semi-skimmed"', "get 0"],
+        {
+            "ok": True,
+            "version": 1,
+            "item": {
+                "title": "Buy milk", "description": "Semi-skimmed", "completed": False, "id": 0
+            }
+        }
+    ),
+    (
+        ['add "Buy milk" "Semi-skimmed"', 'add "Walk the dog" "Park"', "search bu"],
+        {"ok": True, "version": 2, "ids": [0]}
+    ),
+    (
+        ["fly 0"],
+        {"ok": False, "error": "Unknown operation 'fly' in line 'fly 0'."}
+    ),
+    (
+        ["get"],
+        {"ok": False, "error": "Request 'get' takes 1 argument, the item's ID, got 0."}
+    ),
+))
+def test__todo_server__handle__responses__success(
+        requests: List[str], expected_response: Dict
+    ) -> NoReturn:
+
+    server: TodoServer = TodoServer()
+
+    expected_result: Dict = expected_response
+    actual_result: Dict = [server.handle(line=line) for line in requests][-1]
+
+    assert expected_result == actual_result, "Response was not as expected."
+
+
+def test__todo_server__journals_changes__success(tmp_path: Path) -> NoReturn:
+
+    with Journal(path=str(tmp_path / "todo.json")) as journal:
+        run(_session(
+            server=TodoServer(todo_list=journal.load(), journal=journal), clients=3, requests=4
+        ))
+
+    expected_result: int = 12
+    actual_result: int = len(Journal(path=str(tmp_path / "todo.json")).load())
+
+    assert expected_result == actual_result, "Served changes were not journalled."
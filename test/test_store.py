@@ -0,0 +1,198 @@
+"""
+Unit tests for the SQLite storage backend.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from itertools import islice
+
+from pathlib import Path
+
+from sqlite3 import connect
+
+from typing import List
+from typing import NoReturn
+from typing import Tuple
+
+from unittest.mock import patch
+
+from pytest import mark
+from pytest import raises
+
+from src.main import _run
+from src.operations import apply_operations
+from src.operations import changes
+from src.operations import records_for
+from src.pvector import PVector
+from src.store import SqliteStore
+from src.store import _as_item
+
+
+OPERATIONS: List[Tuple] = [
+    ("add", "Buy milk", "Semi-skimmed"),
+    ("add", "Buy bread", "Wholemeal"),
+    ("add", "Walk the dog", "Park"),
+    ("toggle", 1),
+    ("edit", 0, "Buy oat milk", "One litre"),
+    ("remove", 2),
+    ("append", "Post letter", None, True),
+    ("replace", 1, "Buy rye bread", "Sliced", False),
+    ("remove", 9),
+]
+
+
+@mark.parametrize("operation", OPERATIONS)
+def test__records_for__matches_changes__success(operation: Tuple) -> NoReturn:
+
+    before: PVector = apply_operations(todo_list=[], operations=OPERATIONS[:3])
+    after: PVector = apply_operations(todo_list=before, operations=[operation])
+
+    expected_result: Tuple[Tuple, ...] = changes(before=before, after=after)
+    actual_result: Tuple[Tuple, ...] = records_for(before=before, after=after, operation=operation)
+
+    assert expected_result == actual_result, "Records did not match the changes made."
+
+
+def test__sqlite_store__step_and_record_reload__success(tmp_path: Path) -> NoReturn:
+
+    with SqliteStore(path=str(tmp_path / "todo.db"), commit_every=2) as store:
+        stepped: PVector = apply_operations(
+            todo_list=store.load(), operations=OPERATIONS, step=store.step
+        )
+        expected_result: PVector = apply_operations(
+            todo_list=stepped, operations=[("toggle", 0), ("add", "Last", "Item")]
+        )
+        store.record(todo_list=expected_result, operations=changes(stepped, expected_result))
+
+    with SqliteStore(path=str(tmp_path / "todo.db"), page_size=2) as store:
+        actual_result: PVector = store.load()
+
+    assert expected_result == actual_result, "Reloaded TODO list was not as expected."
+    assert [item.id for item in expected_result] == [item.id for item in actual_result], (
+        "Item IDs were not kept."
+    )
+
+
+def test__sqlite_store__uses_wal_and_indexes__success(tmp_path: Path) -> NoReturn:
+
+    with SqliteStore(path=str(tmp_path / "todo.db")) as store:
+        apply_operations(todo_list=store.load(), operations=OPERATIONS, step=store.step)
+        completed: int = store.count_completed()
+        titles: List[str] = [item.title for item in store.titles_starting_with(prefix="Buy")]
+
+    database = connect(str(tmp_path / "todo.db"))
+    plans: List[str] = [
+        database.execute(f"EXPLAIN QUERY PLAN {query}", parameters).fetchone()[-1]
+        for query, parameters in (
+            ("SELECT COUNT(*) FROM items WHERE completed = ?", (True,)),
+            ("SELECT COUNT(*) FROM items WHERE completed = 1 AND id BETWEEN ? AND ?", (0, 5)),
+            ("SELECT id FROM items WHERE title >= ? ORDER BY title, id", ("Buy",)),
+        )
+    ]
+    journal_mode: str = database.execute("PRAGMA journal_mode").fetchone()[0]
+    database.close()
+
+    assert ("wal", 1, ["Buy oat milk", "Buy rye bread"]) == (journal_mode, completed, titles), (
+        "Store did not answer from the database as expected."
+    )
+    assert all(map(lambda plan: "USING" in plan and "INDEX" in plan, plans)), (
+        f"Queries did not use the indexes: {plans}"
+    )
+
+
+def test__sqlite_store__rejects_bad_records_without_writing__failure(tmp_path: Path) -> NoReturn:
+
+    with SqliteStore(path=str(tmp_path / "todo.db")) as store:
+        todo_list: PVector = store.load()
+
+        with raises(ValueError):
+            store.record(todo_list=todo_list, operations=[
+                ("append", "Title", "Description", False, 0), ("toggle", 0)
+            ])
+
+        assert [] == list(store.items()), "Part of a rejected write was stored."
+
+
+def test__sqlite_store__load_reads_only_the_rows_reached__success(tmp_path: Path) -> NoReturn:
+
+    with SqliteStore(path=str(tmp_path / "todo.db"), commit_every=10000) as store:
+        apply_operations(todo_list=store.load(), operations=map(
+            lambda number: ("append", f"Title {number}", "", number % 3 == 0), range(5000)
+        ), step=store.step)
+
+    with patch(target="src.store._as_item", wraps=_as_item) as mock_as_item, SqliteStore(
+        path=str(tmp_path / "todo.db"), page_size=10
+    ) as store:
+        todo_list: PVector = store.load()
+        counts: Tuple[int, int] = (len(todo_list), todo_list.count_completed())
+        last_page: List[int] = [item.id for item in todo_list.iterate_from(len(todo_list) - 5)]
+        completed: List[int] = [
+            item.id for _, item in islice(todo_list.iterate_completed(start=100), 3)
+        ]
+
+    assert (5000, 1667) == counts, "Items were not counted."
+    assert [4995, 4996, 4997, 4998, 4999] == last_page, "The last page was not read."
+    assert [300, 303, 306] == completed, "Completed items were not found."
+    assert mock_as_item.call_count <= 40, "More rows were read than were reached."
+
+
+def test__sqlite_store__earlier_versions_keep_rows_changed_since__success(
+        tmp_path: Path
+    ) -> NoReturn:
+
+    with SqliteStore(path=str(tmp_path / "todo.db")) as store:
+        apply_operations(todo_list=store.load(), operations=OPERATIONS[:3], step=store.step)
+
+    with SqliteStore(path=str(tmp_path / "todo.db")) as store:
+        loaded: PVector = store.load()
+        changed: PVector = apply_operations(
+            todo_list=loaded, operations=[("toggle", 1), ("remove", 2)], step=store.step
+        )
+
+    expected_result: List[Tuple] = [
+        ("Buy milk", False), ("Buy bread", False), ("Walk the dog", False)
+    ]
+    actual_result: List[Tuple] = [(item.title, item.completed) for item in loaded]
+
+    assert expected_result == actual_result, "The loaded version changed with the database."
+    assert (3, 0) == (len(loaded), loaded.count_completed()), "Loaded counts changed."
+    assert [("Buy milk", False), ("Buy bread", True)] == [
+        (item.title, item.completed) for item in changed
+    ], "The changed version was not as expected."
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+def test___run__sqlite_file_keeps_the_list_between_runs__success(
+        mock_stdout: StringIO, tmp_path: Path
+    ) -> NoReturn:
+
+    (tmp_path / "first.txt").write_text('add "Sample Title" "Sample Description"\n')
+    (tmp_path / "second.txt").write_text("toggle 0\n")
+
+    _run(arguments=["--file", str(tmp_path / "todo.db"), "--batch", str(tmp_path / "first.txt")])
+    _run(arguments=["--file", str(tmp_path / "todo.db"), "--batch", str(tmp_path / "second.txt")])
+
+    expected_result: List = [
+        {"title": "Sample Title", "description": "Sample Description", "completed": True}
+    ]
+
+    with SqliteStore(path=str(tmp_path / "todo.db")) as store:
+        actual_result: PVector = store.load()
+
+    assert expected_result == actual_result, "TODO list was not kept between runs."
+    assert not (tmp_path / "todo.db.journal").exists(), "A journal was used instead of SQLite."
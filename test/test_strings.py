@@ -0,0 +1,86 @@
+"""
+Unit tests for shared and compressed strings.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from typing import NoReturn
+
+from unittest.mock import patch
+
+from src.item import Item
+from src.main import stats
+from src.strings import CompressedText
+from src.strings import StringStore
+from src.strings import text_of
+
+
+LONG_DESCRIPTION: str = "Take the bins out, then wash them and put them back. " * 20
+
+
+def test__string_store__shares_equal_strings__success() -> NoReturn:
+
+    strings: StringStore = StringStore()
+    first: str = "".join(["Water ", "the plants"])
+    second: str = "".join(["Water ", "the plants"])
+
+    assert strings.share(first) is strings.share(second), "Equal strings were not shared."
+    assert 1 == strings.shared, "The duplicate was not counted."
+    assert strings.shared_bytes > 0, "The bytes saved were not counted."
+
+
+def test__string_store__compresses_long_strings_once__success() -> NoReturn:
+
+    strings: StringStore = StringStore(compress_over=100)
+
+    kept: CompressedText = strings.store(LONG_DESCRIPTION)
+
+    assert isinstance(kept, CompressedText), "Long string was not compressed."
+    assert kept is strings.store("".join(LONG_DESCRIPTION)), "Equal long strings were not shared."
+    assert LONG_DESCRIPTION == text_of(kept), "Decompressed text was not the same."
+    assert (1, 1) == (strings.compressed, strings.shared), "Compression was not counted."
+    assert strings.compressed_bytes > len(LONG_DESCRIPTION) // 2, "Savings were not counted."
+
+
+def test__string_store__keeps_incompressible_text__success() -> NoReturn:
+
+    text: str = "".join(["Bins ", "out"])
+
+    assert text is StringStore(compress_over=5).store(text), "Text was not kept as it was."
+
+
+def test__item__decompresses_only_when_read__success() -> NoReturn:
+
+    item: Item = Item("Bins", LONG_DESCRIPTION, False, 3)
+    toggled: Item = item.replace(completed=True)
+
+    assert isinstance(item._description, CompressedText), "Description was not compressed."
+    assert item._description is toggled._description, "Replacing decompressed the description."
+    assert LONG_DESCRIPTION == toggled.description, "Description was not read back."
+    assert {"title": "Bins", "description": LONG_DESCRIPTION, "completed": True} == toggled, (
+        "Item did not compare equal to the same values."
+    )
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__stats__reports_bytes_saved__success(mock_stdout: StringIO) -> NoReturn:
+
+    stats()
+
+    assert "Strings:" in mock_stdout.getvalue(), "Savings were not reported."
+    assert "Instrumentation is off" in mock_stdout.getvalue(), "Instrumentation line was lost."
@@ -0,0 +1,61 @@
+"""
+Unit tests for recording sessions of the menu.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from pathlib import Path
+
+from typing import List
+from typing import NoReturn
+
+from unittest.mock import patch
+
+from src.main import _run
+from src.trace import TraceRecorder
+from src.trace import end_pass
+from src.trace import read_trace
+from src.trace import recorded
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+@patch(target="builtins.input", side_effect=["0", "Buy milk", "", "", "", "1", "0", "42", "3"])
+def test___run__records_each_pass_of_the_menu__success(
+        _: StringIO, __: StringIO, tmp_path: Path
+    ) -> NoReturn:
+
+    _run(arguments=["--record-trace", str(tmp_path / "session.jsonl")])
+
+    expected_result: List[List[str]] = [["0", "Buy milk", "", "", ""], ["1", "0"], ["42"], ["3"]]
+
+    with open(tmp_path / "session.jsonl", encoding="utf-8") as trace_file:
+        actual_result: List[List[str]] = list(read_trace(trace_file))
+
+    assert expected_result == actual_result, "Trace did not hold each pass's answers."
+
+
+def test__recorded__does_nothing_without_a_recorder__success(tmp_path: Path) -> NoReturn:
+
+    recorder: TraceRecorder = TraceRecorder()
+
+    with recorder.activate(path=str(tmp_path / "session.jsonl")):
+        recorded("kept")
+
+    assert "dropped" == end_pass(recorded("dropped")), "Answer was not handed back."
+    assert [] == recorder.answers, "Answers were kept after the recorder was done."
+    assert '["kept"]\n' == (tmp_path / "session.jsonl").read_text(), "Last pass was not written."
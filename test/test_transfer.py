@@ -0,0 +1,194 @@
+"""
+Unit tests for importing and exporting TODO lists.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from pathlib import Path
+
+from typing import List
+from typing import NoReturn
+
+from unittest.mock import MagicMock, patch
+
+from pytest import mark
+from pytest import raises
+
+from src.item import Item
+from src.main import export_items
+from src.main import import_items
+from src.pvector import PVector
+from src.transfer import export_csv
+from src.transfer import export_jsonl
+from src.transfer import export_to
+from src.transfer import extend_from
+from src.transfer import import_from
+
+
+SAMPLE_LIST: PVector = PVector([
+    Item("Buy milk", "Two litres, semi-skimmed", False, 0),
+    Item('Say "hi"', None, True, 4),
+])
+
+
+def test__export_jsonl__one_line_per_item__success() -> NoReturn:
+
+    expected_result: List[str] = [
+        '{"title": "Buy milk", "description": "Two litres, semi-skimmed", "completed": false,'
+        + ' "id": 0}\n',
+        '{"title": "Say \\"hi\\"", "description": null, "completed": true, "id": 4}\n'
+    ]
+    actual_result: List[str] = list(export_jsonl(todo_list=SAMPLE_LIST))
+
+    assert expected_result == actual_result, "JSON Lines export was not as expected."
+
+
+def test__export_csv__quotes_fields__success() -> NoReturn:
+
+    expected_result: List[str] = [
+        "title,description,completed,id,priority,due\n",
+        'Buy milk,"Two litres, semi-skimmed",false,0,,\n',
+        '"Say ""hi""",,true,4,,\n'
+    ]
+    actual_result: List[str] = list(export_csv(todo_list=SAMPLE_LIST))
+
+    assert expected_result == actual_result, "CSV export was not as expected."
+
+
+@mark.parametrize("file_name", ("todo.jsonl", "todo.csv"))
+def test__export_to__import_from__round_trip_with_new_ids__success(
+        file_name: str, tmp_path: Path
+    ) -> NoReturn:
+
+    export_to(todo_list=SAMPLE_LIST, path=str(tmp_path / file_name))
+
+    existing: PVector = PVector([Item("Walk the dog", "Park", False, 7)])
+    imported: PVector = import_from(todo_list=existing, path=str(tmp_path / file_name))
+
+    expected_result: List = [
+        ("Walk the dog", "Park", False, 7),
+        ("Buy milk", "Two litres, semi-skimmed", False, 8),
+        ('Say "hi"', None if file_name.endswith("jsonl") else "", True, 9)
+    ]
+    actual_result: List = [
+        (item.title, item.description, item.completed, item.id) for item in imported
+    ]
+
+    assert expected_result == actual_result, "Items did not survive the round trip."
+
+
+@mark.parametrize("priority", (1, 3, "2", "", None))
+def test__extend_from__keeps_valid_priority__success(priority: object) -> NoReturn:
+
+    expected_result: object = None if priority in ("", None) else int(priority)
+    actual_result: object = extend_from(
+        todo_list=PVector(), values=[(1, {"title": "Title", "priority": priority})]
+    )[0].priority
+
+    assert expected_result == actual_result, "A valid priority was not kept."
+
+
+def test__extend_from__rejects_bad_completed_value__failure() -> NoReturn:
+
+    with raises(ValueError):
+        extend_from(todo_list=PVector(), values=[(1, {"title": "Title", "completed": "maybe"})])
+
+
+@mark.parametrize(
+    "line",
+    [
+        '[1, 2]',
+        '"Title"',
+        '{"title": "Title", "completed": 1}',
+        '{"title": "Title", "completed": "maybe"}',
+        '{"title": 5}',
+        '{"title": "Title", "due": 20240101}',
+        '{"title": "Title", "priority": 0}',
+        '{"title": "Title", "priority": -2}',
+        '{"title": "Title", "priority": true}',
+        '{"title": "Title", "priority": 1.5}',
+        '{"title": "Title", "priority": "0"}',
+        '{"title": "Title"',
+    ]
+)
+def test__import_from__rejects_bad_line_with_its_number__failure(
+        tmp_path: Path, line: str
+    ) -> NoReturn:
+
+    path: Path = tmp_path / "todo.jsonl"
+    path.write_text(f'{{"title": "Fine"}}\n\n{line}\n', encoding="utf-8")
+
+    with raises(ValueError, match="^Line 3: "):
+        import_from(todo_list=PVector(), path=str(path))
+
+
+def test__import_from__rejects_bad_csv_row_with_its_number__failure(tmp_path: Path) -> NoReturn:
+
+    path: Path = tmp_path / "todo.csv"
+    path.write_text("title,completed\nFine,false\nNot fine,maybe\n", encoding="utf-8")
+
+    with raises(ValueError, match="^Line 3: "):
+        import_from(todo_list=PVector(), path=str(path))
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__export_items__import_items__through_the_menu__success(
+        mock_stdout: StringIO, tmp_path: Path
+    ) -> NoReturn:
+
+    path: str = str(tmp_path / "todo.csv")
+
+    with patch(target="builtins.input", return_value=path):
+        export_items(todo_list=SAMPLE_LIST)
+        imported: PVector = import_items(todo_list=SAMPLE_LIST)
+
+    expected_result: List[int] = [0, 4, 5, 6]
+    actual_result: List[int] = [item.id for item in imported]
+
+    assert expected_result == actual_result, "Imported items were not added after the others."
+    assert f"Exported 2 items to {path}." in mock_stdout.getvalue(), "Export was not reported."
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__import_items__line_that_is_not_an_object__failure(
+        mock_stdout: StringIO, tmp_path: Path
+    ) -> NoReturn:
+
+    path: Path = tmp_path / "todo.jsonl"
+    path.write_text('{"title": "Fine"}\n[]\n', encoding="utf-8")
+
+    with patch(target="builtins.input", return_value=str(path)):
+        expected_result: bool = False
+        actual_result: bool = import_items(todo_list=SAMPLE_LIST)
+
+    assert expected_result == actual_result, "A bad line did not leave the TODO list alone."
+    assert f"Could not import from {path}: Line 2: " in mock_stdout.getvalue(), \
+        "The bad line was not reported."
+
+
+@patch(target="builtins.input", return_value="/no/such/directory/todo.jsonl")
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__import_items__missing_file__failure(
+        mock_stdout: StringIO, mock_input: MagicMock
+    ) -> NoReturn:
+
+    expected_result: bool = False
+    actual_result: bool = import_items(todo_list=SAMPLE_LIST)
+
+    assert expected_result == actual_result, "A missing file did not leave the TODO list alone."
+    assert "Could not import from" in mock_stdout.getvalue(), "The failure was not reported."
@@ -0,0 +1,215 @@
+"""
+Unit tests for the workspace of named TODO lists.
+
+NOTE: Assertions are always in the format of:
+ - Expected Result
+ - Actual Result
+ - Assertion Message
+
+Licenced under the GNU Affero General Public License V3.0
+https://www.gnu.org/licenses/agpl-3.0.en.html
+
+TO THE GREATEST EXTENT PERMITTED BY LAW, THIS SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR
+ANYONE DISTRIBUTING THE SOFTWARE BE LIABLE FOR ANY DAMAGES OR OTHER LIABILITY, WHETHER IN CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THIS SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from io import StringIO
+
+from pathlib import Path
+
+from typing import NoReturn
+
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from pytest import raises
+
+from src.item import Item
+from src.journal import Journal
+from src.main import _run
+from src.main import switch_list
+from src.operations import apply_operations
+from src.pvector import PVector
+from src.workspace import Journal as WorkspaceJournal
+from src.workspace import Workspace
+from src.workspace import _item_bytes
+from src.workspace import footprint
+from src.workspace import footprint_change
+
+
+def test__Workspace__switching_to_a_loaded_list_reads_nothing__success(tmp_path: Path) -> NoReturn:
+
+    with patch(target="src.workspace.Journal", wraps=WorkspaceJournal) as mock_journal, Workspace(
+        directory=str(tmp_path)
+    ) as workspace:
+        home = workspace.open(name="home", create=True)
+        workspace.keep(
+            todo_list=PVector((Item("Buy milk", "", False, id=0),)),
+            search_index=home.search_index,
+            history=home.history,
+            schedule_index=home.schedule_index
+        )
+        workspace.open(name="work", create=True)
+        session = workspace.open(name="home")
+
+        expected_result: tuple = (2, ("home", "work"), ("Buy milk",))
+        actual_result: tuple = (
+            mock_journal.call_count,
+            workspace.names(),
+            tuple(map(lambda item: item.title, session.todo_list))
+        )
+
+    assert expected_result == actual_result, "Only opening a list for the first time reads it."
+
+
+def test__Workspace__least_recently_used_list_is_dropped_over_budget__success(
+        tmp_path: Path
+    ) -> NoReturn:
+
+    with Workspace(directory=str(tmp_path), budget=1) as workspace:
+        home = workspace.open(name="home", create=True)
+        todo_list: PVector[Item] = PVector((Item("Buy milk", "", False, id=0),))
+
+        home.journal.record(todo_list=todo_list, operations=(("append", "Buy milk", "", False, 0),))
+        workspace.keep(
+            todo_list=todo_list,
+            search_index=home.search_index,
+            history=home.history,
+            schedule_index=home.schedule_index
+        )
+        workspace.open(name="work", create=True)
+
+        expected_result: tuple = (False, True, ("Buy milk",))
+        actual_result: tuple = (
+            workspace.is_loaded("home"),
+            workspace.is_loaded("work"),
+            tuple(map(lambda item: item.title, workspace.open(name="home").todo_list))
+        )
+
+    assert expected_result == actual_result, "A dropped list is read from disk again when needed."
+
+
+def test__footprint_change__matches_measuring_both_versions__success() -> NoReturn:
+
+    before: PVector[Item] = PVector(map(
+        lambda number: Item(f"Title {number}", "Description", False, id=number), range(100)
+    ))
+    after: PVector[Item] = apply_operations(todo_list=before, operations=[
+        ("remove", 3), ("edit", 50, "A much longer title than before", ""), ("add", "New", "Item")
+    ])
+
+    expected_result: int = footprint(after) - footprint(before)
+    actual_result: int = footprint_change(before=before, after=after)
+
+    assert expected_result == actual_result, "Footprint change was not as expected."
+
+
+def test__Workspace__keep_measures_only_what_changed__success(tmp_path: Path) -> NoReturn:
+
+    with Workspace(directory=str(tmp_path)) as workspace:
+        home = workspace.open(name="home", create=True)
+        todo_list: PVector[Item] = PVector(map(
+            lambda number: Item(f"Title {number}", "", False, id=number), range(10000)
+        ))
+        workspace.keep(
+            todo_list=todo_list,
+            search_index=home.search_index,
+            history=home.history,
+            schedule_index=home.schedule_index
+        )
+        used: int = workspace.memory_used()
+
+        with patch(target="src.workspace._item_bytes", wraps=_item_bytes) as mock_item_bytes:
+            workspace.keep(
+                todo_list=todo_list.set(5000, Item("A much longer title", "", True, id=5000)),
+                search_index=home.search_index,
+                history=home.history,
+                schedule_index=home.schedule_index
+            )
+
+        assert 2 == mock_item_bytes.call_count, "Items that didn't change were measured."
+        assert used < workspace.memory_used(), "The longer title was not counted."
+
+
+def test__Workspace__memory_used_counts_histories_and_indexes__success(tmp_path: Path) -> NoReturn:
+
+    with Workspace(directory=str(tmp_path)) as workspace:
+        home = workspace.open(name="home", create=True)
+        before: int = workspace.memory_used()
+        todo_list: PVector[Item] = PVector(map(
+            lambda number: Item(f"Title {number}", "", False, id=number), range(100)
+        ))
+
+        home.history.record(before=home.todo_list, after=todo_list)
+        home.search_index.search(query="title")
+        home.search_index.apply(records=map(
+            lambda item: ("append", item.title, item.description, item.completed, item.id),
+            todo_list
+        ))
+
+        expected_result: int = (
+            before + home.history.memory_used() + home.search_index.memory_used()
+        )
+        actual_result: int = workspace.memory_used()
+
+    assert 0 < home.search_index.memory_used(), "The search index was not measured."
+    assert expected_result == actual_result, "Histories and indexes were not counted."
+
+
+def test__Workspace__unknown_or_invalid_name__failure(tmp_path: Path) -> NoReturn:
+
+    with Workspace(directory=str(tmp_path)) as workspace:
+        with raises(ValueError):
+            workspace.open(name="missing")
+
+        with raises(ValueError):
+            workspace.open(name="../escape", create=True)
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+@patch(target="builtins.input", side_effect=[
+    "0", "Buy milk", "", "", "", "8", "work", "0", "Write report", "", "", "", "17", "todo", "7",
+    "3"
+])
+def test___run__workspace_keeps_each_list_in_its_own_file__success(
+        _: MagicMock, mock_stdout: StringIO, tmp_path: Path
+    ) -> NoReturn:
+
+    _run(arguments=["--workspace", str(tmp_path)])
+
+    expected_result: tuple = (("Buy milk",), ("Write report",), True)
+    actual_result: tuple = (
+        tuple(map(lambda item: item.title, Journal(path=str(tmp_path / "todo.json")).load())),
+        tuple(map(lambda item: item.title, Journal(path=str(tmp_path / "work.json")).load())),
+        "* todo\n+ work\n" in mock_stdout.getvalue()
+    )
+
+    assert expected_result == actual_result, "Each list's changes should go to its own file."
+
+
+@patch(target="sys.stderr", new_callable=StringIO)
+def test___run__workspace_with_file__failure(_: StringIO, tmp_path: Path) -> NoReturn:
+
+    with raises(SystemExit):
+        _run(arguments=["--workspace", str(tmp_path), "--file", str(tmp_path / "todo.json")])
+
+
+@patch(target="sys.stdout", new_callable=StringIO)
+def test__switch_list__without_a_workspace__failure(mock_stdout: StringIO) -> NoReturn:
+
+    expected_result: tuple = (False, True)
+    actual_result: tuple = (
+        switch_list(
+            todo_list=PVector(),
+            search_index=MagicMock(),
+            history=MagicMock(),
+            schedule_index=MagicMock()
+        ),
+        "--workspace DIR" in mock_stdout.getvalue()
+    )
+
+    assert expected_result == actual_result, "The list commands need a workspace."